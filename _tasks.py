@@ -3,6 +3,7 @@ import subprocess
 import sys
 from collections.abc import Sequence
 from pathlib import Path
+from types import ModuleType
 
 HERE = Path(__file__).parent
 
@@ -44,3 +45,97 @@ def update_version(version: Sequence[str]) -> None:
 def task_update_version() -> None:
     version_arr = sys.argv[1:] if len(sys.argv) > 1 else []
     update_version(version_arr)
+
+
+def _format_constant(name: str, value: object) -> str:
+    return f"{name} = {value!r}\n\n"
+
+
+def update_data_module(file_path: Path) -> None:
+    from matplotlib.colors import to_hex, to_rgb
+
+    from fau_colors import v2019, v2021, v2024
+
+    modules = {"2019": v2019, "2021": v2021, "2024": v2024}
+
+    def _colors_by_version(modules: dict[str, ModuleType], attr: str) -> dict[str, dict[str, str]]:
+        return {version: dict(getattr(m, attr)._asdict()) for version, m in modules.items() if hasattr(m, attr)}
+
+    cmaps = {version: m._define_cmaps()._asdict() for version, m in modules.items()}
+    palettes_rgb = {
+        version: {
+            name: tuple(tuple(float(c) for c in to_rgb(color)) for color in cmap) for name, cmap in palettes.items()
+        }
+        for version, palettes in cmaps.items()
+    }
+    palettes_hex = {
+        version: {name: tuple(to_hex(rgb).upper() for rgb in cmap) for name, cmap in palettes.items()}
+        for version, palettes in palettes_rgb.items()
+    }
+    palettes_rgb_uint8 = {
+        version: {name: tuple(tuple(round(c * 255) for c in rgb) for rgb in cmap) for name, cmap in palettes.items()}
+        for version, palettes in palettes_rgb.items()
+    }
+    palette_names = {
+        version: {name: tuple(cmap[0]) for name, cmap in m._define_cmaps_with_names()._asdict().items()}
+        for version, m in modules.items()
+        if hasattr(m, "_define_cmaps_with_names")
+    }
+    hex_palettes = {
+        version: tuple(name for name, cmap in palettes.items() if all(isinstance(c, str) for c in cmap))
+        for version, palettes in cmaps.items()
+    }
+    colors_all = _colors_by_version(modules, "colors_all")
+    named_hex = sorted(
+        {
+            color.upper()
+            for colors in (
+                _colors_by_version(modules, "colors"),
+                colors_all,
+                _colors_by_version(modules, "colors_light"),
+            )
+            for version_colors in colors.values()
+            for color in version_colors.values()
+        }
+        | {color.upper() for ramp in v2024.colors_with_light_levels.values() for color in ramp}
+    )
+
+    content = (
+        '"""Precomputed color values of all FAU color versions.\n\n'
+        "This module only contains plain Python constants and can be imported without numpy, matplotlib, or seaborn.\n"
+        "It is generated from `fau_colors.v2019`, `fau_colors.v2021`, and `fau_colors.v2024` by running\n"
+        "`poe update_data`. Do not edit it manually.\n"
+        '"""\n\n'
+        + _format_constant("VERSIONS", tuple(modules))
+        + _format_constant("COLORS", _colors_by_version(modules, "colors"))
+        + _format_constant("COLORS_DARK", _colors_by_version(modules, "colors_dark"))
+        + _format_constant("COLORS_LIGHT", _colors_by_version(modules, "colors_light"))
+        + _format_constant("COLORS_ALL", colors_all)
+        + _format_constant(
+            "COLORS_WITH_LIGHT_LEVELS", {"2024": {k: tuple(v) for k, v in v2024.colors_with_light_levels.items()}}
+        )
+        + _format_constant("PALETTE_NAMES", palette_names)
+        + _format_constant("PALETTES_HEX", palettes_hex)
+        + _format_constant("PALETTES_RGB", palettes_rgb)
+        + _format_constant("PALETTES_RGB_UINT8", palettes_rgb_uint8)
+        + "# Palettes whose colors in `cmaps` are hex strings (the colors of all others are float RGB tuples)\n"
+        + _format_constant("HEX_PALETTES", hex_palettes)
+        + "# Float and uint8 RGB values of all named hex colors (keys are upper case)\n"
+        + _format_constant("RGB", {c: tuple(float(v) for v in to_rgb(c)) for c in named_hex})
+        + _format_constant("RGB_UINT8", {c: tuple(round(v * 255) for v in to_rgb(c)) for c in named_hex})
+    )
+    file_path.write_text(content)
+    subprocess.run(["ruff", "format", str(file_path)], shell=False, check=True)
+
+
+def task_update_data() -> None:
+    update_data_module(HERE.joinpath("src/fau_colors/data.py"))
+
+
+def task_update_luts() -> None:
+    import numpy as np
+
+    from fau_colors._continuous import LUT_FILE, build_continuous_luts
+
+    LUT_FILE.parent.mkdir(exist_ok=True)
+    np.save(LUT_FILE, build_continuous_luts())
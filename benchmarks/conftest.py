@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pytest
+from matplotlib import font_manager
+
+from fau_colors import fonts
+
+VERSION_MODULES = ["fau_colors.v2019", "fau_colors.v2021", "fau_colors.v2024"]
+
+
+def unload_fau_colors() -> None:
+    for name in [name for name in sys.modules if name == "fau_colors" or name.startswith("fau_colors.")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def synthetic_font_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a font directory with many unrelated font files and the FAU Sans files buried in it."""
+    root = tmp_path / "fonts"
+    for i in range(50):
+        family = root / "truetype" / f"family_{i}"
+        family.mkdir(parents=True)
+        for j in range(40):
+            (family / f"Font{i}-{j}.ttf").write_bytes(b"")
+    (root / "truetype" / "fau").mkdir()
+    for style in ["Regular", "Bold", "Italic", "BoldItalic"]:
+        (root / "truetype" / "fau" / f"FAUSansOffice-{style}.ttf").write_bytes(b"")
+
+    monkeypatch.setattr(fonts, "_system_font_dirs", lambda: [root])
+    monkeypatch.setattr(fonts, "_cache_file", lambda: tmp_path / "cache" / "fonts.json")
+    monkeypatch.delenv(fonts.FONT_PATHS_ENV_VAR, raising=False)
+    # Only the discovery is benchmarked. The font files are empty and can not be parsed by matplotlib.
+    monkeypatch.setattr(font_manager.fontManager, "addfont", lambda _: None)
+    monkeypatch.setattr(font_manager.fontManager, "get_font_names", lambda: {"FAUSans Office"})
+    return root
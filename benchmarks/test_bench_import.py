@@ -0,0 +1,35 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.conftest import VERSION_MODULES, unload_fau_colors
+
+
+def _run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.benchmark(group="import-cold")
+@pytest.mark.parametrize("module", ["fau_colors", *VERSION_MODULES])
+def test_cold_import(benchmark, module: str) -> None:  # noqa: ANN001
+    benchmark.pedantic(_run_python, args=(f"import {module}",), rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="import-cold")
+@pytest.mark.parametrize("module", VERSION_MODULES)
+def test_cold_import_with_cmaps(benchmark, module: str) -> None:  # noqa: ANN001
+    benchmark.pedantic(_run_python, args=(f"import {module}; {module}.cmaps",), rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="import-warm")
+@pytest.mark.parametrize("module", ["fau_colors", *VERSION_MODULES])
+def test_warm_import_with_cmaps(benchmark, module: str) -> None:  # noqa: ANN001
+    """Import the module again while matplotlib and seaborn are already loaded."""
+
+    def _import() -> None:
+        importlib.import_module(module).cmaps  # noqa: B018
+
+    importlib.import_module("seaborn")
+    benchmark.pedantic(_import, setup=unload_fau_colors, rounds=20, iterations=1)
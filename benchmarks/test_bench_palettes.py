@@ -0,0 +1,97 @@
+import importlib
+from contextlib import suppress
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+
+from benchmarks.conftest import VERSION_MODULES
+from fau_colors import _blend, export_as_gpl, export_as_tex, fonts, map_values
+from fau_colors._utils import custom_blend_colormap
+
+
+@pytest.mark.benchmark(group="register")
+@pytest.mark.parametrize("module", VERSION_MODULES)
+def test_register_unregister_round_trip(benchmark, module: str) -> None:  # noqa: ANN001
+    version = importlib.import_module(module)
+    with suppress(ValueError):
+        version.unregister_cmaps()
+
+    def _round_trip() -> None:
+        version.register_cmaps()
+        version.unregister_cmaps()
+
+    benchmark(_round_trip)
+
+
+@pytest.mark.benchmark(group="register")
+@pytest.mark.parametrize("module", VERSION_MODULES)
+def test_register_already_registered(benchmark, module: str) -> None:  # noqa: ANN001
+    version = importlib.import_module(module)
+    version.register_cmaps()
+    try:
+        benchmark(version.register_cmaps)
+    finally:
+        version.unregister_cmaps()
+
+
+@pytest.mark.benchmark(group="export")
+def test_export_all_versions(benchmark, tmp_path: Path) -> None:  # noqa: ANN001
+    modules = [importlib.import_module(module) for module in VERSION_MODULES]
+
+    def _export() -> None:
+        for module in modules:
+            export_as_gpl(module.cmaps, file_name=f"{module.__name__}.gpl", folder_path=tmp_path)
+            if hasattr(module, "cmaps_with_names"):
+                export_as_tex(module.cmaps_with_names, file_name=f"{module.__name__}.tex", folder_path=tmp_path)
+
+    benchmark(_export)
+
+
+@pytest.mark.benchmark(group="blend")
+@pytest.mark.parametrize("cached", [False, True])
+def test_custom_blend_colormap(benchmark, cached: bool) -> None:  # noqa: ANN001
+    def _blend_all() -> None:
+        for color in ["#04316A", "#8C9FB1", "#FDB735", "#18B4F1", "#7BB725", "#C50F3C"]:
+            custom_blend_colormap(["#FFFFFF", color], [1, 0.625, 0.375, 0.25, 0.125])
+
+    setup = None if cached else _blend._blend_cached.cache_clear
+    benchmark.pedantic(_blend_all, setup=setup, rounds=50, iterations=1)
+
+
+@pytest.mark.benchmark(group="fonts")
+@pytest.mark.usefixtures("synthetic_font_tree")
+def test_font_discovery_full_scan(benchmark) -> None:  # noqa: ANN001
+    benchmark(fonts._discover_font_paths, use_cache=False)
+
+
+@pytest.mark.benchmark(group="fonts")
+@pytest.mark.usefixtures("synthetic_font_tree")
+def test_font_discovery_disk_cache(benchmark) -> None:  # noqa: ANN001
+    fonts._discover_font_paths()
+    benchmark(fonts._discover_font_paths)
+
+
+@pytest.mark.benchmark(group="fonts")
+@pytest.mark.usefixtures("synthetic_font_tree")
+def test_register_fausans_font(benchmark, monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: ANN001
+    monkeypatch.setattr(matplotlib, "rcParams", matplotlib.RcParams(matplotlib.rcParams))
+
+    def _reset() -> None:
+        monkeypatch.setattr(fonts, "_REGISTERED_FONT_PATHS", set())
+
+    benchmark.pedantic(fonts.register_fausans_font, setup=_reset, rounds=20, iterations=1)
+
+
+@pytest.mark.benchmark(group="mapping")
+@pytest.mark.parametrize("implementation", ["fau_colors", "matplotlib"])
+def test_map_values(benchmark, implementation: str) -> None:  # noqa: ANN001
+    values = np.random.default_rng(0).random((1000, 1000))
+    if implementation == "fau_colors":
+        out = np.empty((*values.shape, 4), dtype=np.uint8)
+        benchmark(map_values, values, "med", vmin=0, vmax=1, out=out)
+    else:
+        cmap = matplotlib.colors.ListedColormap(importlib.import_module("fau_colors.v2024").cmaps.med)
+        norm = matplotlib.colors.Normalize(0, 1)
+        benchmark(lambda: cmap(norm(values), bytes=True))
@@ -1,26 +1,131 @@
 __version__ = "1.10.2"
 
-from fau_colors._utils import export_as_gpl, export_as_tex
-from fau_colors.fonts import register_fausans_font
-from fau_colors.v2024 import (
-    cmaps,
-    cmaps_with_names,
-    colors,
-    colors_all,
-    colors_dark,
-    register_cmaps,
-    unregister_cmaps,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from fau_colors import diagnostics
+from fau_colors.v2024 import colors, colors_all, colors_dark
+
+if TYPE_CHECKING:
+    from fau_colors._categorical import categorical
+    from fau_colors._continuous import continuous_lut
+    from fau_colors._diverging import diverging
+    from fau_colors._palette import Palette, get_palettes
+    from fau_colors._style import style, style_params, write_style
+    from fau_colors._utils import (
+        export_as_gpl,
+        export_as_tex,
+        namespaced_cmap_name,
+        register_all,
+        registered_cmaps,
+        unregister_all,
+    )
+    from fau_colors.fonts import register_fausans_font
+    from fau_colors.mapping import map_values
+    from fau_colors.quantization import quantize
+    from fau_colors.registry import get_registry
+    from fau_colors.v2024 import (
+        cmaps,
+        cmaps_continuous,
+        cmaps_with_names,
+        register_cmaps,
+        unregister_cmaps,
+    )
+    from fau_colors.workers import PaletteHandle, palette_handle, worker_init
 
 __all__ = [
+    "Palette",
+    "PaletteHandle",
+    "categorical",
     "cmaps",
+    "cmaps_continuous",
     "cmaps_with_names",
     "colors",
     "colors_all",
     "colors_dark",
+    "continuous_lut",
+    "diverging",
     "export_as_gpl",
     "export_as_tex",
+    "get_palettes",
+    "get_registry",
+    "map_values",
+    "namespaced_cmap_name",
+    "palette_handle",
+    "quantize",
+    "register_all",
     "register_cmaps",
     "register_fausans_font",
+    "registered_cmaps",
+    "style",
+    "style_params",
+    "unregister_all",
     "unregister_cmaps",
+    "worker_init",
+    "write_style",
 ]
+
+# Everything that (transitively) requires matplotlib or seaborn is only imported on first access (PEP 562).
+# This keeps `import fau_colors; fau_colors.colors.fau` free of the plotting stack.
+_LAZY_SUBMODULES = (
+    "accessibility",
+    "audit",
+    "conversions",
+    "data",
+    "export",
+    "fonts",
+    "mapping",
+    "migrate",
+    "preview",
+    "quantization",
+    "registry",
+    "v2019",
+    "v2021",
+    "v2024",
+    "workers",
+)
+_LAZY_ATTRIBUTES = {
+    "cmaps": "fau_colors.v2024",
+    "cmaps_continuous": "fau_colors.v2024",
+    "cmaps_with_names": "fau_colors.v2024",
+    "register_cmaps": "fau_colors.v2024",
+    "unregister_cmaps": "fau_colors.v2024",
+    "categorical": "fau_colors._categorical",
+    "continuous_lut": "fau_colors._continuous",
+    "diverging": "fau_colors._diverging",
+    "Palette": "fau_colors._palette",
+    "get_palettes": "fau_colors._palette",
+    "style": "fau_colors._style",
+    "style_params": "fau_colors._style",
+    "write_style": "fau_colors._style",
+    "export_as_gpl": "fau_colors._utils",
+    "export_as_tex": "fau_colors._utils",
+    "registered_cmaps": "fau_colors._utils",
+    "namespaced_cmap_name": "fau_colors._utils",
+    "register_all": "fau_colors._utils",
+    "unregister_all": "fau_colors._utils",
+    "register_fausans_font": "fau_colors.fonts",
+    "map_values": "fau_colors.mapping",
+    "quantize": "fau_colors.quantization",
+    "get_registry": "fau_colors.registry",
+    "PaletteHandle": "fau_colors.workers",
+    "palette_handle": "fau_colors.workers",
+    "worker_init": "fau_colors.workers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        with diagnostics.phase(f"import {__name__}.{name}"):
+            return importlib.import_module(f"{__name__}.{name}")
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with diagnostics.phase(f"import {_LAZY_ATTRIBUTES[name]}"):
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES})
@@ -0,0 +1,124 @@
+"""Vectorized blending of colors without creating matplotlib colormap objects."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from fau_colors._colorspace import (
+    linear_to_oklab,
+    linear_to_srgb,
+    oklab_to_linear,
+    srgb_to_linear,
+    to_rgb_array,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fau_colors._colorspace import Color
+
+BLEND_SPACES = ("srgb", "linear", "oklab")
+BlendSpace = Literal["srgb", "linear", "oklab"]
+
+_TO_SPACE = {
+    "srgb": lambda rgb: rgb,
+    "linear": srgb_to_linear,
+    "oklab": lambda rgb: linear_to_oklab(srgb_to_linear(rgb)),
+}
+_FROM_SPACE = {
+    "srgb": lambda rgb: rgb,
+    "linear": linear_to_srgb,
+    "oklab": lambda lab: linear_to_srgb(oklab_to_linear(lab)),
+}
+
+
+def _as_positions(positions: Sequence[float] | int, lut_size: int | None) -> np.ndarray:
+    if isinstance(positions, (int, np.integer)):
+        positions = np.linspace(0, 1, int(positions))
+    positions = np.clip(np.asarray(positions, dtype=np.float64), 0, 1)
+    if lut_size is not None:
+        # Emulate sampling a `LinearSegmentedColormap` with `N=lut_size` entries, as matplotlib does not interpolate
+        # between its lookup table entries
+        indices = np.minimum((positions * lut_size).astype(int), lut_size - 1)
+        positions = indices / (lut_size - 1)
+    return positions
+
+
+@lru_cache(maxsize=256)
+def _blend_cached(
+    stops: tuple[tuple[tuple[float, ...], ...], ...],
+    positions: tuple[float, ...],
+    space: str,
+) -> np.ndarray:
+    stops_array = _TO_SPACE[space](np.array(stops, dtype=np.float64))  # (n_ramps, n_stops, 3)
+    t = np.array(positions, dtype=np.float64)
+    n_segments = stops_array.shape[1] - 1
+
+    scaled = t * n_segments
+    segment = np.minimum(scaled.astype(int), n_segments - 1)
+    local = (scaled - segment)[None, :, None]
+    lower = stops_array[:, segment]
+    upper = stops_array[:, segment + 1]
+    blended = local * (upper - lower) + lower
+    # The last stop is returned exactly (no rounding errors from the interpolation)
+    blended[:, t == 1] = stops_array[:, -1:]
+
+    result = np.clip(_FROM_SPACE[space](blended), 0, 1)
+    result.setflags(write=False)
+    return result
+
+
+def blend_colors(
+    stops: Sequence[Sequence[Color]],
+    positions: Sequence[float] | int,
+    space: BlendSpace = "srgb",
+    lut_size: int | None = None,
+) -> np.ndarray:
+    """Sample multiple color gradients at once.
+
+    Parameters
+    ----------
+    stops
+        One sequence of colors (hex strings or RGB tuples) per gradient.
+        All gradients need to have the same number of (evenly spaced) color stops.
+    positions
+        The positions between 0 and 1 at which all gradients are sampled, or the number of evenly spaced samples.
+    space
+        The color space in which the colors are interpolated.
+    lut_size
+        If provided, the positions are snapped to a lookup table with the given number of entries.
+        With `lut_size=256` the results match sampling a `matplotlib.colors.LinearSegmentedColormap` (bit-identical
+        for gradients with two stops).
+
+    Returns
+    -------
+    rgb
+        Read-only float array with shape `(len(stops), len(positions), 3)`.
+        Results are memoized per (stops, positions, space).
+
+    """
+    if space not in BLEND_SPACES:
+        raise ValueError(f"Unknown color space '{space}'. Available spaces are: {', '.join(BLEND_SPACES)}.")
+    stops = tuple(tuple(map(tuple, to_rgb_array(ramp).tolist())) for ramp in stops)
+    if not stops or len({len(ramp) for ramp in stops}) != 1 or len(stops[0]) < 2:
+        raise ValueError("All gradients need the same number of at least two color stops.")
+    positions = tuple(_as_positions(positions, lut_size).tolist())
+    return _blend_cached(stops, positions, space)
+
+
+def lightness_ramps(
+    colors: Sequence[Color],
+    levels: Sequence[float] | int,
+    background: Color = "#FFFFFF",
+    space: BlendSpace = "srgb",
+    lut_size: int | None = None,
+) -> np.ndarray:
+    """Blend each color with the background at the given levels (0 -> background, 1 -> color).
+
+    Returns a read-only array with shape `(len(colors), len(levels), 3)`.
+    See `blend_colors` for details on the parameters.
+    """
+    return blend_colors([[background, color] for color in colors], levels, space=space, lut_size=lut_size)
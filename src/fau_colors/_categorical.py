@@ -0,0 +1,149 @@
+"""Categorical palettes with an arbitrary number of colors."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from fau_colors._colorspace import linear_to_oklab, srgb_to_linear
+from fau_colors._versions import DEFAULT_VERSION, normalize_version, resolve_palette_name
+from fau_colors.data import PALETTES_HEX, PALETTES_RGB
+
+__all__ = ["categorical"]
+
+
+def _candidates(version: str, base: str) -> tuple[dict[str, tuple], dict[str, tuple]]:
+    """Get the base colors and the lighter levels of all of them (hex -> float RGB, without duplicates)."""
+    from fau_colors.registry import get_registry
+
+    registry = get_registry()
+    base_colors = {}
+    for hex_color, rgb in zip(PALETTES_HEX[version][base], PALETTES_RGB[version][base]):
+        base_colors.setdefault(hex_color.upper(), rgb)
+    variants = {}
+    for hex_color in base_colors:
+        record = next((r for r in registry.by_hex(hex_color) if r.version == version and r.level == 1.0), None)
+        if record is None:
+            continue
+        for variant in registry.select(version, record.faculty, record.variant):
+            if variant.level != 1.0 and variant.hex not in base_colors:
+                variants.setdefault(variant.hex, variant.rgb)
+    return base_colors, variants
+
+
+def _farthest_points(coords: np.ndarray, n: int, min_dist: np.ndarray | None = None) -> list[int]:
+    """Greedily select the points with the largest distance to all previously selected points.
+
+    Without `min_dist` (the distances of all points to already fixed points), the first point is selected first.
+    """
+    selected = []
+    if min_dist is None:
+        selected.append(0)
+        min_dist = np.linalg.norm(coords - coords[0], axis=1)
+    else:
+        min_dist = min_dist.copy()
+    while len(selected) < n:
+        i = int(np.argmax(min_dist))
+        selected.append(i)
+        np.minimum(min_dist, np.linalg.norm(coords - coords[i], axis=1), out=min_dist)
+    return selected
+
+
+# More mixing levels than 8 bit values per channel do not add distinct colors
+_MAX_MIXING_LEVELS = 1024
+
+
+def _mixed_variants(base_coords: np.ndarray, n_levels: int, exclude: set[str]) -> tuple[list[str], np.ndarray]:
+    """Mix all base colors with white and black in OKLab (without duplicates and the colors in `exclude`)."""
+    from fau_colors.conversions import convert
+
+    # At most 75 % white and 50 % black, so that the hue of the (often already dark) base colors remains visible
+    steps = np.linspace(0, 1, n_levels + 1)[1:, None, None]
+    white = base_coords + (np.array([1.0, 0, 0]) - base_coords) * 0.75 * steps
+    mixed = np.concatenate([white, base_coords * (1 - 0.5 * steps)])
+    hex_colors = [c for c in dict.fromkeys(convert(mixed.reshape(-1, 3), "hex", "oklab").tolist()) if c not in exclude]
+    # The coordinates of the (gamut clipped) colors as they are returned
+    return hex_colors, convert(np.array(hex_colors, dtype=np.str_), "oklab", "hex")
+
+
+def _extend_greedily(
+    colors: list[str], coords: np.ndarray, candidates: list[str], candidate_coords: np.ndarray, n: int
+) -> np.ndarray:
+    """Extend `colors` (in place) up to `n` colors with the candidates farthest from all selected colors."""
+    n_new = min(n - len(colors), len(candidates))
+    if n_new <= 0:
+        return coords
+    min_dist = np.min(np.linalg.norm(candidate_coords[:, None] - coords[None], axis=-1), axis=1)
+    selected = _farthest_points(candidate_coords, n_new, min_dist)
+    colors.extend(candidates[i] for i in selected)
+    return np.concatenate([coords, candidate_coords[selected]])
+
+
+@lru_cache(maxsize=256)
+def _categorical(n: int, version: str, base: str) -> tuple[str, ...]:
+    base_colors, variants = _candidates(version, base)
+    base_hex = list(base_colors)
+    base_coords = linear_to_oklab(srgb_to_linear(np.array(list(base_colors.values()))))
+    if n <= len(base_colors):
+        return tuple(base_hex[i] for i in sorted(_farthest_points(base_coords, n)))
+
+    # All base colors are used, the next colors are the lighter levels farthest from all selected colors (palettes
+    # like the lightness ramps or "black" have no further lighter levels)
+    colors = list(base_hex)
+    coords = base_coords
+    if variants:
+        variant_coords = linear_to_oklab(srgb_to_linear(np.array(list(variants.values()))))
+        coords = _extend_greedily(colors, coords, list(variants), variant_coords, n)
+    if n <= len(colors):
+        return tuple(colors)
+
+    # Even more colors are mixed from the base colors and white or black, with enough mixing levels to pick the
+    # remaining colors from at least twice as many candidates (until more levels do not add distinct 8 bit colors)
+    n_levels = min(max(4, -(-(n - len(colors)) // len(base_colors))), _MAX_MIXING_LEVELS)
+    mixed_hex, mixed_coords = _mixed_variants(base_coords, n_levels, set(colors))
+    while len(mixed_hex) < n - len(colors) and n_levels < _MAX_MIXING_LEVELS:
+        n_levels *= 2
+        mixed_hex, mixed_coords = _mixed_variants(base_coords, n_levels, set(colors))
+    _extend_greedily(colors, coords, mixed_hex, mixed_coords, n)
+    # Only if there are not enough distinct 8 bit colors, the colors repeat
+    return tuple(colors[i % len(colors)] for i in range(n))
+
+
+def categorical(n: int, version: str | int = DEFAULT_VERSION, base: str = "faculties_all") -> tuple[str, ...]:
+    """Get `n` distinguishable colors based on a palette and the lighter levels of its colors.
+
+    For `n` up to the size of the base palette, the colors are a subset of the base palette (in its order).
+    For larger `n`, all base colors are followed by the lighter levels of the base colors (see
+    `colors_with_light_levels`), which are greedily selected to maximize the smallest OKLab distance to all
+    previously selected colors.
+    If `n` is larger than the number of base colors and their lighter levels, the remaining colors are selected the
+    same way from mixtures of the base colors with white and black (lighter and darker variants of the base colors).
+    Only if `n` exceeds the number of distinct 8 bit colors that can be mixed this way, the colors repeat (for more
+    than about 250 colors based on "black" or about 3000 colors based on "faculties").
+    Results are cached, so repeated calls are cheap.
+
+    Parameters
+    ----------
+    n
+        The number of colors.
+    version
+        The color version.
+    base
+        The palette (as in `cmaps`) the colors are based on.
+
+    Returns
+    -------
+    colors
+        The hex colors.
+
+    Raises
+    ------
+    ValueError
+        If `n` is smaller than 1.
+
+    """
+    if n < 1:
+        raise ValueError("`n` must be at least 1.")
+    version = normalize_version(version)
+    return _categorical(n, version, resolve_palette_name(base, version))
@@ -0,0 +1,109 @@
+"""Vectorized color space conversions that only depend on numpy.
+
+All functions work on arrays with the color channels in the last dimension.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+
+Color = Union[str, "Sequence[float]"]
+
+# Matrices from https://bottosson.github.io/posts/oklab/
+_LINEAR_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR = np.linalg.inv(_LINEAR_TO_LMS)
+
+# Linear sRGB to CIE XYZ and the reference white (both D65)
+_LINEAR_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_XYZ_TO_LINEAR = np.linalg.inv(_LINEAR_TO_XYZ)
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+def hex_to_rgb(color: str) -> tuple[float, float, float]:
+    """Convert a hex color ("#RRGGBB" or "#RGB") to float RGB values (same as `matplotlib.colors.to_rgb`)."""
+    value = color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Invalid hex color '{color}'.")
+    return tuple(int(value[i : i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def to_rgb_array(colors: Sequence[Color] | ArrayLike) -> np.ndarray:
+    """Convert a sequence of hex strings or RGB tuples to a float64 array of shape (n, 3)."""
+    if isinstance(colors, np.ndarray):
+        return np.asarray(colors[..., :3], dtype=np.float64)
+    return np.array([hex_to_rgb(c) if isinstance(c, str) else tuple(c)[:3] for c in colors], dtype=np.float64)
+
+
+def srgb_to_linear(rgb: ArrayLike) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(rgb: ArrayLike) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * np.abs(rgb) ** (1 / 2.4) * np.sign(rgb) - 0.055)
+
+
+def linear_to_oklab(rgb: ArrayLike) -> np.ndarray:
+    lms = np.asarray(rgb, dtype=np.float64) @ _LINEAR_TO_LMS.T
+    return np.cbrt(lms) @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_linear(lab: ArrayLike) -> np.ndarray:
+    lms = np.asarray(lab, dtype=np.float64) @ _OKLAB_TO_LMS.T
+    return (lms**3) @ _LMS_TO_LINEAR.T
+
+
+def linear_to_lab(rgb: ArrayLike) -> np.ndarray:
+    """Convert linear sRGB to CIELAB (D65)."""
+    xyz = (np.asarray(rgb, dtype=np.float64) @ _LINEAR_TO_XYZ.T) / _WHITE_D65
+    delta = 6 / 29
+    f = np.where(xyz > delta**3, np.cbrt(xyz), xyz / (3 * delta**2) + 4 / 29)
+    return np.stack(
+        [116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])],
+        axis=-1,
+    )
+
+
+def lab_to_linear(lab: ArrayLike) -> np.ndarray:
+    """Convert CIELAB (D65) to linear sRGB."""
+    lab = np.asarray(lab, dtype=np.float64)
+    fy = (lab[..., 0] + 16) / 116
+    f = np.stack([fy + lab[..., 1] / 500, fy, fy - lab[..., 2] / 200], axis=-1)
+    delta = 6 / 29
+    xyz = np.where(f > delta, f**3, 3 * delta**2 * (f - 4 / 29)) * _WHITE_D65
+    return xyz @ _XYZ_TO_LINEAR.T
+
+
+def relative_luminance(rgb: ArrayLike) -> np.ndarray:
+    """Relative luminance of sRGB colors as defined by WCAG 2."""
+    return srgb_to_linear(rgb) @ _LINEAR_TO_XYZ[1]
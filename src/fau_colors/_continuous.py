@@ -0,0 +1,86 @@
+"""Precomputed continuous (256 entry) versions of the 2024 lightness ramps.
+
+The lookup tables are stored in a single `.npy` file that is memory mapped on first use.
+Processes on the same host that use the tables therefore share the same pages instead of each interpolating and
+holding its own copy.
+The file is generated by `poe update_luts`. Do not edit it manually.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fau_colors._versions import normalize_color_name
+from fau_colors.data import COLORS_WITH_LIGHT_LEVELS
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+CONTINUOUS_SIZE = 256
+# One record per LUT entry with the float32 and the (rounded) uint8 RGB values
+LUT_DTYPE = np.dtype([("rgb", np.float32, (3,)), ("rgb8", np.uint8, (3,))], align=True)
+LUT_FILE = Path(__file__).parent.joinpath("_assets", "v2024_continuous.npy")
+
+# "med-dark" -> "med_dark_cont", in the order of the LUTs in the file
+CONTINUOUS_NAMES = tuple(f"{name.replace('-', '_')}_cont" for name in COLORS_WITH_LIGHT_LEVELS["2024"])
+_CONTINUOUS_INDEX = {name: i for i, name in enumerate(CONTINUOUS_NAMES)}
+
+
+def build_continuous_luts() -> np.ndarray:
+    """Interpolate all lightness ramps (evenly spaced in sRGB, like a `LinearSegmentedColormap`)."""
+    from fau_colors._blend import blend_colors
+
+    rgb = blend_colors(list(COLORS_WITH_LIGHT_LEVELS["2024"].values()), CONTINUOUS_SIZE)
+    luts = np.empty(rgb.shape[:2], dtype=LUT_DTYPE)
+    luts["rgb"] = rgb
+    luts["rgb8"] = np.round(rgb * 255)
+    return luts
+
+
+@cache
+def load_continuous_luts() -> np.ndarray:
+    """Memory map the LUT file (read-only). The result has shape `(len(CONTINUOUS_NAMES), CONTINUOUS_SIZE)`."""
+    luts = np.load(LUT_FILE, mmap_mode="r")
+    if luts.dtype != LUT_DTYPE or luts.shape != (len(CONTINUOUS_NAMES), CONTINUOUS_SIZE):
+        raise RuntimeError(f"The continuous colormap file {LUT_FILE} is outdated. Run `poe update_luts`.")
+    return luts
+
+
+def resolve_continuous_name(name: str) -> str | None:
+    """Get the field name of a continuous colormap ("fau-med-dark-cont" -> "med_dark_cont") or None."""
+    # "fau-dark-cont" is the dark FAU color, but "fau-med-cont" the medicine color
+    for candidate in (name.replace("-", "_"), normalize_color_name(name)):
+        if candidate in _CONTINUOUS_INDEX:
+            return candidate
+    return None
+
+
+def continuous_lut(name: str, dtype: DTypeLike = np.float32) -> np.ndarray:
+    """Get the precomputed 256 entry RGB lookup table of a continuous 2024 colormap.
+
+    The returned array is a read-only view into the shared memory map.
+
+    Parameters
+    ----------
+    name
+        The name of the continuous colormap (e.g. "med_cont", "fau-med-dark-cont").
+    dtype
+        Either `np.float32` (values between 0 and 1) or `np.uint8` (values between 0 and 255).
+
+    Returns
+    -------
+    lut
+        Array with shape `(256, 3)`.
+
+    """
+    field = resolve_continuous_name(name)
+    if field is None:
+        raise ValueError(f"Unknown continuous colormap '{name}'. Available are: {', '.join(CONTINUOUS_NAMES)}.")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.uint8):
+        raise ValueError(f"`dtype` must be float32 or uint8, got {dtype}.")
+    return load_continuous_luts()[_CONTINUOUS_INDEX[field]]["rgb" if dtype == np.float32 else "rgb8"]
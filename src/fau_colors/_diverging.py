@@ -0,0 +1,118 @@
+"""Cached diverging colormaps between two FAU colors."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from fau_colors._blend import BLEND_SPACES, blend_colors
+from fau_colors._versions import DEFAULT_VERSION, normalize_color_name, normalize_version
+from fau_colors.data import COLORS, COLORS_ALL
+
+if TYPE_CHECKING:
+    from matplotlib.colors import ListedColormap
+
+    from fau_colors._blend import BlendSpace
+    from fau_colors._colorspace import Color
+
+__all__ = ["diverging"]
+
+
+def _resolve_color(color: Color, version: str) -> Color:
+    """Get the hex value of FAU color names, all other colors are passed to matplotlib as they are."""
+    if isinstance(color, str) and not color.startswith("#"):
+        hex_color = COLORS_ALL.get(version, COLORS[version]).get(normalize_color_name(color))
+        if hex_color is not None:
+            return hex_color
+    return color
+
+
+def _label(color: Color) -> str:
+    if isinstance(color, str):
+        return normalize_color_name(color).lstrip("#").lower()
+    from matplotlib.colors import to_hex
+
+    return to_hex(color).lstrip("#")
+
+
+@lru_cache(maxsize=128)
+def _diverging(
+    low: Color, high: Color, center: Color, n: int, *, space: str, version: str, name: str
+) -> ListedColormap:
+    from matplotlib.colors import ListedColormap, to_rgb
+
+    stops = [to_rgb(_resolve_color(color, version)) for color in (low, center, high)]
+    # With an odd `n`, the center color is sampled exactly
+    return ListedColormap(blend_colors([stops], n, space=space)[0], name=name)
+
+
+def diverging(
+    low: Color,
+    high: Color,
+    center: Color = "white",
+    n: int = 256,
+    space: BlendSpace = "oklab",
+    *,
+    register: bool = False,
+    version: str | int = DEFAULT_VERSION,
+    name: str | None = None,
+) -> ListedColormap:
+    """Create a diverging colormap from `low` over `center` to `high` (e.g. for heatmaps of signed data).
+
+    Both halves are interpolated with the same number of samples in the given color space.
+    In OKLab (the default), the steps within each half are perceptually even.
+    The end colors keep their own lightness, so both halves only reach the same contrast to the center if `low` and
+    `high` have a similar lightness (e.g. two "dark" or two normal faculty colors).
+    Colormaps are cached by their arguments, so the same (shared) object is returned for the same arguments.
+    Use `cmap.copy()` before modifying it (e.g. with `set_bad`).
+
+    >>> import fau_colors
+    >>> cmap = fau_colors.diverging("med-dark", "wiso-dark")
+    >>> plt.imshow(data, cmap=cmap, vmin=-1, vmax=1)
+
+    Parameters
+    ----------
+    low
+        The color of the lowest value.
+        Either the name of a color of the version (as in `colors_all`, e.g. "med_dark" or "fau-med-dark") or any color
+        understood by matplotlib.
+    high
+        The color of the highest value (see `low`).
+    center
+        The color of the center value (see `low`).
+    n
+        The number of entries of the colormap.
+    space
+        The color space in which the colors are interpolated ("srgb", "linear", or "oklab").
+    register
+        If True, the colormap is also registered with matplotlib under its name.
+    version
+        The color version used to resolve the color names.
+    name
+        The name of the colormap. Defaults to "{low}_{center}_{high}_div" (e.g. "med_dark_white_wiso_dark_div").
+
+    Returns
+    -------
+    cmap
+        The colormap.
+
+    Raises
+    ------
+    ValueError
+        If a color is unknown or a different colormap with the same name is already registered.
+
+    """
+    if n < 2:
+        raise ValueError("`n` must be at least 2.")
+    if space not in BLEND_SPACES:
+        raise ValueError(f"Unknown color space '{space}'. Available spaces are: {', '.join(BLEND_SPACES)}.")
+    # RGB sequences are not hashable
+    low, high, center = (color if isinstance(color, str) else tuple(color) for color in (low, high, center))
+    if name is None:
+        name = f"{_label(low)}_{_label(center)}_{_label(high)}_div"
+    cmap = _diverging(low, high, center, n, space=space, version=normalize_version(version), name=name)
+    if register:
+        from fau_colors._utils import register_colormap
+
+        register_colormap(cmap)
+    return cmap
@@ -0,0 +1,265 @@
+"""Compact, array-backed palettes.
+
+The entries of `cmaps` are `Palette` objects.
+They behave like the lists they replace (iterating and indexing yield the same hex strings or float RGB tuples, and
+they can be passed to seaborn and matplotlib), but their colors are read from the precomputed `fau_colors.data`, so
+neither seaborn nor matplotlib is imported to create them.
+
+All colors of a version are additionally stored once in a single contiguous float64 and uint8 array.
+Every `Palette` holds read-only (zero-copy) views into these arrays, and palettes that are strided subsets of a longer
+palette (e.g. "faculties" and "faculties_dark" of "faculties_all" in 2024) share its memory.
+Color names are interned, so equal names are only stored once across all versions.
+Seaborn palettes and matplotlib colormaps are only created on request.
+
+>>> from fau_colors import cmaps  # the 2024 palettes, see also `fau_colors.v2021.cmaps` and `get_palettes`
+>>> cmaps.faculties[:2]
+Palette('faculties[0:2:1]', version='2024', hex=('#04316A', '#8C9FB1'))
+>>> cmaps.faculties.names[:2]
+('fau', 'tech')
+>>> cmaps.med_dark.as_cmap()
+<matplotlib.colors.ListedColormap object at ...>
+
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import namedtuple
+from collections.abc import Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, Union
+
+import numpy as np
+
+from fau_colors._versions import DEFAULT_VERSION, normalize_version, palette_color_names
+from fau_colors.data import HEX_PALETTES, PALETTE_NAMES, PALETTES_HEX, PALETTES_RGB, PALETTES_RGB_UINT8
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from matplotlib.colors import ListedColormap
+
+__all__ = ["Palette", "get_palettes"]
+
+# A single color of a palette (a hex string or a float RGB tuple)
+_Color = Union[str, tuple[float, float, float]]
+
+
+class Palette(Sequence):
+    """A read-only palette backed by views into the shared color arrays of its version.
+
+    Iterating and indexing a palette yields its colors as listed in the definition of `cmaps` (hex strings, or float
+    RGB tuples for the blended palettes of 2019 and 2021).
+    Indexing with a slice returns another (zero-copy) `Palette`, and `np.asarray` returns the float RGB colors.
+    Use `cmaps` of the version modules (or `get_palettes`) to get instances.
+    """
+
+    __slots__ = ("_cmap", "_index", "_items", "_seaborn", "name", "names", "rgb", "rgb_uint8", "version")
+
+    def __init__(
+        self,
+        version: str,
+        name: str,
+        names: tuple[str, ...],
+        *,
+        items: tuple[_Color, ...],
+        rgb: np.ndarray,
+        rgb_uint8: np.ndarray,
+    ) -> None:
+        self.version = version
+        self.name = name
+        self.names = names
+        self.rgb = rgb
+        self.rgb_uint8 = rgb_uint8
+        self._items = items
+        self._index: slice | None = None
+        self._cmap: ListedColormap | None = None
+        self._seaborn: list | None = None
+
+    @property
+    def hex(self) -> tuple[str, ...]:
+        """The colors as hex strings."""
+        return tuple("#{:02X}{:02X}{:02X}".format(*color) for color in self.rgb_uint8.tolist())
+
+    def __len__(self) -> int:
+        """Get the number of colors."""
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[_Color]:
+        """Iterate over the colors."""
+        return iter(self._items)
+
+    def __getitem__(self, key: int | str | slice) -> _Color | Palette:
+        """Get a color by index or name, or a view of multiple colors by slice."""
+        if isinstance(key, slice):
+            view = Palette(
+                self.version,
+                self.name,
+                self.names[key],
+                items=self._items[key],
+                rgb=self.rgb[key],
+                rgb_uint8=self.rgb_uint8[key],
+            )
+            view._index = _compose_slices(self._index, key, len(_root_palette(self.version, self.name)))
+            return view
+        if isinstance(key, str):
+            try:
+                key = self.names.index(key)
+            except ValueError:
+                raise KeyError(key) from None
+        return self._items[key]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the colors with another palette, list, or tuple (like a list of colors)."""
+        if isinstance(other, Palette):
+            return self._items == other._items
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the colors."""
+        return hash(self._items)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """Get the float RGB colors as array of shape (n, 3).
+
+        Without a copy, the (read-only) float64 view is returned.
+        As in NumPy 2, `copy=False` raises a `ValueError` if another `dtype` requires a copy.
+        """
+        if copy:
+            return np.array(self.rgb, dtype=dtype)
+        if copy is False and dtype is not None and np.dtype(dtype) != self.rgb.dtype:
+            raise ValueError(f"Converting the colors of a Palette to {np.dtype(dtype)} requires a copy.")
+        return self.rgb if dtype is None else self.rgb.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        """Get the name, version, and colors of the palette."""
+        index = ""
+        if self._index is not None:
+            index = "[{}]".format(
+                ":".join("" if v is None else str(v) for v in (self._index.start, self._index.stop, self._index.step))
+            )
+        return f"Palette('{self.name}{index}', version='{self.version}', hex={self.hex})"
+
+    def __reduce__(self) -> tuple:
+        """Pickle only the version, name, and slice of the palette (the colors are restored from the shared arrays)."""
+        return _unpickle_palette, (self.version, self.name, self._index)
+
+    def __enter__(self) -> list[tuple[float, float, float]]:
+        """Temporarily set the palette as seaborn color cycle (as seaborn palettes do)."""
+        return self.as_seaborn().__enter__()
+
+    def __exit__(self, *args: object) -> None:
+        """Restore the previous seaborn color cycle."""
+        self.as_seaborn().__exit__(*args)
+
+    def as_hex(self) -> list[str]:
+        """Get the colors as lower case hex strings (as `as_hex` of seaborn palettes)."""
+        return [color.lower() for color in self.hex]
+
+    def as_cmap(self) -> ListedColormap:
+        """Get the palette as matplotlib colormap (created on the first call)."""
+        if self._cmap is None:
+            from matplotlib.colors import ListedColormap
+
+            # The colors as listed in `cmaps` (as the cmaps registered by `register_cmaps`, which use this colormap)
+            self._cmap = ListedColormap(list(self._items), name=self.name)
+        return self._cmap
+
+    def as_seaborn(self) -> list[tuple[float, float, float]]:
+        """Get the palette as seaborn palette (created on the first call)."""
+        if self._seaborn is None:
+            import seaborn as sns
+
+            self._seaborn = sns.color_palette(self.rgb.tolist())
+        return self._seaborn
+
+
+def _compose_slices(outer: slice | None, inner: slice, length: int) -> slice:
+    """Get the slice of the root palette that is equivalent to applying `inner` after `outer`."""
+    indices = range(length)
+    if outer is not None:
+        indices = indices[outer]
+    indices = indices[inner]
+    return slice(indices.start, indices.stop if indices.stop >= 0 else None, indices.step)
+
+
+def _unpickle_palette(version: str, name: str, index: slice | None) -> Palette:
+    palette = _root_palette(version, name)
+    return palette if index is None else palette[index]
+
+
+def _find_strided(colors: tuple[tuple[float, ...], ...], store: list[tuple[float, ...]]) -> slice | None:
+    """Find the colors as strided slice of the already stored colors."""
+    n = len(colors)
+    for start in (i for i, c in enumerate(store) if c == colors[0]):
+        if n == 1:
+            return slice(start, start + 1)
+        for step in (i - start for i, c in enumerate(store[start + 1 :], start + 1) if c == colors[1]):
+            candidate = slice(start, start + (n - 1) * step + 1, step)
+            if tuple(store[candidate]) == colors:
+                return candidate
+    return None
+
+
+def _color_names(version: str, name: str) -> tuple[str, ...]:
+    return tuple(map(sys.intern, palette_color_names(name, version)))
+
+
+@cache
+def _version_palettes(version: str) -> dict[str, Palette]:
+    rgb_palettes = PALETTES_RGB[version]
+    # Longer palettes are stored first, so that shorter ones can be views into them
+    store: list[tuple[float, ...]] = []
+    indices = {}
+    for name in sorted(rgb_palettes, key=lambda name: -len(rgb_palettes[name])):
+        index = _find_strided(rgb_palettes[name], store)
+        if index is None:
+            index = slice(len(store), len(store) + len(rgb_palettes[name]))
+            store.extend(rgb_palettes[name])
+        indices[name] = index
+
+    rgb = np.array(store, dtype=np.float64)
+    rgb_uint8 = np.empty((len(store), 3), dtype=np.uint8)
+    for name, index in indices.items():
+        rgb_uint8[index] = PALETTES_RGB_UINT8[version][name]
+    rgb_uint8.setflags(write=False)
+    rgb.setflags(write=False)
+
+    palettes = {}
+    for name in rgb_palettes:
+        index = indices[name]
+        names = _color_names(version, name)
+        # The items are the (shared) tuples of `fau_colors.data`, so they do not need any additional memory
+        items = PALETTES_HEX[version][name] if name in HEX_PALETTES[version] else rgb_palettes[name]
+        palettes[name] = Palette(version, name, names, items=items, rgb=rgb[index], rgb_uint8=rgb_uint8[index])
+    return palettes
+
+
+def _root_palette(version: str, name: str) -> Palette:
+    return _version_palettes(version)[name]
+
+
+@cache
+def _palettes_type(version: str) -> type:
+    return namedtuple("Cmaps", list(PALETTES_HEX[version]))
+
+
+@cache
+def _get_palettes(version: str) -> tuple[Palette, ...]:
+    return _palettes_type(version)(**_version_palettes(version))
+
+
+def get_palettes(version: str | int = DEFAULT_VERSION) -> tuple[Palette, ...]:
+    """Get `cmaps` of a version, i.e. all palettes of the version as namedtuple (created once per version)."""
+    return _get_palettes(normalize_version(version))
+
+
+@cache
+def _get_palettes_with_names(version: str) -> tuple[tuple[list[str], Palette], ...]:
+    """Get `cmaps_with_names` of a version, i.e. the palettes with the names of their colors (2021 and 2024 only)."""
+    palettes = _get_palettes(version)
+    return type(palettes)(
+        *((list(PALETTE_NAMES[version][name]), palette) for name, palette in zip(palettes._fields, palettes))
+    )
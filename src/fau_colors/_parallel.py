@@ -0,0 +1,47 @@
+"""Bounded process pool helpers shared by the file processing tools (`audit`, `migrate`)."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = TypeVar("T")
+
+
+def iter_files(paths: Iterable[str | Path], suffixes: tuple[str, ...]) -> Iterator[Path]:
+    """Yield the given files and all files with one of the suffixes in the given directories (recursively)."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from (p for p in sorted(path.rglob("*")) if p.suffix.lower() in suffixes and p.is_file())
+        else:
+            yield path
+
+
+def imap_bounded(
+    func: Callable[..., T], items: Iterable[Any], args: tuple = (), max_workers: int | None = None
+) -> Iterator[T]:
+    """Call `func(item, *args)` for all items in a process pool and yield the results in completion order.
+
+    At most `2 * max_workers` items are submitted at any time, so `items` can be an arbitrarily long (lazy) iterable.
+    With `max_workers=0` all items are processed in the calling process.
+    """
+    if max_workers == 0:
+        for item in items:
+            yield func(item, *args)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for item in items:
+            pending.add(executor.submit(func, item, *args))
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        for future in pending:
+            yield future.result()
@@ -0,0 +1,165 @@
+"""Cached matplotlib styles with the FAU colors and font."""
+
+from __future__ import annotations
+
+import warnings
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from fau_colors._versions import DEFAULT_VERSION, normalize_version
+from fau_colors.data import PALETTES_HEX
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from contextlib import AbstractContextManager
+
+__all__ = ["STYLE_VARIANTS", "style", "style_params", "write_style"]
+
+# Variant -> palette used as color cycle
+STYLE_VARIANTS = {"default": "faculties", "dark": "faculties_dark", "light": "faculties_light"}
+# Variant -> continuous colormap used for images (only available for 2024)
+_IMAGE_CMAPS = {"default": "fau_cont", "dark": "fau_dark_cont", "light": "fau_cont"}
+_FONT_PARAMS = {"font.family": ["sans-serif"], "font.sans-serif": ["FAUSans Office"]}
+
+
+def _resolve_variant(version: str, variant: str) -> str:
+    if variant not in STYLE_VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}'. Available variants are: {', '.join(STYLE_VARIANTS)}.")
+    palette = STYLE_VARIANTS[variant]
+    if palette not in PALETTES_HEX[version]:
+        raise ValueError(f"The variant '{variant}' is not available for version {version}.")
+    return palette
+
+
+@cache
+def _font_available() -> bool:
+    from fau_colors.fonts import _add_font_files
+
+    if _add_font_files():
+        return True
+    warnings.warn(
+        "Could not find 'FAUSans Office' font on your system. The style does not change the font.", stacklevel=4
+    )
+    return False
+
+
+@cache
+def _style_params(version: str, variant: str, font: bool, image_cmap: bool = True) -> Mapping[str, Any]:
+    import matplotlib
+
+    palette = _resolve_variant(version, variant)
+    params = {"axes.prop_cycle": f"cycler('color', {list(PALETTES_HEX[version][palette])})"}
+    if image_cmap and version == "2024":
+        from fau_colors._utils import namespaced_cmap_name
+
+        # Referenced by its prefixed name (see `register_all`), which does not conflict with the cmaps of other versions
+        params["image.cmap"] = namespaced_cmap_name(_IMAGE_CMAPS[variant], version)
+    if font and _font_available():
+        params.update(_FONT_PARAMS)
+    # Parsing the cycler only happens once here, applying the style only validates the already parsed values
+    validated = matplotlib.RcParams()
+    validated.update(params)
+    return MappingProxyType({key: validated[key] for key in params})
+
+
+def style_params(
+    version: str | int = DEFAULT_VERSION, variant: str = "default", font: bool = True
+) -> Mapping[str, Any]:
+    """Get the (validated and cached) rcParams of a FAU style.
+
+    See `style` for details.
+    """
+    return _style_params(normalize_version(version), variant, font)
+
+
+@contextmanager
+def _apply_params(params: Mapping[str, Any]) -> Iterator[None]:
+    import matplotlib
+
+    rc_params = matplotlib.rcParams
+    # Only the changed keys are restored afterwards (`matplotlib.rc_context` copies all rcParams)
+    previous = {key: rc_params[key] for key in params}
+    try:
+        rc_params.update(params)
+        yield
+    finally:
+        rc_params.update(previous)
+
+
+def style(
+    version: str | int = DEFAULT_VERSION, variant: str = "default", font: bool = True, *, register: bool = True
+) -> AbstractContextManager[None]:
+    """Apply the FAU colors (and font) to all figures created in a `with` block.
+
+    The style sets the color cycle to the faculty colors of the variant, the default colormap for images to the
+    continuous FAU colormap (only for 2024), and the font to FAU Sans (if installed).
+    The rcParams are created once per configuration, and entering the context only sets (and afterwards restores)
+    these few values, which is much cheaper than `matplotlib.rc_context`.
+
+    >>> import fau_colors
+    >>> with fau_colors.style("2024", "dark"):
+    ...     fig, ax = plt.subplots()
+
+    Parameters
+    ----------
+    version
+        The color version.
+    variant
+        "default", "dark", or "light" faculty colors as color cycle (2019 only has "default").
+    font
+        If True, the FAU Sans font is used if it can be found (see `register_fausans_font`).
+        Otherwise, a warning is shown once and the font is not changed.
+    register
+        If True, the cmaps of the version are registered with the version as prefix (e.g. "fau2024.med_dark", see
+        `register_all`), so that they can be used by name.
+        These names do not conflict with the cmaps of other versions, so styles of different versions can be used
+        one after another. The cmaps stay registered after the context.
+        If False, the colormap for images is not changed.
+
+    """
+    version = normalize_version(version)
+    params = _style_params(version, variant, font, register)
+    if register:
+        from fau_colors._utils import register_namespaced
+
+        register_namespaced(version)
+    return _apply_params(params)
+
+
+def _format_value(key: str, value: Any) -> str:
+    if key == "axes.prop_cycle":
+        colors = ", ".join(f"'{color[1:]}'" for color in value.by_key()["color"])
+        return f"cycler('color', [{colors}])"
+    return ", ".join(value) if isinstance(value, list) else str(value)
+
+
+def write_style(
+    path: str | Path, version: str | int = DEFAULT_VERSION, variant: str = "default", font: bool = True
+) -> Path:
+    """Write a FAU style as `.mplstyle` file (to be used with `plt.style.use(path)`).
+
+    The file contains the same rcParams as `style`.
+    Note that the image colormap (2024 only) is referenced by its prefixed name (e.g. "fau2024.fau_cont"), so the cmaps
+    need to be registered with `register_all` before figures are created with the style.
+
+    Returns
+    -------
+    path
+        The written file.
+
+    """
+    version = normalize_version(version)
+    from fau_colors.export import render
+
+    # The color cycle is rendered like the style files of the exported palettes
+    content = render(version, "mplstyle", palette=_resolve_variant(version, variant)).decode("utf-8")
+    params = _style_params(version, variant, font)
+    content += "".join(
+        f"{key}: {_format_value(key, value)}\n" for key, value in params.items() if key != "axes.prop_cycle"
+    )
+    path = Path(path)
+    path.write_text(content)
+    return path
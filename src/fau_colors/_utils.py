@@ -1,23 +1,47 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from contextlib import contextmanager
+from functools import cache, partial
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import matplotlib
-from matplotlib.colors import ListedColormap, to_rgb
+import numpy as np
+from matplotlib.colors import ListedColormap, to_rgba_array
+
+from fau_colors import diagnostics
+from fau_colors._blend import blend_colors
+from fau_colors._palette import Palette
+from fau_colors._versions import DEFAULT_VERSION, get_version_module, normalize_version
+from fau_colors.data import VERSIONS
+from fau_colors.export import render_gpl, render_tex
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+
+
+def custom_blend_colormap(
+    colors: Sequence[str], steps: Sequence[float] | int = 256
+) -> list[tuple[float, float, float]]:
+    """Sample a gradient between the given colors like a `LinearSegmentedColormap` with 256 entries would."""
+    rgb_array = blend_colors([to_rgba_array(colors)[:, :3]], steps, lut_size=256)[0]
+    return list(map(tuple, rgb_array))
+
 
+# Fingerprints of all colormaps registered by this package (name -> fingerprint)
+_REGISTERED_FINGERPRINTS: dict[str, bytes] = {}
+# Guards all changes to the matplotlib colormap registry made by this package
+_REGISTRATION_LOCK = threading.RLock()
+# Number of active `registered_cmaps` contexts per version and whether the context registered the cmaps itself
+_CONTEXT_COUNTS: dict[str, int] = {}
+_CONTEXT_OWNS_REGISTRATION: dict[str, bool] = {}
 
-def custom_blend_colormap(colors: Sequence[str], steps: int = 256) -> list[tuple[float, float, float]]:
-    colors = [to_rgb(color) for color in colors]
-    name = "blend"
-    pal = matplotlib.colors.LinearSegmentedColormap.from_list(name, colors)
-    rgb_array = pal(steps)[:, :3]  # no alpha
-    pal = list(map(tuple, rgb_array))
-    return pal
+
+def _palette_fingerprint(rgb: np.ndarray) -> bytes:
+    return hashlib.blake2b(np.ascontiguousarray(rgb, dtype=np.float32).tobytes(), digest_size=16).digest()
 
 
 def _get_colormap_registry() -> matplotlib.cm.ColormapRegistry | None:
@@ -27,7 +51,17 @@ def _get_colormap_registry() -> matplotlib.cm.ColormapRegistry | None:
         return None
 
 
-def _is_same_colormap(name: str, expected_colors: Sequence[str | Sequence[float]]) -> bool:
+def _registered_names(registry: matplotlib.cm.ColormapRegistry) -> Container[str]:
+    """Get the names of all registered colormaps for cheap membership tests of single names.
+
+    `name in registry` would copy the colormap, so the name dict of the registry is used where it exists instead of
+    copying all names into a set.
+    """
+    names = getattr(registry, "_cmaps", None)
+    return names if isinstance(names, dict) else set(registry)
+
+
+def _is_same_colormap(name: str, expected_colors: Sequence[str | Sequence[float]] | np.ndarray) -> bool:
     registry = _get_colormap_registry()
     if registry is None or name not in registry:
         return False
@@ -37,13 +71,9 @@ def _is_same_colormap(name: str, expected_colors: Sequence[str | Sequence[float]
     if registered_colors is None or len(registered_colors) != len(expected_colors):
         return False
 
-    for i in range(len(expected_colors)):
-        registered_rgb = to_rgb(registered_colors[i])
-        expected_rgb = to_rgb(expected_colors[i])
-        if any(abs(float(registered_rgb[j]) - float(expected_rgb[j])) > 1e-12 for j in range(3)):
-            return False
-
-    return True
+    registered_rgb = to_rgba_array(registered_colors)[:, :3]
+    expected_rgb = to_rgba_array(expected_colors)[:, :3]
+    return bool(np.all(np.abs(registered_rgb - expected_rgb) <= 1e-12))
 
 
 def _register_colormap(name: str, cmap: ListedColormap) -> None:
@@ -64,44 +94,204 @@ def _unregister_colormap(name: str) -> None:
     matplotlib.cm.unregister_cmap(name=name)
 
 
-def get_register_func(cmaps: matplotlib.colors.Colormap) -> Callable[[], None]:
-    def register() -> None:
-        for k, v in cmaps._asdict().items():
-            cmap = ListedColormap(v)
+def register_colormap(cmap: ListedColormap, name: str | None = None) -> None:
+    """Register a listed colormap with matplotlib (under `cmap.name` by default), unless it is already registered.
+
+    Raises
+    ------
+    ValueError
+        If a different colormap with the same name is already registered.
+
+    """
+    name = cmap.name if name is None else name
+    rgb = to_rgba_array(cmap.colors)[:, :3]
+    with _REGISTRATION_LOCK:
+        if not _is_same_colormap(name=name, expected_colors=rgb):
+            _register_colormap(name=name, cmap=cmap)
+        _REGISTERED_FINGERPRINTS[name] = _palette_fingerprint(rgb)
+
 
-            if _is_same_colormap(name=k, expected_colors=cmap.colors):
-                continue
+def get_register_func(*cmaps: matplotlib.colors.Colormap) -> Callable[[], None]:
+    return _get_register_func(lambda: chain.from_iterable(c._asdict().items() for c in cmaps))
 
-            _register_colormap(name=k, cmap=cmap)
+
+def _get_register_func(get_items: Callable[[], Iterable[tuple[str, Any]]]) -> Callable[[], None]:
+    # (name, cmap, fingerprint) for each entry, created on the first call of `register`
+    entries: list[tuple[str, ListedColormap, bytes]] = []
+
+    def _prepare_entries() -> list[tuple[str, ListedColormap, bytes]]:
+        if not entries:
+            for k, v in get_items():
+                # Palettes reuse their cached colormap (created from the precomputed colors), which is shared with
+                # `Palette.as_cmap` and the `PaletteHandle`s of `fau_colors.workers`
+                cmap = v.as_cmap() if isinstance(v, Palette) else ListedColormap(v)
+                entries.append((k, cmap, _palette_fingerprint(to_rgba_array(cmap.colors)[:, :3])))
+        return entries
+
+    def _is_registered() -> bool:
+        registry = _get_colormap_registry()
+        if registry is None:
+            return False
+        # Only the names registered by this package (with the same fingerprint) are looked up in the registry, to
+        # notice colormaps that were unregistered directly with matplotlib
+        registered_names = _registered_names(registry)
+        return all(
+            _REGISTERED_FINGERPRINTS.get(k) == fingerprint and k in registered_names for k, _, fingerprint in entries
+        )
+
+    def register() -> None:
+        with _REGISTRATION_LOCK:
+            # Fast path: nothing changed since the last call, so no colormap needs to be compared or created
+            if entries and _is_registered():
+                diagnostics.count_cache("register_cmaps", hit=True)
+                return
+
+            diagnostics.count_cache("register_cmaps", hit=False)
+            with diagnostics.phase("register_cmaps"):
+                for k, cmap, _ in _prepare_entries():
+                    register_colormap(cmap, name=k)
 
     return register
 
 
-def get_unregister_func(cmaps: matplotlib.colors.Colormap) -> Callable[[], None]:
+def get_unregister_func(*cmaps: matplotlib.colors.Colormap) -> Callable[[], None]:
     def unregister() -> None:
-        for k in cmaps._asdict():
-            _unregister_colormap(name=k)
+        with _REGISTRATION_LOCK:
+            for k in chain.from_iterable(c._fields for c in cmaps):
+                _unregister_colormap(name=k)
+                _REGISTERED_FINGERPRINTS.pop(k, None)
 
     return unregister
 
 
+def _version_cmaps(version: str) -> tuple:
+    """Get all namedtuples of colormaps that `register_cmaps` of a version registers."""
+    module = get_version_module(version)
+    return (module.cmaps, module.cmaps_continuous) if hasattr(module, "cmaps_continuous") else (module.cmaps,)
+
+
+def namespaced_cmap_name(name: str, version: str | int) -> str:
+    """Get the name of a colormap registered by `register_all` (e.g. "fau2021.med_dark")."""
+    return f"fau{normalize_version(version)}.{name}"
+
+
+def _namespaced_items(versions: tuple[str, ...] = VERSIONS) -> Iterator[tuple[str, Any]]:
+    for version in versions:
+        for cmaps in _version_cmaps(version):
+            for name, colors in cmaps._asdict().items():
+                yield namespaced_cmap_name(name, version), colors
+
+
+@cache
+def _get_namespaced_register_func(versions: tuple[str, ...] = VERSIONS) -> Callable[[], None]:
+    return _get_register_func(partial(_namespaced_items, versions))
+
+
+def register_namespaced(version: str | int) -> None:
+    """Register the cmaps of a single version with the version as prefix (see `register_all`)."""
+    _get_namespaced_register_func((normalize_version(version),))()
+
+
+def register_all(namespace: bool = True, default: str | int | None = DEFAULT_VERSION) -> None:
+    """Register the cmaps of all versions at once.
+
+    With `namespace=True`, the cmaps of each version are registered with the version as prefix (e.g. "fau2021.med"
+    or "fau2024.med_dark", see `namespaced_cmap_name`), so that all versions can be used side by side.
+    The cmaps of the `default` version are additionally registered without prefix (as `register_cmaps` of that version
+    does).
+    All colormaps are created in one batch on the first call, and colormaps that are already registered are skipped,
+    so repeated calls are cheap.
+
+    Parameters
+    ----------
+    namespace
+        If True, the cmaps of all versions are registered with prefixed names.
+    default
+        The version registered without prefix or None to not register unprefixed names.
+
+    Raises
+    ------
+    ValueError
+        If unprefixed cmaps of another version than `default` are currently registered.
+
+    """
+    with _REGISTRATION_LOCK:
+        if namespace:
+            _get_namespaced_register_func()()
+        if default is not None:
+            get_version_module(default).register_cmaps()
+
+
+def unregister_all(default: str | int | None = DEFAULT_VERSION) -> None:
+    """Unregister all cmaps registered by `register_all`.
+
+    Parameters
+    ----------
+    default
+        The version whose unprefixed cmaps are unregistered as well (or None to keep them).
+
+    """
+    with _REGISTRATION_LOCK:
+        names = [name for name, _ in _namespaced_items()]
+        if default is not None:
+            names.extend(chain.from_iterable(cmaps._fields for cmaps in _version_cmaps(normalize_version(default))))
+        registry = _get_colormap_registry()
+        registered_names = _registered_names(registry) if registry is not None else set(names)
+        for name in names:
+            if name in registered_names:
+                _unregister_colormap(name=name)
+            _REGISTERED_FINGERPRINTS.pop(name, None)
+
+
+@contextmanager
+def registered_cmaps(version: str | int = DEFAULT_VERSION) -> Iterator[None]:
+    """Register the cmaps of a color version for the duration of a `with` block.
+
+    Registrations are reference counted and protected by a lock, so the context can be entered from multiple threads
+    and nested.
+    Only the first entry registers the cmaps and only the last exit unregisters them again.
+    All other entries just update the counter.
+    If the cmaps were already registered (e.g. by calling `register_cmaps`) before the first entry, they stay
+    registered after the last exit.
+
+    Parameters
+    ----------
+    version
+        The color version ("2019", "2021", or "2024").
+
+    Raises
+    ------
+    ValueError
+        If cmaps with the same names but different colors (i.e. from another version) are currently registered.
+
+    """
+    version = normalize_version(version)
+    with _REGISTRATION_LOCK:
+        if _CONTEXT_COUNTS.get(version, 0) == 0:
+            module = get_version_module(version)
+            registry = _get_colormap_registry()
+            registered_names = _registered_names(registry) if registry is not None else set()
+            owns_registration = not all(name in registered_names for name in module.cmaps._fields)
+            module.register_cmaps()
+            _CONTEXT_OWNS_REGISTRATION[version] = owns_registration
+        _CONTEXT_COUNTS[version] = _CONTEXT_COUNTS.get(version, 0) + 1
+    try:
+        yield
+    finally:
+        with _REGISTRATION_LOCK:
+            _CONTEXT_COUNTS[version] -= 1
+            if _CONTEXT_COUNTS[version] == 0 and _CONTEXT_OWNS_REGISTRATION.pop(version):
+                get_version_module(version).unregister_cmaps()
+
+
 def export_as_gpl(
     colors: Sequence[list[tuple[float, float, float]]],
     file_name: str,
     folder_path: Path,
 ) -> None:
     assert file_name.endswith("gpl"), "`name` must end with '.gpl'"
-    HEADER = f"GIMP Palette\nName: {file_name[:-4]}\n#\n"  # noqa: N806
-
-    color_strings = []
-    for rgb in chain(*colors):
-        rgb_255 = [f"{int(c * 255)!s:>3}" for c in matplotlib.colors.to_rgb(rgb)]
-        color_strings.append(" ".join(rgb_255))
-
-    body = "\n".join(color_strings)
-    with Path(folder_path).joinpath(file_name).open("w") as f:
-        f.write(HEADER)
-        f.write(body)
+    rgb = to_rgba_array(list(chain(*colors)))[:, :3]
+    Path(folder_path).joinpath(file_name).write_text(render_gpl(file_name[:-4], rgb))
 
 
 def export_as_tex(
@@ -110,23 +300,9 @@ def export_as_tex(
     folder_path: Path,
 ) -> None:
     assert file_name.endswith("tex"), "`name` must end with '.tex'"
-    HEADER = (  # noqa: N806
-        f"% Tex color file defining the FAU colors.\n"
-        "% To use, you need to include the `xcolor` package (\\usepackage{xcolor} in your preamble).\n"
-        f"% Then copy this file into your project and include it with `\\input{{{file_name}}}`.\n\n\n"
-    )
-
-    color_strings = []
-    for cmap in colors:
-        for name, rgb in zip(*cmap, strict=False):
-            color_as_rgb = matplotlib.colors.to_rgb(rgb)
-            color_strings.append(
-                f"\\definecolor{{{name}}}{{rgb}}{{{color_as_rgb[0]}, {color_as_rgb[1]}, {color_as_rgb[2]}}}"
-            )
-
-    color_strings = sorted(set(color_strings))
-
-    body = "\n".join(color_strings)
-    with Path(folder_path).joinpath(file_name).open("w") as f:
-        f.write(HEADER)
-        f.write(body)
+    names, rgb = [], []
+    for cmap_names, cmap_colors in colors:
+        n = min(len(cmap_names), len(cmap_colors))
+        names.extend(cmap_names[:n])
+        rgb.extend(cmap_colors[:n])
+    Path(folder_path).joinpath(file_name).write_text(render_tex(file_name, names, to_rgba_array(rgb)[:, :3]))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from fau_colors.data import COLORS, PALETTE_NAMES, PALETTES_RGB, VERSIONS
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+DEFAULT_VERSION = "2024"
+# Share of the base color in the colors of the lightness ramps (e.g. "med_dark"), from the base color to the lightest
+LEVELS = (1.0, 0.625, 0.375, 0.25, 0.125)
+
+
+def normalize_version(version: str | int) -> str:
+    version = str(version)
+    if version.startswith("v"):
+        version = version[1:]
+    if version not in VERSIONS:
+        raise ValueError(f"Unknown color version '{version}'. Available versions are: {', '.join(VERSIONS)}.")
+    return version
+
+
+def get_version_module(version: str | int) -> ModuleType:
+    return importlib.import_module(f"fau_colors.v{normalize_version(version)}")
+
+
+def normalize_color_name(name: str) -> str:
+    """Convert color/palette names like "fau-med-dark" or "med-dark" into their field name ("med_dark")."""
+    if name.startswith("fau-"):
+        name = name[4:]
+    return name.replace("-", "_")
+
+
+def resolve_palette_name(name: str, version: str | int) -> str:
+    version = normalize_version(version)
+    palettes = PALETTES_RGB[version]
+    # "fau-dark" is the dark FAU color, but "fau-med" the medicine color
+    for candidate in (name, name.replace("-", "_"), normalize_color_name(name)):
+        if candidate in palettes:
+            return candidate
+    raise ValueError(f"Unknown palette '{name}' for version {version}. Available palettes are: {', '.join(palettes)}.")
+
+
+def level_color_name(name: str, level: float) -> str:
+    """Get the name of a color of a lightness ramp ("med_dark" and 0.625 -> "med_dark_625", 1.0 -> "med_dark")."""
+    return name if level == 1.0 else f"{name}_{round(level * 1000)}"
+
+
+def palette_color_names(name: str, version: str | int) -> tuple[str, ...]:
+    """Get the normalized names of the individual colors of a palette (e.g. ("fau", "tech", ...) for "faculties").
+
+    Colors of lightness ramps are named with `level_color_name` (e.g. "med_625"), like in the registry.
+    """
+    version = normalize_version(version)
+    name = resolve_palette_name(name, version)
+    n_colors = len(PALETTES_RGB[version][name])
+    names = PALETTE_NAMES.get(version, {}).get(name)
+    if names is not None and len(names) == n_colors:
+        return tuple(normalize_color_name(n) for n in names)
+    base, _, level = name.rpartition("_")
+    if level.isdigit() and base in PALETTES_RGB[version]:
+        # The lightness level palettes of 2024 (e.g. "faculties_625") contain one level of each color of the base
+        # palette. Their names in `cmaps_with_names` are incomplete.
+        return tuple(level_color_name(n, int(level) / 1000) for n in palette_color_names(base, version))
+    # The 2019 colors do not have named palettes. The faculty colors are named after the faculties and all other
+    # palettes are lightness ramps.
+    if name == "faculties":
+        return tuple(COLORS[version])
+    return tuple(level_color_name(name, level) for level in LEVELS[:n_colors])
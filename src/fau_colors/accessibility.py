@@ -0,0 +1,360 @@
+"""Contrast and color vision deficiency (CVD) analysis of the FAU colors.
+
+All pairwise matrices of a version are computed at once with numpy and cached, so queries like `best_text_color` or
+`most_distinguishable` only index into precomputed arrays.
+
+>>> from fau_colors import accessibility
+>>> accessibility.best_text_color("fau")
+'#FFFFFF'
+>>> accessibility.most_distinguishable(3, cvd="deuteranopia")
+('phil', 'med', 'black')
+
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from functools import cache, lru_cache
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from fau_colors._colorspace import (
+    hex_to_rgb,
+    linear_to_lab,
+    linear_to_oklab,
+    linear_to_srgb,
+    relative_luminance,
+    srgb_to_linear,
+)
+from fau_colors._versions import (
+    DEFAULT_VERSION,
+    normalize_color_name,
+    normalize_version,
+    palette_color_names,
+    resolve_palette_name,
+)
+from fau_colors.data import PALETTES_HEX
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+
+    from fau_colors._colorspace import Color
+
+__all__ = [
+    "CVD_TYPES",
+    "AccessibilityMatrices",
+    "accessibility_matrices",
+    "best_text_color",
+    "ciede2000",
+    "color_table",
+    "contrast_ratio",
+    "most_distinguishable",
+    "simulate_cvd",
+]
+
+CVD_TYPES = ("deuteranopia", "protanopia", "tritanopia")
+CvdType = Literal["deuteranopia", "protanopia", "tritanopia"]
+DistanceMetric = Literal["ciede2000", "oklab"]
+
+# Machado, Oliveira, and Fernandes (2009), severity 1.0, applied to linear RGB
+_CVD_MATRICES = {
+    "protanopia": np.array(
+        [
+            [0.152286, 1.052583, -0.204868],
+            [0.114503, 0.786281, 0.099216],
+            [-0.003882, -0.048116, 1.051998],
+        ]
+    ),
+    "deuteranopia": np.array(
+        [
+            [0.367322, 0.860646, -0.227968],
+            [0.280085, 0.672501, 0.047413],
+            [-0.011820, 0.042940, 0.968881],
+        ]
+    ),
+    "tritanopia": np.array(
+        [
+            [1.255528, -0.076749, -0.178779],
+            [-0.078411, 0.930809, 0.147602],
+            [0.004733, 0.691367, 0.303900],
+        ]
+    ),
+}
+
+# Beyond this number of color combinations, `most_distinguishable` uses a greedy search instead of trying all
+_MAX_EXHAUSTIVE_COMBINATIONS = 200_000
+
+AccessibilityMatrices = namedtuple(
+    "AccessibilityMatrices", ["names", "hex", "rgb", "luminance", "contrast", "ciede2000", "oklab"]
+)
+
+
+def simulate_cvd(rgb: ArrayLike, cvd: CvdType) -> np.ndarray:
+    """Simulate how sRGB colors (floats between 0 and 1, channels in the last dimension) appear under a CVD."""
+    if cvd not in _CVD_MATRICES:
+        raise ValueError(f"Unknown color vision deficiency '{cvd}'. Available are: {', '.join(CVD_TYPES)}.")
+    linear = np.clip(srgb_to_linear(rgb) @ _CVD_MATRICES[cvd].T, 0, 1)
+    return np.clip(linear_to_srgb(linear), 0, 1)
+
+
+def contrast_ratio(foreground: ArrayLike, background: ArrayLike) -> np.ndarray:
+    """WCAG 2 contrast ratio (1 to 21) between sRGB colors (broadcasting over all but the last dimension)."""
+    lum_fg = relative_luminance(foreground)
+    lum_bg = relative_luminance(background)
+    return (np.maximum(lum_fg, lum_bg) + 0.05) / (np.minimum(lum_fg, lum_bg) + 0.05)
+
+
+def ciede2000(lab1: ArrayLike, lab2: ArrayLike) -> np.ndarray:
+    """CIEDE2000 color difference between CIELAB colors (broadcasting over all but the last dimension)."""
+    l1, a1, b1 = np.moveaxis(np.asarray(lab1, dtype=np.float64), -1, 0)
+    l2, a2, b2 = np.moveaxis(np.asarray(lab2, dtype=np.float64), -1, 0)
+
+    c_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_mean7 / (c_mean7 + 25**7)))
+    a1, a2 = (1 + g) * a1, (1 + g) * a2
+    c1, c2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1, h2 = np.degrees(np.arctan2(b1, a1)) % 360, np.degrees(np.arctan2(b2, a2)) % 360
+    achromatic = c1 * c2 == 0
+
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(achromatic, 0, dh)
+    delta_h = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh) / 2)
+
+    h_sum = h1 + h2
+    h_mean = np.where(np.abs(h1 - h2) <= 180, h_sum / 2, np.where(h_sum < 360, h_sum + 360, h_sum - 360) / 2)
+    h_mean = np.where(achromatic, h_sum, h_mean)
+    l_mean, c_mean = (l1 + l2) / 2, (c1 + c2) / 2
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_mean - 30))
+        + 0.24 * np.cos(np.radians(2 * h_mean))
+        + 0.32 * np.cos(np.radians(3 * h_mean + 6))
+        - 0.20 * np.cos(np.radians(4 * h_mean - 63))
+    )
+    rotation = (
+        -np.sin(np.radians(60 * np.exp(-(((h_mean - 275) / 25) ** 2)))) * 2 * np.sqrt(c_mean**7 / (c_mean**7 + 25**7))
+    )
+    dl = (l2 - l1) / (1 + 0.015 * (l_mean - 50) ** 2 / np.sqrt(20 + (l_mean - 50) ** 2))
+    dc = (c2 - c1) / (1 + 0.045 * c_mean)
+    dh_scaled = delta_h / (1 + 0.015 * c_mean * t)
+    return np.sqrt(dl**2 + dc**2 + dh_scaled**2 + rotation * dc * dh_scaled)
+
+
+@cache
+def color_table(version: str | int = DEFAULT_VERSION) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Get the names and hex values of all distinct named colors of all palettes of a version.
+
+    For 2024, this includes `colors_all` and all colors of the `colors_with_light_levels` ramps (e.g. "med_625").
+    """
+    version = normalize_version(version)
+    table = {}
+    for palette, hex_colors in PALETTES_HEX[version].items():
+        for name, hex_color in zip(palette_color_names(palette, version), hex_colors):
+            table.setdefault(name, hex_color)
+    return tuple(table), tuple(table.values())
+
+
+def _freeze(*arrays: np.ndarray) -> None:
+    for array in arrays:
+        array.setflags(write=False)
+
+
+@cache
+def _accessibility_matrices(version: str, cvd: str | None) -> AccessibilityMatrices:
+    return _color_matrices(*color_table(version), cvd)
+
+
+def _color_matrices(names: tuple[str, ...], hex_colors: tuple[str, ...], cvd: str | None) -> AccessibilityMatrices:
+    rgb = np.array([hex_to_rgb(c) for c in hex_colors])
+    if cvd is not None:
+        rgb = simulate_cvd(rgb, cvd)
+    linear = srgb_to_linear(rgb)
+    luminance = relative_luminance(rgb)
+    lum_max = np.maximum(luminance[:, None], luminance[None, :])
+    lum_min = np.minimum(luminance[:, None], luminance[None, :])
+    lab = linear_to_lab(linear)
+    oklab = linear_to_oklab(linear)
+    matrices = AccessibilityMatrices(
+        names=names,
+        hex=hex_colors,
+        rgb=rgb,
+        luminance=luminance,
+        contrast=(lum_max + 0.05) / (lum_min + 0.05),
+        ciede2000=ciede2000(lab[:, None], lab[None, :]),
+        oklab=np.linalg.norm(oklab[:, None] - oklab[None, :], axis=-1),
+    )
+    _freeze(*matrices[2:])
+    return matrices
+
+
+def accessibility_matrices(version: str | int = DEFAULT_VERSION, cvd: CvdType | None = None) -> AccessibilityMatrices:
+    """Get the contrast and distance matrices of all colors of a version (see `color_table`).
+
+    Parameters
+    ----------
+    version
+        The color version.
+    cvd
+        If provided, all matrices are computed for the colors as they appear under the given color vision deficiency.
+
+    Returns
+    -------
+    matrices
+        The color names, hex values, (simulated) RGB values, and relative luminances, as well as the pairwise WCAG
+        contrast ratio, CIEDE2000 difference, and Euclidean OKLab distance matrices.
+        All arrays are read-only and cached per version and CVD.
+
+    """
+    if cvd is not None and cvd not in CVD_TYPES:
+        raise ValueError(f"Unknown color vision deficiency '{cvd}'. Available are: {', '.join(CVD_TYPES)}.")
+    return _accessibility_matrices(normalize_version(version), cvd)
+
+
+@cache
+def _color_index(version: str) -> dict[str, int]:
+    return {name: i for i, name in enumerate(color_table(version)[0])}
+
+
+def _resolve_rgb(color: Color, version: str) -> np.ndarray:
+    if isinstance(color, str) and not color.startswith("#"):
+        index = _color_index(version).get(normalize_color_name(color))
+        if index is None:
+            raise ValueError(f"Unknown color '{color}' for version {version}.")
+        return _accessibility_matrices(version, None).rgb[index]
+    return np.array(hex_to_rgb(color) if isinstance(color, str) else tuple(color)[:3], dtype=np.float64)
+
+
+@lru_cache(maxsize=1024)
+def _best_text_color(background: Color, version: str, candidates: tuple[Color, ...] | None, cvd: str | None) -> str:
+    if candidates is None:
+        candidate_hex = ("#000000", "#FFFFFF")
+    else:
+        candidate_hex = tuple(
+            c if isinstance(c, str) and c.startswith("#") else _to_hex(c, version) for c in candidates
+        )
+    candidate_rgb = np.array([hex_to_rgb(c) for c in candidate_hex])
+    background_rgb = _resolve_rgb(background, version)
+    if cvd is not None:
+        candidate_rgb, background_rgb = simulate_cvd(candidate_rgb, cvd), simulate_cvd(background_rgb, cvd)
+    return candidate_hex[int(np.argmax(contrast_ratio(candidate_rgb, background_rgb)))]
+
+
+def _to_hex(color: Color, version: str) -> str:
+    rgb = np.round(_resolve_rgb(color, version) * 255).astype(int)
+    return "#{:02X}{:02X}{:02X}".format(*rgb)
+
+
+def best_text_color(
+    background: Color,
+    candidates: Sequence[Color] | None = None,
+    *,
+    version: str | int = DEFAULT_VERSION,
+    cvd: CvdType | None = None,
+) -> str:
+    """Get the candidate color with the highest WCAG contrast ratio to the background.
+
+    Parameters
+    ----------
+    background
+        A color name of the version (e.g. "med_dark" or "fau-med-625"), a hex string, or an RGB tuple.
+    candidates
+        The possible text colors (names, hex strings, or RGB tuples). Defaults to black and white.
+    version
+        The color version used to resolve color names.
+    cvd
+        If provided, the contrast is evaluated for the colors as they appear under the given color vision deficiency.
+
+    Returns
+    -------
+    color
+        The hex value of the best candidate. Results are cached.
+
+    """
+    if cvd is not None and cvd not in CVD_TYPES:
+        raise ValueError(f"Unknown color vision deficiency '{cvd}'. Available are: {', '.join(CVD_TYPES)}.")
+    if not isinstance(background, str):
+        background = tuple(background)
+    if candidates is not None:
+        candidates = tuple(c if isinstance(c, str) else tuple(c) for c in candidates)
+    return _best_text_color(background, normalize_version(version), candidates, cvd)
+
+
+def _max_min_subset(distances: np.ndarray, k: int) -> tuple[int, ...]:
+    """Find the subset of k indices with the largest minimal pairwise distance."""
+    n = len(distances)
+    if k == 1:
+        return (0,)
+    if comb(n, k) <= _MAX_EXHAUSTIVE_COMBINATIONS:
+        candidates = np.array(list(combinations(range(n), k)))
+        first, second = np.triu_indices(k, 1)
+        min_distances = distances[candidates[:, first], candidates[:, second]].min(axis=1)
+        return tuple(candidates[int(np.argmax(min_distances))].tolist())
+    # Greedy farthest point selection starting with the most distant pair
+    first, second = np.unravel_index(np.argmax(distances), distances.shape)
+    selected = [int(first), int(second)]
+    while len(selected) < k:
+        selected.append(int(np.argmax(distances[:, selected].min(axis=1))))
+    return tuple(sorted(selected))
+
+
+@cache
+def _most_distinguishable(k: int, cvd: str | None, version: str, palette: str, metric: str) -> tuple[str, ...]:
+    # The candidates are the distinct colors of the palette itself. Not all of them are part of `color_table` (e.g.
+    # the first color of the 2024 "phil_dark" ramp differs from the "phil_dark" base color).
+    candidates = {}
+    for name, hex_color in zip(palette_color_names(palette, version), PALETTES_HEX[version][palette]):
+        candidates.setdefault(hex_color.upper(), name)
+    matrices = _color_matrices(tuple(candidates.values()), tuple(candidates), cvd)
+    return tuple(matrices.names[i] for i in _max_min_subset(getattr(matrices, metric), k))
+
+
+def most_distinguishable(
+    k: int,
+    cvd: CvdType | None = None,
+    *,
+    version: str | int = DEFAULT_VERSION,
+    palette: str | None = None,
+    metric: DistanceMetric = "ciede2000",
+) -> tuple[str, ...]:
+    """Get the k colors of a palette that are most distinguishable (largest minimal pairwise distance).
+
+    Parameters
+    ----------
+    k
+        The number of colors.
+    cvd
+        If provided, the distances are evaluated for the colors as they appear under the given color vision
+        deficiency.
+    version
+        The color version.
+    palette
+        The palette (from `cmaps` of the version) to choose the colors from.
+        Defaults to "faculties_all" (or "faculties" for 2019).
+    metric
+        The color difference to maximize ("ciede2000" or "oklab").
+
+    Returns
+    -------
+    names
+        The names of the selected colors (in palette order). Results are cached.
+
+    """
+    if cvd is not None and cvd not in CVD_TYPES:
+        raise ValueError(f"Unknown color vision deficiency '{cvd}'. Available are: {', '.join(CVD_TYPES)}.")
+    if metric not in ("ciede2000", "oklab"):
+        raise ValueError(f"Unknown metric '{metric}'. Available are: ciede2000, oklab.")
+    version = normalize_version(version)
+    if palette is None:
+        palette = "faculties_all" if "faculties_all" in PALETTES_HEX[version] else "faculties"
+    palette = resolve_palette_name(palette, version)
+    n_colors = len({hex_color.upper() for hex_color in PALETTES_HEX[version][palette]})
+    if not 1 <= k <= n_colors:
+        raise ValueError(f"`k` must be between 1 and {n_colors} for palette '{palette}'.")
+    return _most_distinguishable(k, cvd, version, palette, metric)
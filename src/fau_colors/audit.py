@@ -0,0 +1,264 @@
+"""Check images and figures for colors that are not part of the FAU corporate design.
+
+The module can be used as library (`audit`, `audit_file`) or from the command line:
+
+.. code-block:: bash
+
+    python -m fau_colors.audit figures/ --version 2024 --tolerance 0.02 --output report.json
+
+For raster images (PNG, JPEG) the share of (non-transparent) pixels and for SVG files the share of fill/stroke color
+definitions is reported, whose color is further away from every palette color than the tolerance (Euclidean distance
+in OKLab).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import re
+import sys
+from collections import Counter, namedtuple
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fau_colors._colorspace import hex_to_rgb, to_rgb_array
+from fau_colors._parallel import imap_bounded, iter_files
+from fau_colors._versions import DEFAULT_VERSION, normalize_version
+from fau_colors.data import PALETTES_RGB, VERSIONS
+from fau_colors.quantization import _nearest_colors, _palette_in_space
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from fau_colors._colorspace import Color
+
+__all__ = ["AuditResult", "audit", "audit_file", "audit_palette", "main"]
+
+RASTER_SUFFIXES = (".png", ".jpg", ".jpeg")
+VECTOR_SUFFIXES = (".svg",)
+
+AuditResult = namedtuple(
+    "AuditResult", ["path", "kind", "n_total", "n_outside", "fraction_outside", "outside_colors", "error"]
+)
+
+# Number of image rows that are converted and checked at once
+_ROWS_PER_STRIP = 256
+_MAX_REPORTED_COLORS = 10
+
+_SVG_COLOR_PATTERN = re.compile(
+    r"(?:fill|stroke|stop-color|flood-color|color)\s*[:=]\s*[\"']?\s*"
+    r"(#[0-9a-fA-F]{6}\b|#[0-9a-fA-F]{3}\b|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)|[a-zA-Z]+)"
+)
+_IGNORED_SVG_VALUES = {"none", "transparent", "currentcolor", "inherit", "url"}
+
+
+def audit_palette(version: str | int = DEFAULT_VERSION, extra_colors: Sequence[Color] = ("#FFFFFF",)) -> np.ndarray:
+    """Get all colors of a version (all colors of all palettes in `cmaps`) plus the extra colors as (n, 3) array.
+
+    For 2024, this includes `colors_all` and all `colors_with_light_levels` ramps.
+    """
+    version = normalize_version(version)
+    colors = {rgb for palette in PALETTES_RGB[version].values() for rgb in palette}
+    colors.update(map(tuple, to_rgb_array(extra_colors).tolist()) if len(extra_colors) else ())
+    return np.array(sorted(colors), dtype=np.float64)
+
+
+def _check_colors(
+    rgb_uint8: np.ndarray, counts: np.ndarray, palette: tuple[tuple[float, ...], ...], tolerance: float
+) -> tuple[int, Counter]:
+    """Count how many of the (unique) colors are outside of the tolerance."""
+    if len(rgb_uint8) == 0:
+        return 0, Counter()
+    _, distances = _nearest_colors(rgb_uint8, _palette_in_space(palette, "oklab"), "oklab")
+    outside = distances > tolerance
+    outside_colors = Counter(
+        {
+            f"#{r:02X}{g:02X}{b:02X}": int(count)
+            for (r, g, b), count in zip(rgb_uint8[outside].tolist(), counts[outside].tolist())
+        }
+    )
+    return int(counts[outside].sum()), outside_colors
+
+
+def _audit_raster(path: Path, palette: tuple[tuple[float, ...], ...], tolerance: float) -> tuple[int, int, Counter]:
+    from PIL import Image
+
+    n_total = n_outside = 0
+    outside_colors: Counter = Counter()
+    # Nested instead of parenthesized context managers, which Python 3.9 does not officially support
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:  # noqa: SIM117
+        with Image.open(mapped) as file_img:
+            img = file_img.convert("RGBA") if file_img.mode != "RGBA" else file_img
+            width, height = img.size
+            for top in range(0, height, _ROWS_PER_STRIP):
+                strip = np.asarray(img.crop((0, top, width, min(top + _ROWS_PER_STRIP, height)))).reshape(-1, 4)
+                strip = strip[strip[:, 3] > 0]
+                # Figures usually contain few distinct colors, so we only check each distinct color once
+                codes = (strip[:, 0].astype(np.uint32) << 16) | (strip[:, 1].astype(np.uint32) << 8) | strip[:, 2]
+                unique_codes, counts = np.unique(codes, return_counts=True)
+                rgb = np.stack([(unique_codes >> 16) & 255, (unique_codes >> 8) & 255, unique_codes & 255], axis=1)
+                strip_outside, strip_colors = _check_colors(rgb.astype(np.uint8), counts, palette, tolerance)
+                n_total += len(strip)
+                n_outside += strip_outside
+                outside_colors.update(strip_colors)
+    return n_total, n_outside, outside_colors
+
+
+def _parse_svg_color(value: str) -> tuple[int, int, int] | None:
+    if value.startswith("#"):
+        return tuple(round(c * 255) for c in hex_to_rgb(value))
+    if value.startswith("rgb("):
+        return tuple(int(c) for c in value[4:-1].split(","))
+    if value.lower() in _IGNORED_SVG_VALUES:
+        return None
+    from matplotlib.colors import CSS4_COLORS
+
+    hex_color = CSS4_COLORS.get(value.lower())
+    return None if hex_color is None else tuple(round(c * 255) for c in hex_to_rgb(hex_color))
+
+
+def _audit_svg(path: Path, palette: tuple[tuple[float, ...], ...], tolerance: float) -> tuple[int, int, Counter]:
+    found: Counter = Counter()
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            for value in _SVG_COLOR_PATTERN.findall(line):
+                rgb = _parse_svg_color(value)
+                if rgb is not None:
+                    found[rgb] += 1
+    rgb = np.array(list(found), dtype=np.uint8).reshape(-1, 3)
+    counts = np.array(list(found.values()), dtype=np.int64)
+    n_outside, outside_colors = _check_colors(rgb, counts, palette, tolerance)
+    return int(counts.sum()), n_outside, outside_colors
+
+
+def _audit_file(path: str, palette: tuple[tuple[float, ...], ...], tolerance: float) -> AuditResult:
+    file_path = Path(path)
+    kind = "svg" if file_path.suffix.lower() in VECTOR_SUFFIXES else "raster"
+    try:
+        audit_func = _audit_svg if kind == "svg" else _audit_raster
+        n_total, n_outside, outside_colors = audit_func(file_path, palette, tolerance)
+    except Exception as e:  # noqa: BLE001
+        return AuditResult(path, kind, 0, 0, 0.0, {}, f"{type(e).__name__}: {e}")
+    return AuditResult(
+        path,
+        kind,
+        n_total,
+        n_outside,
+        n_outside / n_total if n_total else 0.0,
+        dict(outside_colors.most_common(_MAX_REPORTED_COLORS)),
+        None,
+    )
+
+
+def audit_file(
+    path: str | Path,
+    version: str | int = DEFAULT_VERSION,
+    tolerance: float = 0.02,
+    extra_colors: Sequence[Color] = ("#FFFFFF",),
+) -> AuditResult:
+    """Check a single image or SVG file.
+
+    Parameters
+    ----------
+    path
+        The file to check (PNG, JPEG, or SVG).
+    version
+        The color version the file should comply with.
+    tolerance
+        The maximal OKLab distance between a color and its nearest palette color.
+    extra_colors
+        Additional allowed colors (e.g. white backgrounds).
+
+    Returns
+    -------
+    result
+        The number of checked and outside pixels (raster) or color definitions (SVG), the share of outside colors,
+        the most common outside colors, and an error message if the file could not be read.
+
+    """
+    palette = tuple(map(tuple, audit_palette(version, extra_colors).tolist()))
+    return _audit_file(str(path), palette, tolerance)
+
+
+def audit(
+    paths: Iterable[str | Path],
+    version: str | int = DEFAULT_VERSION,
+    tolerance: float = 0.02,
+    extra_colors: Sequence[Color] = ("#FFFFFF",),
+    max_workers: int | None = None,
+) -> Iterator[AuditResult]:
+    """Check all images and SVG files in the given files and directories (recursively).
+
+    The files are processed by a process pool.
+    At most `2 * max_workers` files are queued at any time, so arbitrarily many files can be streamed through.
+    The results are yielded in the order in which the files are finished.
+
+    Parameters
+    ----------
+    paths
+        Files or directories.
+    version, tolerance, extra_colors
+        See `audit_file`.
+    max_workers
+        The number of worker processes. Defaults to the number of CPUs. Use 0 to process all files in this process.
+
+    """
+    palette = tuple(map(tuple, audit_palette(version, extra_colors).tolist()))
+    files = (str(path) for path in iter_files(paths, RASTER_SUFFIXES + VECTOR_SUFFIXES))
+    yield from imap_bounded(_audit_file, files, (palette, tolerance), max_workers)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="fau-colors-audit", description="Check images and SVG files for colors outside of the FAU palettes."
+    )
+    parser.add_argument("paths", nargs="+", help="Files or directories (searched recursively).")
+    parser.add_argument("--version", default=DEFAULT_VERSION, choices=VERSIONS, help="The FAU color version.")
+    parser.add_argument("--tolerance", type=float, default=0.02, help="Maximal OKLab distance to a palette color.")
+    parser.add_argument(
+        "--extra-colors", nargs="*", default=["#FFFFFF"], help="Additional allowed colors (default: white)."
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    parser.add_argument("--output", type=Path, default=None, help="Output file (default: stdout).")
+    parser.add_argument("--jsonl", action="store_true", help="Write one JSON object per file as soon as it is done.")
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        default=None,
+        help="Exit with status 1 if the share of outside colors of any file is larger than this value.",
+    )
+    args = parser.parse_args(argv)
+
+    out = args.output.open("w") if args.output else sys.stdout
+    results = []
+    failed = False
+    try:
+        for result in audit(args.paths, args.version, args.tolerance, args.extra_colors, args.workers):
+            failed |= result.error is not None or (
+                args.fail_above is not None and result.fraction_outside > args.fail_above
+            )
+            if args.jsonl:
+                out.write(json.dumps(result._asdict()) + "\n")
+            else:
+                results.append(result._asdict())
+        if not args.jsonl:
+            report = {
+                "version": args.version,
+                "tolerance": args.tolerance,
+                "n_files": len(results),
+                "n_files_with_outside_colors": sum(r["n_outside"] > 0 for r in results),
+                "files": results,
+            }
+            json.dump(report, out, indent=2)
+            out.write("\n")
+    finally:
+        if args.output:
+            out.close()
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
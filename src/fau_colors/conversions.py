@@ -0,0 +1,286 @@
+"""Vectorized conversions between color spaces for whole arrays and palettes.
+
+All conversions work on arrays of any shape with the color channels in the last dimension (e.g. (n, 3) tables or
+(height, width, 3) images) and on arrays of hex strings of any shape.
+The supported spaces are:
+
+- "hex": "#RRGGBB" strings (also accepts "#RGB" and missing "#" as input)
+- "rgb": float sRGB in [0, 1]
+- "rgb_uint8": uint8 sRGB in [0, 255]
+- "hsl": hue in degrees [0, 360), saturation and lightness in [0, 1]
+- "linear": linear float sRGB
+- "lab": CIELAB (D65)
+- "oklab": OKLab
+- "cmyk": naive (uncalibrated) CMYK in [0, 1] with 4 channels, only an approximation for print
+
+>>> from fau_colors import conversions
+>>> conversions.convert(["#04316A", "#FDB735"], "rgb_uint8")
+array([[  4,  49, 106],
+       [253, 183,  53]], dtype=uint8)
+>>> conversions.convert_palette("faculties", "oklab").shape
+(6, 3)
+
+The conversions of the built-in palettes are computed once per version and space (for all palettes at once) and
+cached.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from fau_colors._colorspace import (
+    lab_to_linear,
+    linear_to_lab,
+    linear_to_oklab,
+    linear_to_srgb,
+    oklab_to_linear,
+    srgb_to_linear,
+)
+from fau_colors._versions import DEFAULT_VERSION, normalize_version, resolve_palette_name
+from fau_colors.data import PALETTES_RGB
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from numpy.typing import ArrayLike
+
+__all__ = ["SPACES", "convert", "convert_palette", "convert_palettes", "hex_to_uint8", "uint8_to_hex"]
+
+SPACES = ("hex", "rgb", "rgb_uint8", "hsl", "linear", "lab", "oklab", "cmyk")
+Space = Literal["hex", "rgb", "rgb_uint8", "hsl", "linear", "lab", "oklab", "cmyk"]
+
+# Spaces that are computed from linear sRGB (converting between them skips the sRGB transfer function)
+_LINEAR_SPACES = ("linear", "lab", "oklab")
+_N_CHANNELS = {"cmyk": 4}
+
+# Value of each hex digit by its code point (255 for invalid characters)
+_HEX_DIGITS = np.full(128, 255, dtype=np.uint8)
+for _i, _c in enumerate("0123456789abcdef"):
+    _HEX_DIGITS[ord(_c)] = _HEX_DIGITS[ord(_c.upper())] = _i
+_HEX_BYTES = np.array([f"{i:02X}" for i in range(256)])
+# Expands the digits of "RGB" to "RRGGBB"
+_SHORT_HEX_INDEX = np.array([0, 0, 1, 1, 2, 2])
+
+
+def hex_to_uint8(colors: ArrayLike) -> np.ndarray:
+    """Convert an array of hex strings to uint8 RGB values with shape `(*colors.shape, 3)`."""
+    colors = np.asarray(colors, dtype=np.str_)
+    # A 0-d array (a single string) can not be viewed as array of characters
+    values = np.char.lstrip(np.atleast_1d(colors), "#")
+    lengths = np.char.str_len(values)
+    invalid = (lengths != 6) & (lengths != 3)
+    # Each character of a (native byte order) unicode array is one uint32
+    codes = values.astype("U6").view(np.uint32).reshape(*values.shape, 6)
+    digits = _HEX_DIGITS[np.minimum(codes, 127)]
+    digits = np.where((lengths == 3)[..., None], digits[..., _SHORT_HEX_INDEX], digits)
+    invalid |= np.any(digits == 255, axis=-1)
+    if np.any(invalid):
+        raise ValueError(f"Invalid hex color '{np.atleast_1d(colors)[invalid][0]}'.")
+    return (digits[..., 0::2] * 16 + digits[..., 1::2]).astype(np.uint8).reshape(*colors.shape, 3)
+
+
+def uint8_to_hex(rgb: ArrayLike) -> np.ndarray:
+    """Convert uint8 RGB values to an array of "#RRGGBB" strings with shape `rgb.shape[:-1]`."""
+    rgb = np.asarray(rgb, dtype=np.uint8)
+    hex_bytes = _HEX_BYTES[rgb]
+    return np.char.add(np.char.add(np.char.add("#", hex_bytes[..., 0]), hex_bytes[..., 1]), hex_bytes[..., 2])
+
+
+def _rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    max_c = rgb.max(axis=-1)
+    min_c = rgb.min(axis=-1)
+    delta = max_c - min_c
+    lightness = (max_c + min_c) / 2
+    gray = delta == 0
+    # Avoids divisions by zero for gray colors (their hue and saturation are 0)
+    safe_delta = np.where(gray, 1, delta)
+    saturation = np.where(gray, 0, delta / np.maximum(1 - np.abs(2 * lightness - 1), np.finfo(np.float64).eps))
+    r, g, b = np.moveaxis(rgb, -1, 0)
+    hue = np.select(
+        [gray, max_c == r, max_c == g],
+        [0, (g - b) / safe_delta, (b - r) / safe_delta + 2],
+        (r - g) / safe_delta + 4,
+    )
+    return np.stack([(hue * 60) % 360, np.minimum(saturation, 1), lightness], axis=-1)
+
+
+def _hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    hue, saturation, lightness = (hsl[..., i, None] for i in range(3))
+    k = (np.array([0, 8, 4]) + hue / 30) % 12
+    a = saturation * np.minimum(lightness, 1 - lightness)
+    return lightness - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+
+
+def _rgb_to_cmyk(rgb: np.ndarray) -> np.ndarray:
+    black = 1 - rgb.max(axis=-1, keepdims=True)
+    # Pure black has no defined cmy values, they are set to 0
+    scale = np.where(black < 1, 1 - black, 1)
+    cmy = np.where(black < 1, (1 - rgb - black) / scale, 0)
+    return np.concatenate([cmy, black], axis=-1)
+
+
+def _cmyk_to_rgb(cmyk: np.ndarray) -> np.ndarray:
+    return (1 - cmyk[..., :3]) * (1 - cmyk[..., 3:])
+
+
+@cache
+def _srgb8_to_linear() -> np.ndarray:
+    return srgb_to_linear(np.arange(256) / 255)
+
+
+def _check_channels(values: np.ndarray, space: str) -> np.ndarray:
+    n_channels = _N_CHANNELS.get(space, 3)
+    if values.ndim == 0 or values.shape[-1] != n_channels:
+        raise ValueError(
+            f"'{space}' colors need {n_channels} channels in the last dimension, got shape {values.shape}."
+        )
+    return values
+
+
+def _as_uint8(colors: ArrayLike) -> np.ndarray:
+    values = np.asarray(colors)
+    if values.dtype != np.uint8:
+        if values.size and (values.min() < 0 or values.max() > 255):
+            raise ValueError("'rgb_uint8' colors must be in the range [0, 255].")
+        values = values.astype(np.uint8)
+    return _check_channels(values, "rgb_uint8")
+
+
+def _to_linear(colors: ArrayLike, space: str) -> np.ndarray:
+    if space == "hex":
+        return _srgb8_to_linear()[hex_to_uint8(colors)]
+    if space == "rgb_uint8":
+        return _srgb8_to_linear()[_as_uint8(colors)]
+    if space not in _LINEAR_SPACES:
+        return srgb_to_linear(_to_rgb(colors, space))
+    values = _check_channels(np.asarray(colors, dtype=np.float64), space)
+    if space == "lab":
+        return lab_to_linear(values)
+    if space == "oklab":
+        return oklab_to_linear(values)
+    return values
+
+
+def _to_rgb(colors: ArrayLike, space: str) -> np.ndarray:
+    if space == "hex":
+        return hex_to_uint8(colors) / 255
+    if space in _LINEAR_SPACES:
+        return linear_to_srgb(_to_linear(colors, space))
+    if space == "rgb_uint8":
+        return _as_uint8(colors) / 255
+    values = _check_channels(np.asarray(colors, dtype=np.float64), space)
+    if space == "hsl":
+        return _hsl_to_rgb(values)
+    if space == "cmyk":
+        return _cmyk_to_rgb(values)
+    return values
+
+
+def _from_linear(linear: np.ndarray, space: str) -> np.ndarray:
+    if space == "lab":
+        return linear_to_lab(linear)
+    if space == "oklab":
+        return linear_to_oklab(linear)
+    if space == "linear":
+        return linear
+    return _from_rgb(linear_to_srgb(linear), space)
+
+
+def _from_rgb(rgb: np.ndarray, space: str) -> np.ndarray:
+    if space in ("hex", "rgb_uint8"):
+        rgb_uint8 = np.round(np.clip(rgb, 0, 1) * 255).astype(np.uint8)
+        return uint8_to_hex(rgb_uint8) if space == "hex" else rgb_uint8
+    if space == "hsl":
+        return _rgb_to_hsl(rgb)
+    if space == "cmyk":
+        return _rgb_to_cmyk(rgb)
+    if space in _LINEAR_SPACES:
+        return _from_linear(srgb_to_linear(rgb), space)
+    return rgb
+
+
+def _infer_space(colors: ArrayLike) -> str:
+    values = np.asarray(colors)
+    if values.dtype.kind in "US":
+        return "hex"
+    # Integers are 0-255 values (e.g. [[4, 49, 106]]), not float values in [0, 1]
+    return "rgb_uint8" if values.dtype.kind in "iu" else "rgb"
+
+
+def _check_space(space: str) -> None:
+    if space not in SPACES:
+        raise ValueError(f"Unknown color space '{space}'. Available spaces are: {', '.join(SPACES)}.")
+
+
+def convert(colors: ArrayLike, to: Space, source: Space | None = None) -> np.ndarray:
+    """Convert an array of colors to another color space.
+
+    Parameters
+    ----------
+    colors
+        The colors with the channels in the last dimension (e.g. shape (n, 3) or (height, width, 3)) or hex strings.
+    to
+        The target space (one of `SPACES`).
+    source
+        The space of `colors`. By default, it is "hex" for strings, "rgb_uint8" for integers (values between 0 and
+        255), and "rgb" otherwise.
+
+    Returns
+    -------
+    colors
+        The converted colors as float64 array, as uint8 array for "rgb_uint8" (values outside the sRGB gamut are
+        clipped), or as array of strings for "hex" (with the shape of the input without the channels).
+
+    """
+    source = _infer_space(colors) if source is None else source
+    _check_space(source)
+    _check_space(to)
+    if to in _LINEAR_SPACES:
+        return _from_linear(_to_linear(colors, source), to)
+    return _from_rgb(_to_rgb(colors, source), to)
+
+
+@cache
+def _convert_palettes(version: str, space: str) -> Mapping[str, np.ndarray]:
+    palettes = PALETTES_RGB[version]
+    # All palettes of a version are converted in a single call
+    rgb = np.concatenate([np.asarray(colors, dtype=np.float64) for colors in palettes.values()])
+    converted = convert(rgb, space, "rgb")
+    converted.setflags(write=False)
+    offsets = np.cumsum([len(colors) for colors in palettes.values()])[:-1]
+    return MappingProxyType(dict(zip(palettes, np.split(converted, offsets))))
+
+
+def convert_palettes(to: Space, version: str | int = DEFAULT_VERSION) -> Mapping[str, np.ndarray]:
+    """Get all palettes of a version (as in `cmaps`) in another color space.
+
+    The arrays are computed once per version and space and are read-only.
+
+    Parameters
+    ----------
+    to
+        The target space (one of `SPACES`).
+    version
+        The color version.
+
+    Returns
+    -------
+    palettes
+        The converted colors of each palette (see `convert` for their dtype).
+
+    """
+    _check_space(to)
+    return _convert_palettes(normalize_version(version), to)
+
+
+def convert_palette(palette: str, to: Space, version: str | int = DEFAULT_VERSION) -> np.ndarray:
+    """Get a palette (as in `cmaps`) in another color space.
+
+    See `convert_palettes` for details.
+    """
+    version = normalize_version(version)
+    return convert_palettes(to, version)[resolve_palette_name(palette, version)]
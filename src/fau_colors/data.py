@@ -0,0 +1,1255 @@
+"""Precomputed color values of all FAU color versions.
+
+This module only contains plain Python constants and can be imported without numpy, matplotlib, or seaborn.
+It is generated from `fau_colors.v2019`, `fau_colors.v2021`, and `fau_colors.v2024` by running
+`poe update_data`. Do not edit it manually.
+"""
+
+VERSIONS = ("2019", "2021", "2024")
+
+COLORS = {
+    "2019": {
+        "fau": "#003865",
+        "tech": "#98a4ae",
+        "phil": "#c99313",
+        "med": "#00b1eb",
+        "nat": "#009b77",
+        "wiso": "#8d1429",
+    },
+    "2021": {
+        "fau": "#002F6C",
+        "tech": "#779FB5",
+        "phil": "#FFB81C",
+        "med": "#00A3E0",
+        "nat": "#43B02A",
+        "wiso": "#C8102E",
+    },
+    "2024": {
+        "fau": "#04316A",
+        "tech": "#8C9FB1",
+        "phil": "#FDB735",
+        "med": "#18B4F1",
+        "nat": "#7BB725",
+        "wiso": "#C50F3C",
+    },
+}
+
+COLORS_DARK = {
+    "2021": {
+        "fau": "#041E42",
+        "tech": "#41748D",
+        "phil": "#E87722",
+        "med": "#0061A0",
+        "nat": "#228848",
+        "wiso": "#971B2F",
+    },
+    "2024": {
+        "fau": "#041E42",
+        "tech": "#2F586E",
+        "phil": "#E87722",
+        "med": "#005287",
+        "nat": "#266141",
+        "wiso": "#971B2F",
+    },
+}
+
+COLORS_LIGHT = {
+    "2021": {
+        "fau": "#5F7CA3",
+        "tech": "#AAC3D1",
+        "phil": "#FFD271",
+        "med": "#5FC5EC",
+        "nat": "#89CD79",
+        "wiso": "#DC697C",
+    }
+}
+
+COLORS_ALL = {
+    "2021": {
+        "fau": "#002F6C",
+        "fau_dark": "#041E42",
+        "fau_light": "#5F7CA3",
+        "tech": "#779FB5",
+        "tech_dark": "#41748D",
+        "tech_light": "#AAC3D1",
+        "phil": "#FFB81C",
+        "phil_dark": "#E87722",
+        "phil_light": "#FFD271",
+        "med": "#00A3E0",
+        "med_dark": "#0061A0",
+        "med_light": "#5FC5EC",
+        "nat": "#43B02A",
+        "nat_dark": "#228848",
+        "nat_light": "#89CD79",
+        "wiso": "#C8102E",
+        "wiso_dark": "#971B2F",
+        "wiso_light": "#DC697C",
+    },
+    "2024": {
+        "fau": "#04316A",
+        "fau_dark": "#041E42",
+        "tech": "#8C9FB1",
+        "tech_dark": "#2F586E",
+        "phil": "#FDB735",
+        "phil_dark": "#E87722",
+        "med": "#18B4F1",
+        "med_dark": "#005287",
+        "nat": "#7BB725",
+        "nat_dark": "#266141",
+        "wiso": "#C50F3C",
+        "wiso_dark": "#971B2F",
+        "black": "#000000",
+    },
+}
+
+COLORS_WITH_LIGHT_LEVELS = {
+    "2024": {
+        "fau": ("#04316A", "#617DA1", "#A0B1C6", "#C0CBDA", "#D3DCF2"),
+        "fau-dark": ("#041E42", "#617188", "#A0A9B7", "#C0C7D0", "#DFE2E7"),
+        "tech": ("#8C9FB1", "#B6C2CE", "#D3DAE1", "#E2E7EB", "#EBF5F7"),
+        "tech-dark": ("#2F586E", "#7C96A3", "#B0BFC8", "#CBD5DB", "#E4E9EC"),
+        "phil": ("#FDB735", "#FECE76", "#FEE4B2", "#FEEDCC", "#FFF5E0"),
+        "phil-dark": ("#EB7722", "#EFA369", "#F6CBAB", "#F9DDC8", "#FCEDE2"),
+        "med": ("#18B4F1", "#6DD0F6", "#A7E2FA", "#C5ECFB", "#E3FAFC"),
+        "med-dark": ("#005287", "#5E92B3", "#9EBDD1", "#BFD4E1", "#DEE9EF"),
+        "nat": ("#7BB725", "#ACD275", "#CDE4AC", "#DEEDC8", "#E6FCDC"),
+        "nat-dark": ("#266141", "#769B87", "#ACC3B7", "#C9D7CF", "#E3EBE6"),
+        "wiso": ("#C50F3C", "#DD737C", "#EBABAE", "#F1C8C9", "#FCDCE3"),
+        "wiso-dark": ("#971B2F", "#BE717D", "#D8A9B1", "#E6C6CB", "#F2E2E5"),
+        "black": ("#000000", "#5E5E5E", "#9E9E9E", "#BFBFBF", "#DEDEDE"),
+    }
+}
+
+PALETTE_NAMES = {
+    "2021": {
+        "faculties": ("fau-fau", "fau-tech", "fau-phil", "fau-med", "fau-nat", "fau-wiso"),
+        "faculties_dark": (
+            "fau-fau-dark",
+            "fau-tech-dark",
+            "fau-phil-dark",
+            "fau-med-dark",
+            "fau-nat-dark",
+            "fau-wiso-dark",
+        ),
+        "faculties_light": (
+            "fau-fau-light",
+            "fau-tech-light",
+            "fau-phil-light",
+            "fau-med-light",
+            "fau-nat-light",
+            "fau-wiso-light",
+        ),
+        "faculties_all": (
+            "fau-fau",
+            "fau-fau-dark",
+            "fau-fau-light",
+            "fau-tech",
+            "fau-tech-dark",
+            "fau-tech-light",
+            "fau-phil",
+            "fau-phil-dark",
+            "fau-phil-light",
+            "fau-med",
+            "fau-med-dark",
+            "fau-med-light",
+            "fau-nat",
+            "fau-nat-dark",
+            "fau-nat-light",
+            "fau-wiso",
+            "fau-wiso-dark",
+            "fau-wiso-light",
+        ),
+        "fau": ("fau-fau", "fau-fau-625", "fau-fau-375", "fau-fau-250", "fau-fau-125"),
+        "fau_dark": ("fau-fau-dark", "fau-fau-dark-625", "fau-fau-dark-375", "fau-fau-dark-250", "fau-fau-dark-125"),
+        "fau_light": (
+            "fau-fau-light",
+            "fau-fau-light-625",
+            "fau-fau-light-375",
+            "fau-fau-light-250",
+            "fau-fau-light-125",
+        ),
+        "tech": ("fau-tech", "fau-tech-625", "fau-tech-375", "fau-tech-250", "fau-tech-125"),
+        "tech_dark": (
+            "fau-tech-dark",
+            "fau-tech-dark-625",
+            "fau-tech-dark-375",
+            "fau-tech-dark-250",
+            "fau-tech-dark-125",
+        ),
+        "tech_light": (
+            "fau-tech-light",
+            "fau-tech-light-625",
+            "fau-tech-light-375",
+            "fau-tech-light-250",
+            "fau-tech-light-125",
+        ),
+        "phil": ("fau-phil", "fau-phil-625", "fau-phil-375", "fau-phil-250", "fau-phil-125"),
+        "phil_dark": (
+            "fau-phil-dark",
+            "fau-phil-dark-625",
+            "fau-phil-dark-375",
+            "fau-phil-dark-250",
+            "fau-phil-dark-125",
+        ),
+        "phil_light": (
+            "fau-phil-light",
+            "fau-phil-light-625",
+            "fau-phil-light-375",
+            "fau-phil-light-250",
+            "fau-phil-light-125",
+        ),
+        "med": ("fau-med", "fau-med-625", "fau-med-375", "fau-med-250", "fau-med-125"),
+        "med_dark": ("fau-med-dark", "fau-med-dark-625", "fau-med-dark-375", "fau-med-dark-250", "fau-med-dark-125"),
+        "med_light": (
+            "fau-med-light",
+            "fau-med-light-625",
+            "fau-med-light-375",
+            "fau-med-light-250",
+            "fau-med-light-125",
+        ),
+        "nat": ("fau-nat", "fau-nat-625", "fau-nat-375", "fau-nat-250", "fau-nat-125"),
+        "nat_dark": ("fau-nat-dark", "fau-nat-dark-625", "fau-nat-dark-375", "fau-nat-dark-250", "fau-nat-dark-125"),
+        "nat_light": (
+            "fau-nat-light",
+            "fau-nat-light-625",
+            "fau-nat-light-375",
+            "fau-nat-light-250",
+            "fau-nat-light-125",
+        ),
+        "wiso": ("fau-wiso", "fau-wiso-625", "fau-wiso-375", "fau-wiso-250", "fau-wiso-125"),
+        "wiso_dark": (
+            "fau-wiso-dark",
+            "fau-wiso-dark-625",
+            "fau-wiso-dark-375",
+            "fau-wiso-dark-250",
+            "fau-wiso-dark-125",
+        ),
+        "wiso_light": (
+            "fau-wiso-light",
+            "fau-wiso-light-625",
+            "fau-wiso-light-375",
+            "fau-wiso-light-250",
+            "fau-wiso-light-125",
+        ),
+    },
+    "2024": {
+        "faculties": ("fau-fau", "fau-tech", "fau-phil", "fau-med", "fau-nat", "fau-wiso"),
+        "faculties_dark": (
+            "fau-fau-dark",
+            "fau-tech-dark",
+            "fau-phil-dark",
+            "fau-med-dark",
+            "fau-nat-dark",
+            "fau-wiso-dark",
+        ),
+        "faculties_light": (
+            "fau-fau-light",
+            "fau-tech-light",
+            "fau-phil-light",
+            "fau-med-light",
+            "fau-nat-light",
+            "fau-wiso-light",
+        ),
+        "faculties_all": (
+            "fau-fau",
+            "fau-fau_dark",
+            "fau-tech",
+            "fau-tech_dark",
+            "fau-phil",
+            "fau-phil_dark",
+            "fau-med",
+            "fau-med_dark",
+            "fau-nat",
+            "fau-nat_dark",
+            "fau-wiso",
+            "fau-wiso_dark",
+            "fau-black",
+        ),
+        "fau": ("fau-fau", "fau-fau-625", "fau-fau-375", "fau-fau-250", "fau-fau-125"),
+        "fau_dark": ("fau-fau-dark", "fau-fau-dark-625", "fau-fau-dark-375", "fau-fau-dark-250", "fau-fau-dark-125"),
+        "tech": ("fau-tech", "fau-tech-625", "fau-tech-375", "fau-tech-250", "fau-tech-125"),
+        "tech_dark": (
+            "fau-tech-dark",
+            "fau-tech-dark-625",
+            "fau-tech-dark-375",
+            "fau-tech-dark-250",
+            "fau-tech-dark-125",
+        ),
+        "phil": ("fau-phil", "fau-phil-625", "fau-phil-375", "fau-phil-250", "fau-phil-125"),
+        "phil_dark": (
+            "fau-phil-dark",
+            "fau-phil-dark-625",
+            "fau-phil-dark-375",
+            "fau-phil-dark-250",
+            "fau-phil-dark-125",
+        ),
+        "med": ("fau-med", "fau-med-625", "fau-med-375", "fau-med-250", "fau-med-125"),
+        "med_dark": ("fau-med-dark", "fau-med-dark-625", "fau-med-dark-375", "fau-med-dark-250", "fau-med-dark-125"),
+        "nat": ("fau-nat", "fau-nat-625", "fau-nat-375", "fau-nat-250", "fau-nat-125"),
+        "nat_dark": ("fau-nat-dark", "fau-nat-dark-625", "fau-nat-dark-375", "fau-nat-dark-250", "fau-nat-dark-125"),
+        "wiso": ("fau-wiso", "fau-wiso-625", "fau-wiso-375", "fau-wiso-250", "fau-wiso-125"),
+        "wiso_dark": (
+            "fau-wiso-dark",
+            "fau-wiso-dark-625",
+            "fau-wiso-dark-375",
+            "fau-wiso-dark-250",
+            "fau-wiso-dark-125",
+        ),
+        "black": ("fau-black", "fau-black-625", "fau-black-375", "fau-black-250", "fau-black-125"),
+        "faculties_625": (
+            "fau-faculties-625",
+            "fau-faculties-625-625",
+            "fau-faculties-625-375",
+            "fau-faculties-625-250",
+            "fau-faculties-625-125",
+        ),
+        "faculties_375": (
+            "fau-faculties-375",
+            "fau-faculties-375-625",
+            "fau-faculties-375-375",
+            "fau-faculties-375-250",
+            "fau-faculties-375-125",
+        ),
+        "faculties_250": (
+            "fau-faculties-250",
+            "fau-faculties-250-625",
+            "fau-faculties-250-375",
+            "fau-faculties-250-250",
+            "fau-faculties-250-125",
+        ),
+        "faculties_125": (
+            "fau-faculties-125",
+            "fau-faculties-125-625",
+            "fau-faculties-125-375",
+            "fau-faculties-125-250",
+            "fau-faculties-125-125",
+        ),
+        "faculties_dark_625": (
+            "fau-faculties-dark-625",
+            "fau-faculties-dark-625-625",
+            "fau-faculties-dark-625-375",
+            "fau-faculties-dark-625-250",
+            "fau-faculties-dark-625-125",
+        ),
+        "faculties_dark_375": (
+            "fau-faculties-dark-375",
+            "fau-faculties-dark-375-625",
+            "fau-faculties-dark-375-375",
+            "fau-faculties-dark-375-250",
+            "fau-faculties-dark-375-125",
+        ),
+        "faculties_dark_250": (
+            "fau-faculties-dark-250",
+            "fau-faculties-dark-250-625",
+            "fau-faculties-dark-250-375",
+            "fau-faculties-dark-250-250",
+            "fau-faculties-dark-250-125",
+        ),
+        "faculties_dark_125": (
+            "fau-faculties-dark-125",
+            "fau-faculties-dark-125-625",
+            "fau-faculties-dark-125-375",
+            "fau-faculties-dark-125-250",
+            "fau-faculties-dark-125-125",
+        ),
+    },
+}
+
+PALETTES_HEX = {
+    "2019": {
+        "faculties": ("#003865", "#98A4AE", "#C99313", "#00B1EB", "#009B77", "#8D1429"),
+        "fau": ("#003865", "#5F829E", "#9FB4C5", "#BFCDD8", "#DFE6EC"),
+        "tech": ("#98A4AE", "#BEC6CC", "#D8DDE1", "#E5E8EB", "#F2F4F5"),
+        "phil": ("#C99313", "#DDBB6B", "#EBD6A6", "#F1E4C4", "#F8F1E1"),
+        "med": ("#00B1EB", "#5FCEF2", "#9FE2F7", "#BFEBFA", "#DFF5FC"),
+        "nat": ("#009B77", "#5FC0AA", "#9FD9CC", "#BFE6DD", "#DFF2EE"),
+        "wiso": ("#8D1429", "#B76C79", "#D4A7AE", "#E2C4C9", "#F1E2E4"),
+    },
+    "2021": {
+        "faculties": ("#002F6C", "#779FB5", "#FFB81C", "#00A3E0", "#43B02A", "#C8102E"),
+        "faculties_dark": ("#041E42", "#41748D", "#E87722", "#0061A0", "#228848", "#971B2F"),
+        "faculties_light": ("#5F7CA3", "#AAC3D1", "#FFD271", "#5FC5EC", "#89CD79", "#DC697C"),
+        "faculties_all": (
+            "#002F6C",
+            "#041E42",
+            "#5F7CA3",
+            "#779FB5",
+            "#41748D",
+            "#AAC3D1",
+            "#FFB81C",
+            "#E87722",
+            "#FFD271",
+            "#00A3E0",
+            "#0061A0",
+            "#5FC5EC",
+            "#43B02A",
+            "#228848",
+            "#89CD79",
+            "#C8102E",
+            "#971B2F",
+            "#DC697C",
+        ),
+        "fau": ("#002F6C", "#5F7CA3", "#9FB1C8", "#BFCBDA", "#DFE5ED"),
+        "fau_dark": ("#041E42", "#627288", "#A1AAB8", "#C0C7D0", "#E0E3E7"),
+        "fau_light": ("#5F7CA3", "#9BADC5", "#C3CEDC", "#D7DEE8", "#EBEFF3"),
+        "tech": ("#779FB5", "#AAC3D1", "#CCDBE3", "#DDE7EC", "#EEF3F6"),
+        "tech_dark": ("#41748D", "#88A8B7", "#B7CBD4", "#CFDCE2", "#E7EEF1"),
+        "tech_light": ("#AAC3D1", "#CAD9E2", "#DFE8EE", "#EAF0F3", "#F4F7F9"),
+        "phil": ("#FFB81C", "#FFD271", "#FFE4AA", "#FFEDC6", "#FFF6E3"),
+        "phil_dark": ("#E87722", "#F1AA74", "#F6CCAC", "#F9DDC8", "#FCEEE3"),
+        "phil_light": ("#FFD271", "#FFE3A6", "#FFEECA", "#FFF4DB", "#FFF9ED"),
+        "med": ("#00A3E0", "#5FC5EC", "#9FDCF3", "#BFE8F7", "#DFF3FB"),
+        "med_dark": ("#0061A0", "#5F9CC3", "#9FC4DB", "#BFD7E7", "#DFEBF3"),
+        "med_light": ("#5FC5EC", "#9BDBF3", "#C3E9F8", "#D7F0FA", "#EBF8FD"),
+        "nat": ("#43B02A", "#89CD79", "#B8E1AF", "#D0EBCA", "#E7F5E4"),
+        "nat_dark": ("#228848", "#74B48C", "#ACD2BA", "#C8E1D1", "#E3F0E8"),
+        "nat_light": ("#89CD79", "#B5E0AB", "#D3ECCD", "#E1F2DD", "#F0F9EE"),
+        "wiso": ("#C8102E", "#DC697C", "#EAA5B0", "#F1C3CB", "#F8E1E5"),
+        "wiso_dark": ("#971B2F", "#BE707C", "#D8A9B1", "#E5C6CB", "#F2E2E5"),
+        "wiso_light": ("#DC697C", "#E9A1AD", "#F2C7CE", "#F6D9DE", "#FBECEF"),
+    },
+    "2024": {
+        "faculties": ("#04316A", "#8C9FB1", "#FDB735", "#18B4F1", "#7BB725", "#C50F3C"),
+        "faculties_dark": ("#041E42", "#2F586E", "#E87722", "#005287", "#266141", "#971B2F"),
+        "faculties_light": ("#617DA1", "#B6C2CE", "#FECE76", "#6DD0F6", "#ACD275", "#DD737C"),
+        "faculties_all": (
+            "#04316A",
+            "#041E42",
+            "#8C9FB1",
+            "#2F586E",
+            "#FDB735",
+            "#E87722",
+            "#18B4F1",
+            "#005287",
+            "#7BB725",
+            "#266141",
+            "#C50F3C",
+            "#971B2F",
+            "#000000",
+        ),
+        "fau": ("#04316A", "#617DA1", "#A0B1C6", "#C0CBDA", "#D3DCF2"),
+        "fau_dark": ("#041E42", "#617188", "#A0A9B7", "#C0C7D0", "#DFE2E7"),
+        "tech": ("#8C9FB1", "#B6C2CE", "#D3DAE1", "#E2E7EB", "#EBF5F7"),
+        "tech_dark": ("#2F586E", "#7C96A3", "#B0BFC8", "#CBD5DB", "#E4E9EC"),
+        "phil": ("#FDB735", "#FECE76", "#FEE4B2", "#FEEDCC", "#FFF5E0"),
+        "phil_dark": ("#EB7722", "#EFA369", "#F6CBAB", "#F9DDC8", "#FCEDE2"),
+        "med": ("#18B4F1", "#6DD0F6", "#A7E2FA", "#C5ECFB", "#E3FAFC"),
+        "med_dark": ("#005287", "#5E92B3", "#9EBDD1", "#BFD4E1", "#DEE9EF"),
+        "nat": ("#7BB725", "#ACD275", "#CDE4AC", "#DEEDC8", "#E6FCDC"),
+        "nat_dark": ("#266141", "#769B87", "#ACC3B7", "#C9D7CF", "#E3EBE6"),
+        "wiso": ("#C50F3C", "#DD737C", "#EBABAE", "#F1C8C9", "#FCDCE3"),
+        "wiso_dark": ("#971B2F", "#BE717D", "#D8A9B1", "#E6C6CB", "#F2E2E5"),
+        "black": ("#000000", "#5E5E5E", "#9E9E9E", "#BFBFBF", "#DEDEDE"),
+        "faculties_625": ("#617DA1", "#B6C2CE", "#FECE76", "#6DD0F6", "#ACD275", "#DD737C"),
+        "faculties_375": ("#A0B1C6", "#D3DAE1", "#FEE4B2", "#A7E2FA", "#CDE4AC", "#EBABAE"),
+        "faculties_250": ("#C0CBDA", "#E2E7EB", "#FEEDCC", "#C5ECFB", "#DEEDC8", "#F1C8C9"),
+        "faculties_125": ("#D3DCF2", "#EBF5F7", "#FFF5E0", "#E3FAFC", "#E6FCDC", "#FCDCE3"),
+        "faculties_dark_625": ("#617188", "#7C96A3", "#EFA369", "#5E92B3", "#769B87", "#BE717D"),
+        "faculties_dark_375": ("#A0A9B7", "#B0BFC8", "#F6CBAB", "#9EBDD1", "#ACC3B7", "#D8A9B1"),
+        "faculties_dark_250": ("#C0C7D0", "#CBD5DB", "#F9DDC8", "#BFD4E1", "#C9D7CF", "#E6C6CB"),
+        "faculties_dark_125": ("#DFE2E7", "#E4E9EC", "#FCEDE2", "#DEE9EF", "#E3EBE6", "#F2E2E5"),
+    },
+}
+
+PALETTES_RGB = {
+    "2019": {
+        "faculties": (
+            (0.0, 0.2196078431372549, 0.396078431372549),
+            (0.596078431372549, 0.6431372549019608, 0.6823529411764706),
+            (0.788235294117647, 0.5764705882352941, 0.07450980392156863),
+            (0.0, 0.6941176470588235, 0.9215686274509803),
+            (0.0, 0.6078431372549019, 0.4666666666666667),
+            (0.5529411764705883, 0.0784313725490196, 0.1607843137254902),
+        ),
+        "fau": (
+            (0.0, 0.2196078431372549, 0.396078431372549),
+            (0.37254901960784315, 0.5103421760861206, 0.6210688196847366),
+            (0.6235294117647059, 0.7062053056516724, 0.772641291810842),
+            (0.7490196078431373, 0.8041368704344483, 0.8484275278738946),
+            (0.8745098039215686, 0.9020684352172241, 0.9242137639369473),
+        ),
+        "tech": (
+            (0.596078431372549, 0.6431372549019608, 0.6823529411764706),
+            (0.7465590157631681, 0.7760861207227989, 0.8006920415224914),
+            (0.8479354094579008, 0.8656516724336794, 0.8804152249134948),
+            (0.8986236063052672, 0.9104344482891196, 0.9202768166089965),
+            (0.9493118031526336, 0.9552172241445598, 0.9601384083044983),
+        ),
+        "phil": (
+            (0.788235294117647, 0.5764705882352941, 0.07450980392156863),
+            (0.8671280276816609, 0.7342560553633217, 0.4193002691272587),
+            (0.9202768166089965, 0.840553633217993, 0.6515801614763552),
+            (0.9468512110726643, 0.8937024221453287, 0.7677201076509035),
+            (0.9734256055363322, 0.9468512110726643, 0.8838600538254517),
+        ),
+        "med": (
+            (0.0, 0.6941176470588235, 0.9215686274509803),
+            (0.37254901960784315, 0.8080738177623991, 0.9507881584006151),
+            (0.6235294117647059, 0.8848442906574394, 0.970472895040369),
+            (0.7490196078431373, 0.9232295271049596, 0.9803152633602461),
+            (0.8745098039215686, 0.9616147635524798, 0.990157631680123),
+        ),
+        "nat": (
+            (0.0, 0.6078431372549019, 0.4666666666666667),
+            (0.37254901960784315, 0.7539407920030757, 0.6653594771241831),
+            (0.6235294117647059, 0.8523644752018454, 0.7992156862745098),
+            (0.7490196078431373, 0.9015763168012303, 0.8661437908496732),
+            (0.8745098039215686, 0.9507881584006151, 0.9330718954248366),
+        ),
+        "wiso": (
+            (0.5529411764705883, 0.0784313725490196, 0.1607843137254902),
+            (0.7194925028835064, 0.421760861207228, 0.47343329488658203),
+            (0.8316955017301038, 0.6530565167243367, 0.6840599769319493),
+            (0.8877970011534025, 0.7687043444828912, 0.7893733179546328),
+            (0.9438985005767013, 0.8843521722414456, 0.8946866589773164),
+        ),
+    },
+    "2021": {
+        "faculties": (
+            (0.0, 0.1843137254901961, 0.4235294117647059),
+            (0.4666666666666667, 0.6235294117647059, 0.7098039215686275),
+            (1.0, 0.7215686274509804, 0.10980392156862745),
+            (0.0, 0.6392156862745098, 0.8784313725490196),
+            (0.2627450980392157, 0.6901960784313725, 0.16470588235294117),
+            (0.7843137254901961, 0.06274509803921569, 0.1803921568627451),
+        ),
+        "faculties_dark": (
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.2549019607843137, 0.4549019607843137, 0.5529411764705883),
+            (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+            (0.0, 0.3803921568627451, 0.6274509803921569),
+            (0.13333333333333333, 0.5333333333333333, 0.2823529411764706),
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+        ),
+        "faculties_light": (
+            (0.37254901960784315, 0.48627450980392156, 0.6392156862745098),
+            (0.6666666666666666, 0.7647058823529411, 0.8196078431372549),
+            (1.0, 0.8235294117647058, 0.44313725490196076),
+            (0.37254901960784315, 0.7725490196078432, 0.9254901960784314),
+            (0.5372549019607843, 0.803921568627451, 0.4745098039215686),
+            (0.8627450980392157, 0.4117647058823529, 0.48627450980392156),
+        ),
+        "faculties_all": (
+            (0.0, 0.1843137254901961, 0.4235294117647059),
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.37254901960784315, 0.48627450980392156, 0.6392156862745098),
+            (0.4666666666666667, 0.6235294117647059, 0.7098039215686275),
+            (0.2549019607843137, 0.4549019607843137, 0.5529411764705883),
+            (0.6666666666666666, 0.7647058823529411, 0.8196078431372549),
+            (1.0, 0.7215686274509804, 0.10980392156862745),
+            (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+            (1.0, 0.8235294117647058, 0.44313725490196076),
+            (0.0, 0.6392156862745098, 0.8784313725490196),
+            (0.0, 0.3803921568627451, 0.6274509803921569),
+            (0.37254901960784315, 0.7725490196078432, 0.9254901960784314),
+            (0.2627450980392157, 0.6901960784313725, 0.16470588235294117),
+            (0.13333333333333333, 0.5333333333333333, 0.2823529411764706),
+            (0.5372549019607843, 0.803921568627451, 0.4745098039215686),
+            (0.7843137254901961, 0.06274509803921569, 0.1803921568627451),
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+            (0.8627450980392157, 0.4117647058823529, 0.48627450980392156),
+        ),
+        "fau": (
+            (0.0, 0.1843137254901961, 0.4235294117647059),
+            (0.37254901960784315, 0.48819684736639757, 0.6382929642445214),
+            (0.6235294117647059, 0.6929181084198386, 0.7829757785467129),
+            (0.7490196078431373, 0.795278738946559, 0.8553171856978086),
+            (0.8745098039215686, 0.8976393694732795, 0.9276585928489043),
+        ),
+        "fau_dark": (
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.3823913879277201, 0.4463667820069205, 0.5349480968858131),
+            (0.629434832756632, 0.6678200692041523, 0.7209688581314879),
+            (0.7529565551710881, 0.7785467128027682, 0.8139792387543252),
+            (0.876478277585544, 0.889273356401384, 0.9069896193771626),
+        ),
+        "fau_light": (
+            (0.37254901960784315, 0.48627450980392156, 0.6392156862745098),
+            (0.6063052672049212, 0.6776624375240292, 0.7736255286428296),
+            (0.7637831603229527, 0.8065974625144176, 0.8641753171856978),
+            (0.8425221068819685, 0.8710649750096117, 0.9094502114571319),
+            (0.9212610534409842, 0.9355324875048059, 0.954725105728566),
+        ),
+        "tech": (
+            (0.4666666666666667, 0.6235294117647059, 0.7098039215686275),
+            (0.6653594771241831, 0.7637831603229527, 0.8179161860822761),
+            (0.7992156862745098, 0.8582698961937716, 0.8907497116493657),
+            (0.8661437908496732, 0.9055132641291811, 0.9271664744329104),
+            (0.9330718954248366, 0.9527566320645905, 0.9635832372164552),
+        ),
+        "tech_dark": (
+            (0.2549019607843137, 0.4549019607843137, 0.5529411764705883),
+            (0.532487504805844, 0.6579777008842753, 0.7194925028835064),
+            (0.7194925028835064, 0.7947866205305651, 0.8316955017301038),
+            (0.8129950019223375, 0.8631910803537101, 0.8877970011534025),
+            (0.9064975009611688, 0.9315955401768551, 0.9438985005767013),
+        ),
+        "tech_light": (
+            (0.6666666666666666, 0.7647058823529411, 0.8196078431372549),
+            (0.7908496732026143, 0.8523644752018454, 0.8868127643214149),
+            (0.8745098039215686, 0.9114186851211072, 0.9320876585928489),
+            (0.9163398692810457, 0.9409457900807382, 0.954725105728566),
+            (0.9581699346405229, 0.970472895040369, 0.977362552864283),
+        ),
+        "phil": (
+            (1.0, 0.7215686274509804, 0.10980392156862745),
+            (1.0, 0.8252979623221838, 0.441445597846982),
+            (1.0, 0.8951787773933103, 0.6648673587081892),
+            (1.0, 0.9301191849288735, 0.7765782391387928),
+            (1.0, 0.9650595924644367, 0.8882891195693964),
+        ),
+        "phil_dark": (
+            (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+            (0.9434063821607074, 0.6653594771241831, 0.4562091503267973),
+            (0.9660438292964244, 0.7992156862745098, 0.6737254901960784),
+            (0.977362552864283, 0.8661437908496732, 0.782483660130719),
+            (0.9886812764321414, 0.9330718954248366, 0.8912418300653595),
+        ),
+        "phil_light": (
+            (1.0, 0.8235294117647058, 0.44313725490196076),
+            (1.0, 0.889273356401384, 0.6505959246443676),
+            (1.0, 0.9335640138408304, 0.7903575547866205),
+            (1.0, 0.9557093425605536, 0.860238369857747),
+            (1.0, 0.9778546712802768, 0.9301191849288735),
+        ),
+        "med": (
+            (0.0, 0.6392156862745098, 0.8784313725490196),
+            (0.37254901960784315, 0.7736255286428296, 0.9237216455209535),
+            (0.6235294117647059, 0.8641753171856978, 0.9542329873125721),
+            (0.7490196078431373, 0.9094502114571319, 0.9694886582083814),
+            (0.8745098039215686, 0.954725105728566, 0.9847443291041907),
+        ),
+        "med_dark": (
+            (0.0, 0.3803921568627451, 0.6274509803921569),
+            (0.37254901960784315, 0.6112264513648596, 0.766243752402922),
+            (0.6235294117647059, 0.7667358708189158, 0.8597462514417532),
+            (0.7490196078431373, 0.8444905805459438, 0.9064975009611688),
+            (0.8745098039215686, 0.922245290272972, 0.9532487504805844),
+        ),
+        "med_light": (
+            (0.37254901960784315, 0.7725490196078432, 0.9254901960784314),
+            (0.6063052672049212, 0.8572856593617839, 0.9532487504805844),
+            (0.7637831603229527, 0.9143713956170704, 0.9719492502883507),
+            (0.8425221068819685, 0.9429142637447135, 0.9812995001922338),
+            (0.9212610534409842, 0.9714571318723568, 0.9906497500961169),
+        ),
+        "nat": (
+            (0.2627450980392157, 0.6901960784313725, 0.16470588235294117),
+            (0.5374086889657823, 0.8056132256824298, 0.4758938869665513),
+            (0.7224452133794694, 0.8833679354094579, 0.6855363321799308),
+            (0.8149634755863129, 0.922245290272972, 0.7903575547866205),
+            (0.9074817377931564, 0.9611226451364859, 0.8951787773933103),
+        ),
+        "nat_dark": (
+            (0.13333333333333333, 0.5333333333333333, 0.2823529411764706),
+            (0.4562091503267973, 0.7071895424836601, 0.5497116493656287),
+            (0.6737254901960784, 0.8243137254901961, 0.7298269896193772),
+            (0.782483660130719, 0.8828758169934641, 0.8198846597462515),
+            (0.8912418300653595, 0.941437908496732, 0.9099423298731257),
+        ),
+        "nat_light": (
+            (0.5372549019607843, 0.803921568627451, 0.4745098039215686),
+            (0.7096501345636294, 0.8769703960015379, 0.6702806612841214),
+            (0.8257900807381776, 0.9261822376009228, 0.8021683967704729),
+            (0.8838600538254517, 0.9507881584006151, 0.8681122645136485),
+            (0.9419300269127259, 0.9753940792003076, 0.9340561322568243),
+        ),
+        "wiso": (
+            (0.7843137254901961, 0.06274509803921569, 0.1803921568627451),
+            (0.8646674356016917, 0.41191849288735105, 0.4857362552864283),
+            (0.918800461361015, 0.6471510957324107, 0.691441753171857),
+            (0.9458669742406767, 0.7647673971549405, 0.7942945021145713),
+            (0.9729334871203383, 0.8823836985774702, 0.8971472510572857),
+        ),
+        "wiso_dark": (
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+            (0.7440984236831988, 0.4389850057670127, 0.48819684736639757),
+            (0.8464590542099193, 0.6633910034602075, 0.6929181084198386),
+            (0.8976393694732795, 0.7755940023068051, 0.795278738946559),
+            (0.9488196847366398, 0.8877970011534025, 0.8976393694732795),
+        ),
+        "wiso_light": (
+            (0.8627450980392157, 0.4117647058823529, 0.48627450980392156),
+            (0.9138792772010765, 0.6309111880046137, 0.6776624375240292),
+            (0.948327566320646, 0.7785467128027681, 0.8065974625144176),
+            (0.9655517108804306, 0.8523644752018454, 0.8710649750096117),
+            (0.9827758554402153, 0.9261822376009228, 0.9355324875048059),
+        ),
+    },
+    "2024": {
+        "faculties": (
+            (0.01568627450980392, 0.19215686274509805, 0.41568627450980394),
+            (0.5490196078431373, 0.6235294117647059, 0.6941176470588235),
+            (0.9921568627450981, 0.7176470588235294, 0.20784313725490197),
+            (0.09411764705882353, 0.7058823529411765, 0.9450980392156862),
+            (0.4823529411764706, 0.7176470588235294, 0.1450980392156863),
+            (0.7725490196078432, 0.058823529411764705, 0.23529411764705882),
+        ),
+        "faculties_dark": (
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.1843137254901961, 0.34509803921568627, 0.43137254901960786),
+            (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+            (0.0, 0.3215686274509804, 0.5294117647058824),
+            (0.14901960784313725, 0.3803921568627451, 0.2549019607843137),
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+        ),
+        "faculties_light": (
+            (0.3803921568627451, 0.49019607843137253, 0.6313725490196078),
+            (0.7137254901960784, 0.7607843137254902, 0.807843137254902),
+            (0.996078431372549, 0.807843137254902, 0.4627450980392157),
+            (0.42745098039215684, 0.8156862745098039, 0.9647058823529412),
+            (0.6745098039215687, 0.8235294117647058, 0.4588235294117647),
+            (0.8666666666666667, 0.45098039215686275, 0.48627450980392156),
+        ),
+        "faculties_all": (
+            (0.01568627450980392, 0.19215686274509805, 0.41568627450980394),
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.5490196078431373, 0.6235294117647059, 0.6941176470588235),
+            (0.1843137254901961, 0.34509803921568627, 0.43137254901960786),
+            (0.9921568627450981, 0.7176470588235294, 0.20784313725490197),
+            (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+            (0.09411764705882353, 0.7058823529411765, 0.9450980392156862),
+            (0.0, 0.3215686274509804, 0.5294117647058824),
+            (0.4823529411764706, 0.7176470588235294, 0.1450980392156863),
+            (0.14901960784313725, 0.3803921568627451, 0.2549019607843137),
+            (0.7725490196078432, 0.058823529411764705, 0.23529411764705882),
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+            (0.0, 0.0, 0.0),
+        ),
+        "fau": (
+            (0.01568627450980392, 0.19215686274509805, 0.41568627450980394),
+            (0.3803921568627451, 0.49019607843137253, 0.6313725490196078),
+            (0.6274509803921569, 0.6941176470588235, 0.7764705882352941),
+            (0.7529411764705882, 0.796078431372549, 0.8549019607843137),
+            (0.8274509803921568, 0.8627450980392157, 0.9490196078431372),
+        ),
+        "fau_dark": (
+            (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+            (0.3803921568627451, 0.44313725490196076, 0.5333333333333333),
+            (0.6274509803921569, 0.6627450980392157, 0.7176470588235294),
+            (0.7529411764705882, 0.7803921568627451, 0.8156862745098039),
+            (0.8745098039215686, 0.8862745098039215, 0.9058823529411765),
+        ),
+        "tech": (
+            (0.5490196078431373, 0.6235294117647059, 0.6941176470588235),
+            (0.7137254901960784, 0.7607843137254902, 0.807843137254902),
+            (0.8274509803921568, 0.8549019607843137, 0.8823529411764706),
+            (0.8862745098039215, 0.9058823529411765, 0.9215686274509803),
+            (0.9215686274509803, 0.9607843137254902, 0.9686274509803922),
+        ),
+        "tech_dark": (
+            (0.1843137254901961, 0.34509803921568627, 0.43137254901960786),
+            (0.48627450980392156, 0.5882352941176471, 0.6392156862745098),
+            (0.6901960784313725, 0.7490196078431373, 0.7843137254901961),
+            (0.796078431372549, 0.8352941176470589, 0.8588235294117647),
+            (0.8941176470588236, 0.9137254901960784, 0.9254901960784314),
+        ),
+        "phil": (
+            (0.9921568627450981, 0.7176470588235294, 0.20784313725490197),
+            (0.996078431372549, 0.807843137254902, 0.4627450980392157),
+            (0.996078431372549, 0.8941176470588236, 0.6980392156862745),
+            (0.996078431372549, 0.9294117647058824, 0.8),
+            (1.0, 0.9607843137254902, 0.8784313725490196),
+        ),
+        "phil_dark": (
+            (0.9215686274509803, 0.4666666666666667, 0.13333333333333333),
+            (0.9372549019607843, 0.6392156862745098, 0.4117647058823529),
+            (0.9647058823529412, 0.796078431372549, 0.6705882352941176),
+            (0.9764705882352941, 0.8666666666666667, 0.7843137254901961),
+            (0.9882352941176471, 0.9294117647058824, 0.8862745098039215),
+        ),
+        "med": (
+            (0.09411764705882353, 0.7058823529411765, 0.9450980392156862),
+            (0.42745098039215684, 0.8156862745098039, 0.9647058823529412),
+            (0.6549019607843137, 0.8862745098039215, 0.9803921568627451),
+            (0.7725490196078432, 0.9254901960784314, 0.984313725490196),
+            (0.8901960784313725, 0.9803921568627451, 0.9882352941176471),
+        ),
+        "med_dark": (
+            (0.0, 0.3215686274509804, 0.5294117647058824),
+            (0.3686274509803922, 0.5725490196078431, 0.7019607843137254),
+            (0.6196078431372549, 0.7411764705882353, 0.8196078431372549),
+            (0.7490196078431373, 0.8313725490196079, 0.8823529411764706),
+            (0.8705882352941177, 0.9137254901960784, 0.9372549019607843),
+        ),
+        "nat": (
+            (0.4823529411764706, 0.7176470588235294, 0.1450980392156863),
+            (0.6745098039215687, 0.8235294117647058, 0.4588235294117647),
+            (0.803921568627451, 0.8941176470588236, 0.6745098039215687),
+            (0.8705882352941177, 0.9294117647058824, 0.7843137254901961),
+            (0.9019607843137255, 0.9882352941176471, 0.8627450980392157),
+        ),
+        "nat_dark": (
+            (0.14901960784313725, 0.3803921568627451, 0.2549019607843137),
+            (0.4627450980392157, 0.6078431372549019, 0.5294117647058824),
+            (0.6745098039215687, 0.7647058823529411, 0.7176470588235294),
+            (0.788235294117647, 0.8431372549019608, 0.8117647058823529),
+            (0.8901960784313725, 0.9215686274509803, 0.9019607843137255),
+        ),
+        "wiso": (
+            (0.7725490196078432, 0.058823529411764705, 0.23529411764705882),
+            (0.8666666666666667, 0.45098039215686275, 0.48627450980392156),
+            (0.9215686274509803, 0.6705882352941176, 0.6823529411764706),
+            (0.9450980392156862, 0.7843137254901961, 0.788235294117647),
+            (0.9882352941176471, 0.8627450980392157, 0.8901960784313725),
+        ),
+        "wiso_dark": (
+            (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+            (0.7450980392156863, 0.44313725490196076, 0.49019607843137253),
+            (0.8470588235294118, 0.6627450980392157, 0.6941176470588235),
+            (0.9019607843137255, 0.7764705882352941, 0.796078431372549),
+            (0.9490196078431372, 0.8862745098039215, 0.8980392156862745),
+        ),
+        "black": (
+            (0.0, 0.0, 0.0),
+            (0.3686274509803922, 0.3686274509803922, 0.3686274509803922),
+            (0.6196078431372549, 0.6196078431372549, 0.6196078431372549),
+            (0.7490196078431373, 0.7490196078431373, 0.7490196078431373),
+            (0.8705882352941177, 0.8705882352941177, 0.8705882352941177),
+        ),
+        "faculties_625": (
+            (0.3803921568627451, 0.49019607843137253, 0.6313725490196078),
+            (0.7137254901960784, 0.7607843137254902, 0.807843137254902),
+            (0.996078431372549, 0.807843137254902, 0.4627450980392157),
+            (0.42745098039215684, 0.8156862745098039, 0.9647058823529412),
+            (0.6745098039215687, 0.8235294117647058, 0.4588235294117647),
+            (0.8666666666666667, 0.45098039215686275, 0.48627450980392156),
+        ),
+        "faculties_375": (
+            (0.6274509803921569, 0.6941176470588235, 0.7764705882352941),
+            (0.8274509803921568, 0.8549019607843137, 0.8823529411764706),
+            (0.996078431372549, 0.8941176470588236, 0.6980392156862745),
+            (0.6549019607843137, 0.8862745098039215, 0.9803921568627451),
+            (0.803921568627451, 0.8941176470588236, 0.6745098039215687),
+            (0.9215686274509803, 0.6705882352941176, 0.6823529411764706),
+        ),
+        "faculties_250": (
+            (0.7529411764705882, 0.796078431372549, 0.8549019607843137),
+            (0.8862745098039215, 0.9058823529411765, 0.9215686274509803),
+            (0.996078431372549, 0.9294117647058824, 0.8),
+            (0.7725490196078432, 0.9254901960784314, 0.984313725490196),
+            (0.8705882352941177, 0.9294117647058824, 0.7843137254901961),
+            (0.9450980392156862, 0.7843137254901961, 0.788235294117647),
+        ),
+        "faculties_125": (
+            (0.8274509803921568, 0.8627450980392157, 0.9490196078431372),
+            (0.9215686274509803, 0.9607843137254902, 0.9686274509803922),
+            (1.0, 0.9607843137254902, 0.8784313725490196),
+            (0.8901960784313725, 0.9803921568627451, 0.9882352941176471),
+            (0.9019607843137255, 0.9882352941176471, 0.8627450980392157),
+            (0.9882352941176471, 0.8627450980392157, 0.8901960784313725),
+        ),
+        "faculties_dark_625": (
+            (0.3803921568627451, 0.44313725490196076, 0.5333333333333333),
+            (0.48627450980392156, 0.5882352941176471, 0.6392156862745098),
+            (0.9372549019607843, 0.6392156862745098, 0.4117647058823529),
+            (0.3686274509803922, 0.5725490196078431, 0.7019607843137254),
+            (0.4627450980392157, 0.6078431372549019, 0.5294117647058824),
+            (0.7450980392156863, 0.44313725490196076, 0.49019607843137253),
+        ),
+        "faculties_dark_375": (
+            (0.6274509803921569, 0.6627450980392157, 0.7176470588235294),
+            (0.6901960784313725, 0.7490196078431373, 0.7843137254901961),
+            (0.9647058823529412, 0.796078431372549, 0.6705882352941176),
+            (0.6196078431372549, 0.7411764705882353, 0.8196078431372549),
+            (0.6745098039215687, 0.7647058823529411, 0.7176470588235294),
+            (0.8470588235294118, 0.6627450980392157, 0.6941176470588235),
+        ),
+        "faculties_dark_250": (
+            (0.7529411764705882, 0.7803921568627451, 0.8156862745098039),
+            (0.796078431372549, 0.8352941176470589, 0.8588235294117647),
+            (0.9764705882352941, 0.8666666666666667, 0.7843137254901961),
+            (0.7490196078431373, 0.8313725490196079, 0.8823529411764706),
+            (0.788235294117647, 0.8431372549019608, 0.8117647058823529),
+            (0.9019607843137255, 0.7764705882352941, 0.796078431372549),
+        ),
+        "faculties_dark_125": (
+            (0.8745098039215686, 0.8862745098039215, 0.9058823529411765),
+            (0.8941176470588236, 0.9137254901960784, 0.9254901960784314),
+            (0.9882352941176471, 0.9294117647058824, 0.8862745098039215),
+            (0.8705882352941177, 0.9137254901960784, 0.9372549019607843),
+            (0.8901960784313725, 0.9215686274509803, 0.9019607843137255),
+            (0.9490196078431372, 0.8862745098039215, 0.8980392156862745),
+        ),
+    },
+}
+
+PALETTES_RGB_UINT8 = {
+    "2019": {
+        "faculties": ((0, 56, 101), (152, 164, 174), (201, 147, 19), (0, 177, 235), (0, 155, 119), (141, 20, 41)),
+        "fau": ((0, 56, 101), (95, 130, 158), (159, 180, 197), (191, 205, 216), (223, 230, 236)),
+        "tech": ((152, 164, 174), (190, 198, 204), (216, 221, 225), (229, 232, 235), (242, 244, 245)),
+        "phil": ((201, 147, 19), (221, 187, 107), (235, 214, 166), (241, 228, 196), (248, 241, 225)),
+        "med": ((0, 177, 235), (95, 206, 242), (159, 226, 247), (191, 235, 250), (223, 245, 252)),
+        "nat": ((0, 155, 119), (95, 192, 170), (159, 217, 204), (191, 230, 221), (223, 242, 238)),
+        "wiso": ((141, 20, 41), (183, 108, 121), (212, 167, 174), (226, 196, 201), (241, 226, 228)),
+    },
+    "2021": {
+        "faculties": ((0, 47, 108), (119, 159, 181), (255, 184, 28), (0, 163, 224), (67, 176, 42), (200, 16, 46)),
+        "faculties_dark": ((4, 30, 66), (65, 116, 141), (232, 119, 34), (0, 97, 160), (34, 136, 72), (151, 27, 47)),
+        "faculties_light": (
+            (95, 124, 163),
+            (170, 195, 209),
+            (255, 210, 113),
+            (95, 197, 236),
+            (137, 205, 121),
+            (220, 105, 124),
+        ),
+        "faculties_all": (
+            (0, 47, 108),
+            (4, 30, 66),
+            (95, 124, 163),
+            (119, 159, 181),
+            (65, 116, 141),
+            (170, 195, 209),
+            (255, 184, 28),
+            (232, 119, 34),
+            (255, 210, 113),
+            (0, 163, 224),
+            (0, 97, 160),
+            (95, 197, 236),
+            (67, 176, 42),
+            (34, 136, 72),
+            (137, 205, 121),
+            (200, 16, 46),
+            (151, 27, 47),
+            (220, 105, 124),
+        ),
+        "fau": ((0, 47, 108), (95, 124, 163), (159, 177, 200), (191, 203, 218), (223, 229, 237)),
+        "fau_dark": ((4, 30, 66), (98, 114, 136), (161, 170, 184), (192, 199, 208), (224, 227, 231)),
+        "fau_light": ((95, 124, 163), (155, 173, 197), (195, 206, 220), (215, 222, 232), (235, 239, 243)),
+        "tech": ((119, 159, 181), (170, 195, 209), (204, 219, 227), (221, 231, 236), (238, 243, 246)),
+        "tech_dark": ((65, 116, 141), (136, 168, 183), (183, 203, 212), (207, 220, 226), (231, 238, 241)),
+        "tech_light": ((170, 195, 209), (202, 217, 226), (223, 232, 238), (234, 240, 243), (244, 247, 249)),
+        "phil": ((255, 184, 28), (255, 210, 113), (255, 228, 170), (255, 237, 198), (255, 246, 227)),
+        "phil_dark": ((232, 119, 34), (241, 170, 116), (246, 204, 172), (249, 221, 200), (252, 238, 227)),
+        "phil_light": ((255, 210, 113), (255, 227, 166), (255, 238, 202), (255, 244, 219), (255, 249, 237)),
+        "med": ((0, 163, 224), (95, 197, 236), (159, 220, 243), (191, 232, 247), (223, 243, 251)),
+        "med_dark": ((0, 97, 160), (95, 156, 195), (159, 196, 219), (191, 215, 231), (223, 235, 243)),
+        "med_light": ((95, 197, 236), (155, 219, 243), (195, 233, 248), (215, 240, 250), (235, 248, 253)),
+        "nat": ((67, 176, 42), (137, 205, 121), (184, 225, 175), (208, 235, 202), (231, 245, 228)),
+        "nat_dark": ((34, 136, 72), (116, 180, 140), (172, 210, 186), (200, 225, 209), (227, 240, 232)),
+        "nat_light": ((137, 205, 121), (181, 224, 171), (211, 236, 205), (225, 242, 221), (240, 249, 238)),
+        "wiso": ((200, 16, 46), (220, 105, 124), (234, 165, 176), (241, 195, 203), (248, 225, 229)),
+        "wiso_dark": ((151, 27, 47), (190, 112, 124), (216, 169, 177), (229, 198, 203), (242, 226, 229)),
+        "wiso_light": ((220, 105, 124), (233, 161, 173), (242, 199, 206), (246, 217, 222), (251, 236, 239)),
+    },
+    "2024": {
+        "faculties": ((4, 49, 106), (140, 159, 177), (253, 183, 53), (24, 180, 241), (123, 183, 37), (197, 15, 60)),
+        "faculties_dark": ((4, 30, 66), (47, 88, 110), (232, 119, 34), (0, 82, 135), (38, 97, 65), (151, 27, 47)),
+        "faculties_light": (
+            (97, 125, 161),
+            (182, 194, 206),
+            (254, 206, 118),
+            (109, 208, 246),
+            (172, 210, 117),
+            (221, 115, 124),
+        ),
+        "faculties_all": (
+            (4, 49, 106),
+            (4, 30, 66),
+            (140, 159, 177),
+            (47, 88, 110),
+            (253, 183, 53),
+            (232, 119, 34),
+            (24, 180, 241),
+            (0, 82, 135),
+            (123, 183, 37),
+            (38, 97, 65),
+            (197, 15, 60),
+            (151, 27, 47),
+            (0, 0, 0),
+        ),
+        "fau": ((4, 49, 106), (97, 125, 161), (160, 177, 198), (192, 203, 218), (211, 220, 242)),
+        "fau_dark": ((4, 30, 66), (97, 113, 136), (160, 169, 183), (192, 199, 208), (223, 226, 231)),
+        "tech": ((140, 159, 177), (182, 194, 206), (211, 218, 225), (226, 231, 235), (235, 245, 247)),
+        "tech_dark": ((47, 88, 110), (124, 150, 163), (176, 191, 200), (203, 213, 219), (228, 233, 236)),
+        "phil": ((253, 183, 53), (254, 206, 118), (254, 228, 178), (254, 237, 204), (255, 245, 224)),
+        "phil_dark": ((235, 119, 34), (239, 163, 105), (246, 203, 171), (249, 221, 200), (252, 237, 226)),
+        "med": ((24, 180, 241), (109, 208, 246), (167, 226, 250), (197, 236, 251), (227, 250, 252)),
+        "med_dark": ((0, 82, 135), (94, 146, 179), (158, 189, 209), (191, 212, 225), (222, 233, 239)),
+        "nat": ((123, 183, 37), (172, 210, 117), (205, 228, 172), (222, 237, 200), (230, 252, 220)),
+        "nat_dark": ((38, 97, 65), (118, 155, 135), (172, 195, 183), (201, 215, 207), (227, 235, 230)),
+        "wiso": ((197, 15, 60), (221, 115, 124), (235, 171, 174), (241, 200, 201), (252, 220, 227)),
+        "wiso_dark": ((151, 27, 47), (190, 113, 125), (216, 169, 177), (230, 198, 203), (242, 226, 229)),
+        "black": ((0, 0, 0), (94, 94, 94), (158, 158, 158), (191, 191, 191), (222, 222, 222)),
+        "faculties_625": (
+            (97, 125, 161),
+            (182, 194, 206),
+            (254, 206, 118),
+            (109, 208, 246),
+            (172, 210, 117),
+            (221, 115, 124),
+        ),
+        "faculties_375": (
+            (160, 177, 198),
+            (211, 218, 225),
+            (254, 228, 178),
+            (167, 226, 250),
+            (205, 228, 172),
+            (235, 171, 174),
+        ),
+        "faculties_250": (
+            (192, 203, 218),
+            (226, 231, 235),
+            (254, 237, 204),
+            (197, 236, 251),
+            (222, 237, 200),
+            (241, 200, 201),
+        ),
+        "faculties_125": (
+            (211, 220, 242),
+            (235, 245, 247),
+            (255, 245, 224),
+            (227, 250, 252),
+            (230, 252, 220),
+            (252, 220, 227),
+        ),
+        "faculties_dark_625": (
+            (97, 113, 136),
+            (124, 150, 163),
+            (239, 163, 105),
+            (94, 146, 179),
+            (118, 155, 135),
+            (190, 113, 125),
+        ),
+        "faculties_dark_375": (
+            (160, 169, 183),
+            (176, 191, 200),
+            (246, 203, 171),
+            (158, 189, 209),
+            (172, 195, 183),
+            (216, 169, 177),
+        ),
+        "faculties_dark_250": (
+            (192, 199, 208),
+            (203, 213, 219),
+            (249, 221, 200),
+            (191, 212, 225),
+            (201, 215, 207),
+            (230, 198, 203),
+        ),
+        "faculties_dark_125": (
+            (223, 226, 231),
+            (228, 233, 236),
+            (252, 237, 226),
+            (222, 233, 239),
+            (227, 235, 230),
+            (242, 226, 229),
+        ),
+    },
+}
+
+# Palettes whose colors in `cmaps` are hex strings (the colors of all others are float RGB tuples)
+HEX_PALETTES = {
+    "2019": (),
+    "2021": ("faculties", "faculties_dark", "faculties_light", "faculties_all"),
+    "2024": (
+        "faculties",
+        "faculties_dark",
+        "faculties_light",
+        "faculties_all",
+        "fau",
+        "fau_dark",
+        "tech",
+        "tech_dark",
+        "phil",
+        "phil_dark",
+        "med",
+        "med_dark",
+        "nat",
+        "nat_dark",
+        "wiso",
+        "wiso_dark",
+        "black",
+        "faculties_625",
+        "faculties_375",
+        "faculties_250",
+        "faculties_125",
+        "faculties_dark_625",
+        "faculties_dark_375",
+        "faculties_dark_250",
+        "faculties_dark_125",
+    ),
+}
+
+# Float and uint8 RGB values of all named hex colors (keys are upper case)
+RGB = {
+    "#000000": (0.0, 0.0, 0.0),
+    "#002F6C": (0.0, 0.1843137254901961, 0.4235294117647059),
+    "#003865": (0.0, 0.2196078431372549, 0.396078431372549),
+    "#005287": (0.0, 0.3215686274509804, 0.5294117647058824),
+    "#0061A0": (0.0, 0.3803921568627451, 0.6274509803921569),
+    "#009B77": (0.0, 0.6078431372549019, 0.4666666666666667),
+    "#00A3E0": (0.0, 0.6392156862745098, 0.8784313725490196),
+    "#00B1EB": (0.0, 0.6941176470588235, 0.9215686274509803),
+    "#041E42": (0.01568627450980392, 0.11764705882352941, 0.25882352941176473),
+    "#04316A": (0.01568627450980392, 0.19215686274509805, 0.41568627450980394),
+    "#18B4F1": (0.09411764705882353, 0.7058823529411765, 0.9450980392156862),
+    "#228848": (0.13333333333333333, 0.5333333333333333, 0.2823529411764706),
+    "#266141": (0.14901960784313725, 0.3803921568627451, 0.2549019607843137),
+    "#2F586E": (0.1843137254901961, 0.34509803921568627, 0.43137254901960786),
+    "#41748D": (0.2549019607843137, 0.4549019607843137, 0.5529411764705883),
+    "#43B02A": (0.2627450980392157, 0.6901960784313725, 0.16470588235294117),
+    "#5E5E5E": (0.3686274509803922, 0.3686274509803922, 0.3686274509803922),
+    "#5E92B3": (0.3686274509803922, 0.5725490196078431, 0.7019607843137254),
+    "#5F7CA3": (0.37254901960784315, 0.48627450980392156, 0.6392156862745098),
+    "#5FC5EC": (0.37254901960784315, 0.7725490196078432, 0.9254901960784314),
+    "#617188": (0.3803921568627451, 0.44313725490196076, 0.5333333333333333),
+    "#617DA1": (0.3803921568627451, 0.49019607843137253, 0.6313725490196078),
+    "#6DD0F6": (0.42745098039215684, 0.8156862745098039, 0.9647058823529412),
+    "#769B87": (0.4627450980392157, 0.6078431372549019, 0.5294117647058824),
+    "#779FB5": (0.4666666666666667, 0.6235294117647059, 0.7098039215686275),
+    "#7BB725": (0.4823529411764706, 0.7176470588235294, 0.1450980392156863),
+    "#7C96A3": (0.48627450980392156, 0.5882352941176471, 0.6392156862745098),
+    "#89CD79": (0.5372549019607843, 0.803921568627451, 0.4745098039215686),
+    "#8C9FB1": (0.5490196078431373, 0.6235294117647059, 0.6941176470588235),
+    "#8D1429": (0.5529411764705883, 0.0784313725490196, 0.1607843137254902),
+    "#971B2F": (0.592156862745098, 0.10588235294117647, 0.1843137254901961),
+    "#98A4AE": (0.596078431372549, 0.6431372549019608, 0.6823529411764706),
+    "#9E9E9E": (0.6196078431372549, 0.6196078431372549, 0.6196078431372549),
+    "#9EBDD1": (0.6196078431372549, 0.7411764705882353, 0.8196078431372549),
+    "#A0A9B7": (0.6274509803921569, 0.6627450980392157, 0.7176470588235294),
+    "#A0B1C6": (0.6274509803921569, 0.6941176470588235, 0.7764705882352941),
+    "#A7E2FA": (0.6549019607843137, 0.8862745098039215, 0.9803921568627451),
+    "#AAC3D1": (0.6666666666666666, 0.7647058823529411, 0.8196078431372549),
+    "#ACC3B7": (0.6745098039215687, 0.7647058823529411, 0.7176470588235294),
+    "#ACD275": (0.6745098039215687, 0.8235294117647058, 0.4588235294117647),
+    "#B0BFC8": (0.6901960784313725, 0.7490196078431373, 0.7843137254901961),
+    "#B6C2CE": (0.7137254901960784, 0.7607843137254902, 0.807843137254902),
+    "#BE717D": (0.7450980392156863, 0.44313725490196076, 0.49019607843137253),
+    "#BFBFBF": (0.7490196078431373, 0.7490196078431373, 0.7490196078431373),
+    "#BFD4E1": (0.7490196078431373, 0.8313725490196079, 0.8823529411764706),
+    "#C0C7D0": (0.7529411764705882, 0.7803921568627451, 0.8156862745098039),
+    "#C0CBDA": (0.7529411764705882, 0.796078431372549, 0.8549019607843137),
+    "#C50F3C": (0.7725490196078432, 0.058823529411764705, 0.23529411764705882),
+    "#C5ECFB": (0.7725490196078432, 0.9254901960784314, 0.984313725490196),
+    "#C8102E": (0.7843137254901961, 0.06274509803921569, 0.1803921568627451),
+    "#C99313": (0.788235294117647, 0.5764705882352941, 0.07450980392156863),
+    "#C9D7CF": (0.788235294117647, 0.8431372549019608, 0.8117647058823529),
+    "#CBD5DB": (0.796078431372549, 0.8352941176470589, 0.8588235294117647),
+    "#CDE4AC": (0.803921568627451, 0.8941176470588236, 0.6745098039215687),
+    "#D3DAE1": (0.8274509803921568, 0.8549019607843137, 0.8823529411764706),
+    "#D3DCF2": (0.8274509803921568, 0.8627450980392157, 0.9490196078431372),
+    "#D8A9B1": (0.8470588235294118, 0.6627450980392157, 0.6941176470588235),
+    "#DC697C": (0.8627450980392157, 0.4117647058823529, 0.48627450980392156),
+    "#DD737C": (0.8666666666666667, 0.45098039215686275, 0.48627450980392156),
+    "#DEDEDE": (0.8705882352941177, 0.8705882352941177, 0.8705882352941177),
+    "#DEE9EF": (0.8705882352941177, 0.9137254901960784, 0.9372549019607843),
+    "#DEEDC8": (0.8705882352941177, 0.9294117647058824, 0.7843137254901961),
+    "#DFE2E7": (0.8745098039215686, 0.8862745098039215, 0.9058823529411765),
+    "#E2E7EB": (0.8862745098039215, 0.9058823529411765, 0.9215686274509803),
+    "#E3EBE6": (0.8901960784313725, 0.9215686274509803, 0.9019607843137255),
+    "#E3FAFC": (0.8901960784313725, 0.9803921568627451, 0.9882352941176471),
+    "#E4E9EC": (0.8941176470588236, 0.9137254901960784, 0.9254901960784314),
+    "#E6C6CB": (0.9019607843137255, 0.7764705882352941, 0.796078431372549),
+    "#E6FCDC": (0.9019607843137255, 0.9882352941176471, 0.8627450980392157),
+    "#E87722": (0.9098039215686274, 0.4666666666666667, 0.13333333333333333),
+    "#EB7722": (0.9215686274509803, 0.4666666666666667, 0.13333333333333333),
+    "#EBABAE": (0.9215686274509803, 0.6705882352941176, 0.6823529411764706),
+    "#EBF5F7": (0.9215686274509803, 0.9607843137254902, 0.9686274509803922),
+    "#EFA369": (0.9372549019607843, 0.6392156862745098, 0.4117647058823529),
+    "#F1C8C9": (0.9450980392156862, 0.7843137254901961, 0.788235294117647),
+    "#F2E2E5": (0.9490196078431372, 0.8862745098039215, 0.8980392156862745),
+    "#F6CBAB": (0.9647058823529412, 0.796078431372549, 0.6705882352941176),
+    "#F9DDC8": (0.9764705882352941, 0.8666666666666667, 0.7843137254901961),
+    "#FCDCE3": (0.9882352941176471, 0.8627450980392157, 0.8901960784313725),
+    "#FCEDE2": (0.9882352941176471, 0.9294117647058824, 0.8862745098039215),
+    "#FDB735": (0.9921568627450981, 0.7176470588235294, 0.20784313725490197),
+    "#FECE76": (0.996078431372549, 0.807843137254902, 0.4627450980392157),
+    "#FEE4B2": (0.996078431372549, 0.8941176470588236, 0.6980392156862745),
+    "#FEEDCC": (0.996078431372549, 0.9294117647058824, 0.8),
+    "#FFB81C": (1.0, 0.7215686274509804, 0.10980392156862745),
+    "#FFD271": (1.0, 0.8235294117647058, 0.44313725490196076),
+    "#FFF5E0": (1.0, 0.9607843137254902, 0.8784313725490196),
+}
+
+RGB_UINT8 = {
+    "#000000": (0, 0, 0),
+    "#002F6C": (0, 47, 108),
+    "#003865": (0, 56, 101),
+    "#005287": (0, 82, 135),
+    "#0061A0": (0, 97, 160),
+    "#009B77": (0, 155, 119),
+    "#00A3E0": (0, 163, 224),
+    "#00B1EB": (0, 177, 235),
+    "#041E42": (4, 30, 66),
+    "#04316A": (4, 49, 106),
+    "#18B4F1": (24, 180, 241),
+    "#228848": (34, 136, 72),
+    "#266141": (38, 97, 65),
+    "#2F586E": (47, 88, 110),
+    "#41748D": (65, 116, 141),
+    "#43B02A": (67, 176, 42),
+    "#5E5E5E": (94, 94, 94),
+    "#5E92B3": (94, 146, 179),
+    "#5F7CA3": (95, 124, 163),
+    "#5FC5EC": (95, 197, 236),
+    "#617188": (97, 113, 136),
+    "#617DA1": (97, 125, 161),
+    "#6DD0F6": (109, 208, 246),
+    "#769B87": (118, 155, 135),
+    "#779FB5": (119, 159, 181),
+    "#7BB725": (123, 183, 37),
+    "#7C96A3": (124, 150, 163),
+    "#89CD79": (137, 205, 121),
+    "#8C9FB1": (140, 159, 177),
+    "#8D1429": (141, 20, 41),
+    "#971B2F": (151, 27, 47),
+    "#98A4AE": (152, 164, 174),
+    "#9E9E9E": (158, 158, 158),
+    "#9EBDD1": (158, 189, 209),
+    "#A0A9B7": (160, 169, 183),
+    "#A0B1C6": (160, 177, 198),
+    "#A7E2FA": (167, 226, 250),
+    "#AAC3D1": (170, 195, 209),
+    "#ACC3B7": (172, 195, 183),
+    "#ACD275": (172, 210, 117),
+    "#B0BFC8": (176, 191, 200),
+    "#B6C2CE": (182, 194, 206),
+    "#BE717D": (190, 113, 125),
+    "#BFBFBF": (191, 191, 191),
+    "#BFD4E1": (191, 212, 225),
+    "#C0C7D0": (192, 199, 208),
+    "#C0CBDA": (192, 203, 218),
+    "#C50F3C": (197, 15, 60),
+    "#C5ECFB": (197, 236, 251),
+    "#C8102E": (200, 16, 46),
+    "#C99313": (201, 147, 19),
+    "#C9D7CF": (201, 215, 207),
+    "#CBD5DB": (203, 213, 219),
+    "#CDE4AC": (205, 228, 172),
+    "#D3DAE1": (211, 218, 225),
+    "#D3DCF2": (211, 220, 242),
+    "#D8A9B1": (216, 169, 177),
+    "#DC697C": (220, 105, 124),
+    "#DD737C": (221, 115, 124),
+    "#DEDEDE": (222, 222, 222),
+    "#DEE9EF": (222, 233, 239),
+    "#DEEDC8": (222, 237, 200),
+    "#DFE2E7": (223, 226, 231),
+    "#E2E7EB": (226, 231, 235),
+    "#E3EBE6": (227, 235, 230),
+    "#E3FAFC": (227, 250, 252),
+    "#E4E9EC": (228, 233, 236),
+    "#E6C6CB": (230, 198, 203),
+    "#E6FCDC": (230, 252, 220),
+    "#E87722": (232, 119, 34),
+    "#EB7722": (235, 119, 34),
+    "#EBABAE": (235, 171, 174),
+    "#EBF5F7": (235, 245, 247),
+    "#EFA369": (239, 163, 105),
+    "#F1C8C9": (241, 200, 201),
+    "#F2E2E5": (242, 226, 229),
+    "#F6CBAB": (246, 203, 171),
+    "#F9DDC8": (249, 221, 200),
+    "#FCDCE3": (252, 220, 227),
+    "#FCEDE2": (252, 237, 226),
+    "#FDB735": (253, 183, 53),
+    "#FECE76": (254, 206, 118),
+    "#FEE4B2": (254, 228, 178),
+    "#FEEDCC": (254, 237, 204),
+    "#FFB81C": (255, 184, 28),
+    "#FFD271": (255, 210, 113),
+    "#FFF5E0": (255, 245, 224),
+}
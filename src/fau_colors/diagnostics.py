@@ -0,0 +1,257 @@
+"""Opt-in instrumentation of the expensive phases of this package.
+
+When enabled, the import of the plotting dependencies, the construction of the colormaps, the registration of cmaps,
+and the font discovery are timed, cache hits and misses of the registrations are counted, and the scanned font
+directories are recorded.
+Enable it by calling `enable()` or by setting the environment variable `FAU_COLORS_DIAGNOSTICS` (to "1", or to
+"tracemalloc" to also trace the peak memory of each phase) before importing `fau_colors`.
+While disabled, all instrumentation points are no-ops.
+
+>>> from fau_colors import diagnostics
+>>> diagnostics.enable()
+>>> from fau_colors import register_cmaps
+>>> register_cmaps()
+>>> print(diagnostics.report().format())
+
+Each finished phase is also logged (at DEBUG level) to the "fau_colors.diagnostics" logger and passed to all
+callbacks registered with `add_callback` (e.g. to create OpenTelemetry spans).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+    from typing import ParamSpec, TypeVar
+
+    P = ParamSpec("P")
+    T = TypeVar("T")
+
+__all__ = [
+    "ENV_VAR",
+    "CacheStats",
+    "DiagnosticsReport",
+    "PhaseRecord",
+    "add_callback",
+    "count_cache",
+    "disable",
+    "enable",
+    "is_enabled",
+    "phase",
+    "record_font_dirs",
+    "remove_callback",
+    "report",
+    "reset",
+    "timed",
+]
+
+ENV_VAR = "FAU_COLORS_DIAGNOSTICS"
+
+PhaseRecord = namedtuple(
+    "PhaseRecord", ["name", "parent", "start", "duration", "allocated_blocks", "peak_bytes", "attributes"]
+)
+PhaseRecord.__doc__ = """A finished phase.
+
+`start` is a `time.perf_counter` value and `duration` is in seconds.
+`allocated_blocks` is the change of the number of memory blocks allocated by the interpreter during the phase.
+`peak_bytes` is the peak of the traced memory above the memory at the start of the phase (None without tracemalloc).
+`parent` is the name of the enclosing phase (in the same thread) or None.
+"""
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses"])
+
+
+class DiagnosticsReport(namedtuple("DiagnosticsReport", ["phases", "cache", "font_dirs"])):
+    """Snapshot of all recorded phases, cache statistics (name -> `CacheStats`), and scanned font directories."""
+
+    __slots__ = ()
+
+    def format(self) -> str:
+        """Format the report as human readable table."""
+        lines = [f"{'phase':<45} {'time [ms]':>10} {'blocks':>9} {'peak [kB]':>10}"]
+        for phase in self.phases:
+            name = phase.name if phase.parent is None else f"  {phase.name}"
+            peak = "" if phase.peak_bytes is None else f"{phase.peak_bytes / 1024:.1f}"
+            lines.append(f"{name:<45} {phase.duration * 1000:>10.2f} {phase.allocated_blocks:>+9} {peak:>10}")
+        if self.cache:
+            lines.append("")
+            lines.extend(f"{name}: {stats.hits} hits, {stats.misses} misses" for name, stats in self.cache.items())
+        if self.font_dirs:
+            lines.append("")
+            lines.append(f"Scanned font directories: {', '.join(self.font_dirs)}")
+        return "\n".join(lines)
+
+
+_ENABLED = False
+_TRACE_MEMORY = False
+_LOCK = threading.Lock()
+_PHASES: list[PhaseRecord] = []
+_CACHE: dict[str, list[int]] = {}
+_FONT_DIRS: dict[str, None] = {}
+_CALLBACKS: list[Callable[[PhaseRecord], Any]] = []
+_LOCAL = threading.local()
+
+
+def enable(trace_memory: bool = False) -> None:
+    """Start recording.
+
+    Parameters
+    ----------
+    trace_memory
+        If True, `tracemalloc` is started (if it is not already running) to record the peak memory of each phase.
+        This slows down all allocations considerably.
+
+    """
+    global _ENABLED, _TRACE_MEMORY  # noqa: PLW0603
+    _ENABLED = True
+    _TRACE_MEMORY = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable() -> None:
+    """Stop recording (already recorded data is kept until `reset` is called)."""
+    global _ENABLED, _TRACE_MEMORY  # noqa: PLW0603
+    _ENABLED = False
+    _TRACE_MEMORY = False
+
+
+def is_enabled() -> bool:
+    """Check if the instrumentation is enabled."""
+    return _ENABLED
+
+
+def reset() -> None:
+    """Delete all recorded data."""
+    with _LOCK:
+        _PHASES.clear()
+        _CACHE.clear()
+        _FONT_DIRS.clear()
+
+
+def report() -> DiagnosticsReport:
+    """Get a snapshot of all recorded data."""
+    with _LOCK:
+        return DiagnosticsReport(
+            phases=tuple(sorted(_PHASES, key=lambda record: record.start)),
+            cache={name: CacheStats(*counts) for name, counts in _CACHE.items()},
+            font_dirs=tuple(_FONT_DIRS),
+        )
+
+
+def add_callback(callback: Callable[[PhaseRecord], Any]) -> None:
+    """Call `callback(record)` whenever a phase finished."""
+    _CALLBACKS.append(callback)
+
+
+def remove_callback(callback: Callable[[PhaseRecord], Any]) -> None:
+    """Remove a callback added with `add_callback`."""
+    _CALLBACKS.remove(callback)
+
+
+def _logger() -> Any:
+    import logging
+
+    return logging.getLogger(__name__)
+
+
+def _stack() -> list[list]:
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+@contextmanager
+def _record_phase(name: str, attributes: dict[str, Any]) -> Iterator[None]:
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    trace_memory = _TRACE_MEMORY and tracemalloc.is_tracing()
+    if trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            # Resetting the peak below would lose the peak of the enclosing phase so far
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+    else:
+        current = 0
+    # [name, highest peak of finished nested phases]
+    frame = [name, 0]
+    stack.append(frame)
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        allocated_blocks = sys.getallocatedblocks() - blocks
+        stack.pop()
+        peak_bytes = None
+        if trace_memory:
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            peak_bytes = max(peak - current, 0)
+            if parent is not None:
+                parent[1] = max(parent[1], peak)
+        record = PhaseRecord(
+            name, None if parent is None else parent[0], start, duration, allocated_blocks, peak_bytes, attributes
+        )
+        with _LOCK:
+            _PHASES.append(record)
+        _logger().debug("%s took %.2f ms (%+d allocated blocks)", name, duration * 1000, allocated_blocks)
+        for callback in list(_CALLBACKS):
+            callback(record)
+
+
+def phase(name: str, **attributes: Any) -> AbstractContextManager[None]:
+    """Record the wall time and allocations of the enclosed block as phase (no-op while disabled)."""
+    if not _ENABLED:
+        return nullcontext()
+    return _record_phase(name, attributes)
+
+
+def timed(name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorate a function to record each call as phase."""
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            with _record_phase(name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count_cache(name: str, hit: bool) -> None:
+    """Count a hit or miss of a cache."""
+    if not _ENABLED:
+        return
+    with _LOCK:
+        counts = _CACHE.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+
+def record_font_dirs(dirs: Iterable[str | Path]) -> None:
+    """Record scanned font directories."""
+    if not _ENABLED:
+        return
+    with _LOCK:
+        _FONT_DIRS.update(dict.fromkeys(map(str, dirs)))
+
+
+if os.environ.get(ENV_VAR, "").lower() not in ("", "0", "false"):
+    enable(trace_memory=os.environ[ENV_VAR].lower() == "tracemalloc")
@@ -0,0 +1,289 @@
+"""Export the palettes of all versions to files for other applications.
+
+All formats are rendered from one shared table per version (created once from `fau_colors.data`, without
+matplotlib), and files are only written if their content changed.
+
+>>> from fau_colors.export import export_palettes
+>>> export_palettes("color_palettes", formats=("gpl", "css", "json"))
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from collections import namedtuple
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fau_colors._versions import normalize_version, palette_color_names
+from fau_colors.data import PALETTE_NAMES, PALETTES_HEX, PALETTES_RGB, VERSIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+__all__ = ["EXPORT_FORMATS", "ExportResult", "ExportTable", "export_palettes", "export_table", "render"]
+
+EXPORT_FORMATS = ("gpl", "tex", "css", "scss", "json", "ase", "mplstyle")
+
+ExportTable = namedtuple("ExportTable", ["version", "palettes", "palette_slices", "hex", "rgb", "rgb_uint8", "named"])
+ExportTable.__doc__ = """All colors of a version, converted once and shared by all export formats.
+
+`hex`, `rgb`, and `rgb_uint8` contain the colors of all palettes (in `cmaps` order) concatenated, and
+`palette_slices` maps each palette to its slice of these arrays.
+`named` is a tuple of (name, index) pairs of all distinct named colors (e.g. ("fau-med-dark-250", 42)).
+"""
+
+ExportResult = namedtuple("ExportResult", ["path", "format", "written"])
+
+# Palettes that are exported as `.mplstyle` color cycle (file name suffix -> palette)
+_STYLE_VARIANTS = {"": "faculties", "_dark": "faculties_dark", "_light": "faculties_light", "_all": "faculties_all"}
+
+
+def _color_names(version: str, palette: str) -> tuple[str, ...]:
+    # The same names as in the registry (e.g. "fau-med-dark-625")
+    return tuple(f"fau-{name.replace('_', '-')}" for name in palette_color_names(palette, version))
+
+
+@cache
+def _export_table(version: str) -> ExportTable:
+    palettes = tuple(PALETTES_HEX[version])
+    palette_slices = {}
+    start = 0
+    for palette in palettes:
+        stop = start + len(PALETTES_HEX[version][palette])
+        palette_slices[palette] = slice(start, stop)
+        start = stop
+    rgb = np.array([rgb for palette in palettes for rgb in PALETTES_RGB[version][palette]], dtype=np.float64)
+    rgb_uint8 = np.round(rgb * 255).astype(np.uint8)
+    rgb.setflags(write=False)
+    rgb_uint8.setflags(write=False)
+
+    named = {}
+    for palette in palettes:
+        for i, name in enumerate(_color_names(version, palette), start=palette_slices[palette].start):
+            named.setdefault(name, i)
+    return ExportTable(
+        version=version,
+        palettes=palettes,
+        palette_slices=palette_slices,
+        hex=tuple(h for palette in palettes for h in PALETTES_HEX[version][palette]),
+        rgb=rgb,
+        rgb_uint8=rgb_uint8,
+        named=tuple(named.items()),
+    )
+
+
+def export_table(version: str | int) -> ExportTable:
+    """Get the (cached) table of all colors of a version that all export formats are rendered from."""
+    return _export_table(normalize_version(version))
+
+
+def render_gpl(name: str, rgb: np.ndarray) -> str:
+    """Render a GIMP palette from float RGB values."""
+    header = f"GIMP Palette\nName: {name}\n#\n"
+    # Truncation (instead of rounding) is kept for compatibility with previously exported files
+    rows = (rgb * 255).astype(int).tolist()
+    return header + "\n".join(" ".join(f"{c!s:>3}" for c in row) for row in rows)
+
+
+def render_tex(file_name: str, names: Iterable[str], rgb: np.ndarray) -> str:
+    """Render `xcolor` color definitions from names and float RGB values."""
+    header = (
+        f"% Tex color file defining the FAU colors.\n"
+        "% To use, you need to include the `xcolor` package (\\usepackage{xcolor} in your preamble).\n"
+        f"% Then copy this file into your project and include it with `\\input{{{file_name}}}`.\n\n\n"
+    )
+    definitions = {
+        f"\\definecolor{{{name}}}{{rgb}}{{{r}, {g}, {b}}}" for name, (r, g, b) in zip(names, np.asarray(rgb).tolist())
+    }
+    return header + "\n".join(sorted(definitions))
+
+
+def _render_gpl(table: ExportTable, stem: str) -> str:
+    return render_gpl(stem, table.rgb)
+
+
+def _render_tex(table: ExportTable, stem: str) -> str:
+    # Same as the original export: names and colors of each palette are paired up to the shorter of both
+    names, rgb = [], []
+    for palette in table.palettes:
+        palette_names = PALETTE_NAMES[table.version][palette]
+        palette_rgb = table.rgb[table.palette_slices[palette]]
+        n = min(len(palette_names), len(palette_rgb))
+        names.extend(palette_names[:n])
+        rgb.append(palette_rgb[:n])
+    return render_tex(f"{stem}.tex", names, np.concatenate(rgb))
+
+
+def _render_css(table: ExportTable, stem: str) -> str:  # noqa: ARG001
+    lines = [f"/* FAU colors ({table.version}) */", ":root {"]
+    lines.extend(f"  --{name}: {table.hex[i]};" for name, i in table.named)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _render_scss(table: ExportTable, stem: str) -> str:  # noqa: ARG001
+    lines = [f"// FAU colors ({table.version})"]
+    lines.extend(f"${name}: {table.hex[i]};" for name, i in table.named)
+    lines.append("")
+    lines.extend(
+        f"$fau-palette-{palette.replace('_', '-')}: ({', '.join(table.hex[table.palette_slices[palette]])});"
+        for palette in table.palettes
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _render_json(table: ExportTable, stem: str) -> str:  # noqa: ARG001
+    content = {
+        "version": table.version,
+        "colors": {
+            name: {"hex": table.hex[i], "rgb": table.rgb[i].tolist(), "rgb_uint8": table.rgb_uint8[i].tolist()}
+            for name, i in table.named
+        },
+        "palettes": {palette: list(table.hex[table.palette_slices[palette]]) for palette in table.palettes},
+    }
+    return json.dumps(content, indent=2) + "\n"
+
+
+def _ase_block(block_type: int, body: bytes) -> bytes:
+    return struct.pack(">HI", block_type, len(body)) + body
+
+
+def _ase_name(name: str) -> bytes:
+    encoded = (name + "\0").encode("utf-16-be")
+    return struct.pack(">H", len(encoded) // 2) + encoded
+
+
+def _render_ase(table: ExportTable, stem: str) -> bytes:  # noqa: ARG001
+    """Adobe Swatch Exchange file with one (global RGB) swatch per named color."""
+    blocks = [
+        _ase_block(0x0001, _ase_name(name) + b"RGB " + struct.pack(">fffH", *table.rgb[i].tolist(), 0))
+        for name, i in table.named
+    ]
+    return b"ASEF" + struct.pack(">HHI", 1, 0, len(blocks)) + b"".join(blocks)
+
+
+def _render_mplstyle(table: ExportTable, palette: str) -> str:
+    colors = ", ".join(f"'{h[1:]}'" for h in table.hex[table.palette_slices[palette]])
+    return (
+        f"# FAU colors ({table.version}, {palette}) as matplotlib color cycle.\n"
+        f"# Use with `plt.style.use(path_to_this_file)`.\n"
+        f"axes.prop_cycle: cycler('color', [{colors}])\n"
+    )
+
+
+_RENDERERS: dict[str, Callable[[ExportTable, str], str | bytes]] = {
+    "gpl": _render_gpl,
+    "tex": _render_tex,
+    "css": _render_css,
+    "scss": _render_scss,
+    "json": _render_json,
+    "ase": _render_ase,
+}
+
+
+@cache
+def _render(version: str, file_format: str, stem: str, palette: str | None) -> bytes:
+    table = _export_table(version)
+    content = _render_mplstyle(table, palette) if file_format == "mplstyle" else _RENDERERS[file_format](table, stem)
+    return content if isinstance(content, bytes) else content.encode("utf-8")
+
+
+def _outputs(version: str, file_format: str, prefix: str) -> list[tuple[str, str | None]]:
+    """Get the file stems (and the palettes for style files) of a format for a version."""
+    stem = f"{prefix}_{version}"
+    if file_format == "tex":
+        # TeX files need the color names of `cmaps_with_names`
+        return [(stem, None)] if version in PALETTE_NAMES else []
+    if file_format == "mplstyle":
+        return [
+            (stem + suffix, palette) for suffix, palette in _STYLE_VARIANTS.items() if palette in PALETTES_HEX[version]
+        ]
+    return [(stem, None)]
+
+
+def render(version: str | int, file_format: str, palette: str | None = None) -> bytes:
+    """Render the content of an export file (cached).
+
+    Parameters
+    ----------
+    version
+        The color version.
+    file_format
+        One of `EXPORT_FORMATS`.
+    palette
+        The palette used as color cycle (only for "mplstyle", defaults to "faculties").
+
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{file_format}'. Available formats are: {', '.join(EXPORT_FORMATS)}.")
+    version = normalize_version(version)
+    if file_format == "mplstyle":
+        palette = palette or "faculties"
+    return _render(version, file_format, f"fau_colors_{version}", palette)
+
+
+def _content_hash(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    try:
+        if _content_hash(path.read_bytes()) == _content_hash(content):
+            return False
+    except OSError:
+        pass
+    path.write_bytes(content)
+    return True
+
+
+def export_palettes(
+    folder_path: str | Path,
+    versions: Sequence[str | int] = VERSIONS,
+    formats: Sequence[str] = EXPORT_FORMATS,
+    *,
+    prefix: str = "fau_colors",
+) -> list[ExportResult]:
+    """Export the palettes of the given versions in all given formats.
+
+    Files are named `{prefix}_{version}.{format}` (e.g. "fau_colors_2024.css").
+    Style files are written for each variant of the faculty colors ("fau_colors_2024.mplstyle",
+    "fau_colors_2024_dark.mplstyle", ...), and TeX files only for versions with named palettes (2021 and 2024).
+    Existing files are only rewritten if their content changed.
+
+    Parameters
+    ----------
+    folder_path
+        The output folder (created if it does not exist).
+    versions
+        The color versions.
+    formats
+        The formats (see `EXPORT_FORMATS`).
+    prefix
+        The prefix of all file names.
+
+    Returns
+    -------
+    results
+        The path, format, and whether the file was (re)written for each output file.
+
+    """
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats {sorted(unknown)}. Available formats are: {', '.join(EXPORT_FORMATS)}.")
+    folder_path = Path(folder_path)
+    folder_path.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for version in map(normalize_version, versions):
+        for file_format in formats:
+            for stem, palette in _outputs(version, file_format, prefix):
+                path = folder_path.joinpath(f"{stem}.{file_format}")
+                written = _write_if_changed(path, _render(version, file_format, stem, palette))
+                results.append(ExportResult(path, file_format, written))
+    return results
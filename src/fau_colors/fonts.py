@@ -1,20 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+from contextlib import suppress
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import matplotlib
 from matplotlib import font_manager
-from matplotlib import pyplot as plt
+
+from fau_colors import diagnostics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+FONT_PATHS_ENV_VAR = "FAU_COLORS_FONT_PATHS"
+
+_FONT_NAME = "FAUSans Office"
+_FONT_GLOB = "FAUSansOffice-*.ttf"
+_CACHE_FILE_NAME = "fau_colors_fonts.json"
+_CACHE_VERSION = 2
+
+# Font files that were already added to the matplotlib font manager in this process
+_REGISTERED_FONT_PATHS: set[str] = set()
+
+
+def _system_font_dirs() -> list[Path]:
+    return [
+        Path("/Library/Fonts"),  # macOS
+        Path.home().joinpath("Library/Fonts"),  # macOS
+        Path("/usr/local/share/fonts"),  # Linux
+        Path("/usr/share/fonts"),  # Linux
+        Path.home().joinpath(".fonts"),  # Linux
+        Path("C:/Windows/Fonts/"),  # Windows
+        Path.home().joinpath("AppData/Local/Microsoft/Windows/Fonts"),  # Windows
+    ]
+
+
+def _cache_file() -> Path:
+    return Path(matplotlib.get_cachedir()).joinpath(_CACHE_FILE_NAME)
+
+
+def _dir_signature(path: Path) -> dict[str, int]:
+    """Get the modification times of a font directory and all directories below it.
+
+    Installing a font changes the mtime of the directory the file is placed in, which can be nested arbitrarily deep
+    (e.g. "/usr/share/fonts/truetype/fau").
+    Like `Path.rglob` in `_scan_font_dirs`, the walk does not follow symlinks to directories.
+    Listing the directories is still much cheaper than scanning and opening the font files.
+    """
+    signature = {str(path): path.stat().st_mtime_ns}
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        # Unreadable subdirectories are skipped (as by `Path.rglob`), they only keep their mtime in the signature
+        with suppress(OSError), os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    signature[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                    pending.append(Path(entry.path))
+    return signature
+
+
+def _scan_font_dirs(dirs: Sequence[Path]) -> list[Path]:
+    diagnostics.record_font_dirs(dirs)
+    font_paths = []
+    for path in dirs:
+        if path.is_dir():
+            font_paths.extend(p for p in sorted(path.rglob(_FONT_GLOB)) if p.is_file())
+        elif path.is_file():
+            font_paths.append(path)
+    return font_paths
+
+
+def _load_cached_font_paths(cache_file: Path, signatures: dict[str, dict[str, int]]) -> list[Path] | None:
+    try:
+        cache = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION or cache.get("dirs") != signatures:
+        return None
+    font_paths = [Path(p) for p in cache.get("fonts", [])]
+    if not all(p.is_file() for p in font_paths):
+        return None
+    return font_paths
 
 
-def register_fausans_font() -> None:
+def _store_cached_font_paths(cache_file: Path, signatures: dict[str, dict[str, int]], font_paths: list[Path]) -> None:
+    cache = {"version": _CACHE_VERSION, "dirs": signatures, "fonts": [str(p) for p in font_paths]}
+    # The cache is only an optimization. If it can not be written, we simply scan again next time.
+    with suppress(OSError):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(cache))
+        tmp_file.replace(cache_file)
+
+
+def _discover_font_paths(use_cache: bool = True) -> list[Path]:
+    """Find the FAU Sans font files in the system font directories.
+
+    The result is cached on disk and only recomputed, if the modification time of one of the font directories (or any
+    directory below them) changed.
+    """
+    dirs = [path for path in _system_font_dirs() if path.is_dir()]
+    if not use_cache:
+        return _scan_font_dirs(dirs)
+
+    signatures = {}
+    for path in dirs:
+        with suppress(OSError):
+            signatures[str(path)] = _dir_signature(path)
+    cache_file = _cache_file()
+    font_paths = _load_cached_font_paths(cache_file, signatures)
+    diagnostics.count_cache("font_dir_cache", hit=font_paths is not None)
+    if font_paths is None:
+        font_paths = _scan_font_dirs(dirs)
+        _store_cached_font_paths(cache_file, signatures, font_paths)
+    return font_paths
+
+
+def _explicit_font_paths(font_paths: Sequence[str | Path] | None) -> list[Path] | None:
+    if font_paths is None:
+        env_paths = os.environ.get(FONT_PATHS_ENV_VAR)
+        if not env_paths:
+            return None
+        font_paths = [p for p in env_paths.split(os.pathsep) if p]
+    return _scan_font_dirs([Path(p) for p in font_paths])
+
+
+def register_fausans_font(font_paths: Sequence[str | Path] | None = None, *, use_cache: bool = True) -> None:
     """Register the FAU Sans font.
 
     This function tries to register the FAU Sans font by scanning the common font directories.
     If the font is not found, it will throw an error.
 
+    The discovered font files are cached on disk (in the matplotlib cache directory) and the cache is invalidated if
+    one of the font directories changes.
+    Repeated calls within the same process do not scan the font directories again.
+
     After successful registration, the font can be used in matplotlib by setting the following rcParams:
     >>> import matplotlib.pyplot as plt
     >>> plt.rcParams["font.family"] = "sans-serif"
     >>> plt.rcParams["font.sans-serif"] = "FAUSans Office"
 
+    Parameters
+    ----------
+    font_paths
+        Optional font files or directories containing the FAU Sans font files.
+        If provided, the system font directories are not scanned.
+        Alternatively, the paths can be provided (separated by `os.pathsep`) via the environment variable
+        `FAU_COLORS_FONT_PATHS`.
+    use_cache
+        If False, the on-disk cache of discovered font files is neither used nor updated.
 
     Raises
     ------
@@ -22,36 +159,45 @@ def register_fausans_font() -> None:
         If the font file is not found.
 
     """
-    possible_paths = [
-        Path("/Library/Fonts"),  # macOS
-        Path.home().joinpath("Library/Fonts"),  # macOS
-        Path("/usr/local/share/fonts"),  # Linux
-        Path("/usr/share/fonts"),  # Linux
-        Path.home().joinpath(".fonts"),  # Linux
-        Path("C:/Windows/Fonts/"),  # Windows
-        Path.home().joinpath("AppData/Local/Microsoft/Windows/Fonts"),  # Windows
-    ]
+    with diagnostics.phase("register_fausans_font"):
+        if not _add_font_files(font_paths, use_cache=use_cache, verbose=True):
+            raise FileNotFoundError(
+                "Could not find 'FAUSans Office' font on your system. Please install it manually and try again."
+            )
+        matplotlib.rcParams["font.family"] = "sans-serif"
+        matplotlib.rcParams["font.sans-serif"] = _FONT_NAME
+
+
+def _add_font_files(
+    font_paths: Sequence[str | Path] | None = None, *, use_cache: bool = True, verbose: bool = False
+) -> bool:
+    """Add the FAU Sans font files to the matplotlib font manager without changing any rcParams.
+
+    See `register_fausans_font` for the parameters.
+
+    Returns
+    -------
+    available
+        True, if the font is available in matplotlib.
+
+    """
+    paths = _explicit_font_paths(font_paths)
+    if paths is None:
+        diagnostics.count_cache("register_fausans_font", hit=bool(_REGISTERED_FONT_PATHS))
+        paths = [] if _REGISTERED_FONT_PATHS else _discover_font_paths(use_cache=use_cache)
+
+    new_paths = [path for path in paths if str(path) not in _REGISTERED_FONT_PATHS]
+    if new_paths:
+        font_was_available = _FONT_NAME in font_manager.fontManager.get_font_names()
+        for font_path in new_paths:
+            font_manager.fontManager.addfont(font_path)
+            _REGISTERED_FONT_PATHS.add(str(font_path))
+        if verbose and not font_was_available and _FONT_NAME in font_manager.fontManager.get_font_names():
+            print(
+                "Successfully registered FAU Sans font. "
+                "You can now use it in matplotlib by adding the following lines to your code:\n\n"
+                'plt.rcParams["font.family"] = "sans-serif"\n'
+                'plt.rcParams["font.sans-serif"] = "FAUSans Office"'
+            )
 
-    font_found = False
-    for path in possible_paths:
-        if path.exists():
-            font_paths = sorted(path.rglob("FAUSansOffice-*.ttf"))
-            for font_path in font_paths:
-                if font_path.is_file():
-                    font_manager.fontManager.addfont(font_path)
-                    if not font_found and "FAUSans Office" not in font_manager.fontManager.get_font_names():
-                        print(
-                            "Successfully registered FAU Sans font. "
-                            "You can now use it in matplotlib by adding the following lines to your code:\n\n"
-                            'plt.rcParams["font.family"] = "sans-serif"\n'
-                            'plt.rcParams["font.sans-serif"] = "FAUSans Office"'
-                        )
-                    font_found = True
-
-    if font_found and "FAUSans Office" in font_manager.fontManager.get_font_names():
-        plt.rcParams["font.family"] = "sans-serif"
-        plt.rcParams["font.sans-serif"] = "FAUSans Office"
-    else:
-        raise FileNotFoundError(
-            "Could not find 'FAUSans Office' font on your system. Please install it manually and try again."
-        )
+    return bool(_REGISTERED_FONT_PATHS) and _FONT_NAME in font_manager.fontManager.get_font_names()
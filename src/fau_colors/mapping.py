@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+from functools import cache, partial
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from fau_colors._continuous import continuous_lut, resolve_continuous_name
+from fau_colors._versions import (
+    DEFAULT_VERSION,
+    normalize_color_name,
+    normalize_version,
+    palette_color_names,
+    resolve_palette_name,
+)
+from fau_colors.data import PALETTES_RGB
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import ArrayLike, DTypeLike
+
+__all__ = ["iter_tiles", "map_to_memmap", "map_to_tiles", "map_values", "map_values_lazy"]
+
+# Number of values that are processed at once. This bounds the size of the scratch buffers independent of the input.
+_CHUNK_SIZE = 2**16
+
+
+@cache
+def _get_lut(version: str, name: str, dtype: np.dtype) -> np.ndarray:
+    """Get the RGBA lookup table of a palette with an additional transparent row for invalid values at the end."""
+    if name in PALETTES_RGB[version]:
+        rgb = np.asarray(PALETTES_RGB[version][name], dtype=np.float64)
+    else:
+        rgb = continuous_lut(name).astype(np.float64)
+    lut = np.zeros((len(rgb) + 1, 4), dtype=np.float64)
+    lut[:-1, :3] = rgb
+    lut[:-1, 3] = 1.0
+    # Same conversion as `matplotlib.colors.Colormap.__call__(..., bytes=True)`
+    lut = (lut * 255).astype(np.uint8) if dtype == np.uint8 else lut.astype(dtype)
+    lut.setflags(write=False)
+    return lut
+
+
+def _resolve_cmap_name(cmap: str, version: str) -> str:
+    if version == "2024":
+        continuous_name = resolve_continuous_name(cmap)
+        if continuous_name is not None:
+            return continuous_name
+    return resolve_palette_name(cmap, version)
+
+
+@cache
+def _get_category_codes(version: str, name: str) -> dict[str, int]:
+    if name not in PALETTES_RGB[version]:
+        # Continuous colormaps have no named colors
+        return {}
+    return {color_name: i for i, color_name in enumerate(palette_color_names(name, version))}
+
+
+def _is_categorical(dtype: DTypeLike, categorical: bool | None) -> bool:
+    """Decide if values are mapped categorically (by default only strings and objects, numbers are continuous)."""
+    if categorical is None:
+        return np.dtype(dtype).kind in "USO"
+    return categorical
+
+
+def _prepare_out(out: np.ndarray | None, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    if out is None:
+        return np.empty((*shape, 4), dtype=dtype)
+    if out.shape != (*shape, 4) or out.dtype != dtype:
+        raise ValueError(f"`out` must have shape {(*shape, 4)} and dtype {dtype}, got {out.shape} and {out.dtype}.")
+    if not out.flags.c_contiguous:
+        raise ValueError("`out` must be C-contiguous.")
+    return out
+
+
+def _map_continuous(values: np.ndarray, lut: np.ndarray, vmin: float, vmax: float, out_flat: np.ndarray) -> None:
+    n_colors = len(lut) - 1
+    bad_index = n_colors
+    flat = values.reshape(-1)
+    scratch = np.empty(min(_CHUNK_SIZE, flat.size), dtype=np.float64)
+    invalid = np.empty(len(scratch), dtype=bool)
+    indices = np.empty(len(scratch), dtype=np.intp)
+    for start in range(0, flat.size, _CHUNK_SIZE):
+        block = flat[start : start + _CHUNK_SIZE]
+        n = len(block)
+        x, mask, idx = scratch[:n], invalid[:n], indices[:n]
+        # Same binning as matplotlib: normalize to [0, 1], scale to the number of colors, and clip under/over values
+        np.subtract(block, vmin, out=x)
+        if vmax != vmin:
+            np.divide(x, vmax - vmin, out=x)
+        else:
+            np.multiply(x, 0, out=x)
+        np.multiply(x, n_colors, out=x)
+        np.clip(x, 0, n_colors - 1, out=x)
+        np.isnan(x, out=mask)
+        np.copyto(x, bad_index, where=mask)
+        idx[...] = x
+        np.take(lut, idx, axis=0, out=out_flat[start : start + n])
+
+
+def _map_categorical(values: np.ndarray, lut: np.ndarray, codes: dict[str, int], out_flat: np.ndarray) -> None:
+    flat = values.reshape(-1)
+    n_colors = len(lut) - 1
+    if values.dtype.kind in "iu":
+        if flat.size and (flat.min() < 0 or flat.max() >= n_colors):
+            raise ValueError(f"Category codes must be in the range [0, {n_colors}).")
+        for start in range(0, flat.size, _CHUNK_SIZE):
+            block = flat[start : start + _CHUNK_SIZE]
+            np.take(lut, block, axis=0, out=out_flat[start : start + len(block)])
+        return
+
+    unique, inverse = np.unique(flat, return_inverse=True)
+    unique_codes = np.empty(len(unique), dtype=np.intp)
+    for i, category in enumerate(unique):
+        code = codes.get(normalize_color_name(str(category)))
+        if code is None:
+            raise ValueError(f"Unknown category '{category}'. Available categories are: {', '.join(codes)}.")
+        unique_codes[i] = code
+    for start in range(0, flat.size, _CHUNK_SIZE):
+        block = unique_codes[inverse[start : start + _CHUNK_SIZE]]
+        np.take(lut, block, axis=0, out=out_flat[start : start + len(block)])
+
+
+def map_values(
+    values: ArrayLike,
+    cmap: str = "fau-med",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    *,
+    version: str | int = DEFAULT_VERSION,
+    out: np.ndarray | None = None,
+    dtype: DTypeLike = np.uint8,
+    categorical: bool | None = None,
+) -> np.ndarray:
+    """Map an array of values to RGBA colors of one of the FAU palettes.
+
+    This is a fast alternative to `matplotlib.colormaps[cmap](norm(values))` that looks up the colors in a precomputed
+    table and processes the input in chunks, so that no full-size float64 intermediate arrays are created.
+    Continuous values are binned exactly like matplotlib bins them for a `ListedColormap`.
+    NaN values are mapped to transparent black.
+
+    Parameters
+    ----------
+    values
+        The values to map.
+        Float values are normalized using `vmin` and `vmax`.
+        For categorical mapping, integers are used as index into the palette and strings are matched against the color
+        names of the palette (e.g. "med" or "fau-med" for the "faculties" palette).
+    cmap
+        The name of the palette as found in `cmaps` of the respective version (e.g. "med_dark") or, for 2024, in
+        `cmaps_continuous` (e.g. "med_dark_cont").
+        Names with "fau-" prefix and "-" separators (e.g. "fau-med-dark") are supported as well.
+    vmin, vmax
+        The data range that is mapped to the first and last color.
+        Defaults to the minimum and maximum of `values` (ignoring NaNs).
+    version
+        The version of the FAU colors to use.
+    out
+        Optional C-contiguous output array with shape `(*values.shape, 4)` and dtype `dtype`.
+    dtype
+        The dtype of the output. `np.uint8` results in values between 0 and 255, float dtypes in values between 0 and 1.
+    categorical
+        If True, `values` are treated as category codes (integers) or names (strings).
+        Per default, string inputs are treated as categorical and all numeric inputs (including integer rasters) as
+        continuous. Pass `categorical=True` to use integers as index into the palette.
+
+    Returns
+    -------
+    rgba
+        The RGBA colors with shape `(*values.shape, 4)`. If `out` was provided, `out` is returned.
+
+    """
+    version = normalize_version(version)
+    name = _resolve_cmap_name(cmap, version)
+    dtype = np.dtype(dtype)
+    lut = _get_lut(version, name, dtype)
+
+    values = np.asarray(values)
+    out = _prepare_out(out, values.shape, dtype)
+    out_flat = out.reshape(-1, 4)
+
+    if _is_categorical(values.dtype, categorical):
+        _map_categorical(values, lut, _get_category_codes(version, name), out_flat)
+        return out
+
+    if vmin is None:
+        vmin = float(np.nanmin(values)) if values.size else 0.0
+    if vmax is None:
+        vmax = float(np.nanmax(values)) if values.size else 1.0
+    _map_continuous(values, lut, float(vmin), float(vmax), out_flat)
+    return out
+
+
+def _unwrap(values: Any) -> Any:
+    """Get the underlying (numpy, memmap, or dask) array of an xarray `DataArray`."""
+    if hasattr(values, "dims") and hasattr(values, "variable"):
+        return values.data
+    return values
+
+
+def _tile_to_numpy(tile: Any) -> np.ndarray:
+    # Dask arrays only compute the requested tile
+    return np.asarray(tile.compute() if hasattr(tile, "compute") else tile)
+
+
+def _tile_slices(shape: tuple[int, ...], tile_shape: tuple[int, ...]) -> Iterator[tuple[slice, ...]]:
+    if len(tile_shape) > len(shape) or any(size < 1 for size in tile_shape):
+        raise ValueError(f"`tile_shape` {tile_shape} must have positive sizes and at most {len(shape)} dimensions.")
+    ranges = [range(0, n, size) for n, size in zip(shape, tile_shape)]
+    for starts in product(*ranges):
+        yield tuple(slice(start, start + size) for start, size in zip(starts, tile_shape))
+
+
+def _value_range(values: Any, tile_shape: tuple[int, ...]) -> tuple[float, float]:
+    """Get the minimum and maximum (ignoring NaNs) tile by tile, so that no full-size temporary arrays are created."""
+    vmin, vmax = np.inf, -np.inf
+    for index in _tile_slices(values.shape, tile_shape):
+        tile = _tile_to_numpy(values[index])
+        if tile.size and not np.isnan(tile).all():
+            vmin, vmax = min(vmin, float(np.nanmin(tile))), max(vmax, float(np.nanmax(tile)))
+    return (0.0, 1.0) if vmin > vmax else (vmin, vmax)
+
+
+def iter_tiles(
+    values: Any,
+    cmap: str = "fau-med",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    *,
+    tile_shape: tuple[int, ...] = (1024, 1024),
+    version: str | int = DEFAULT_VERSION,
+    categorical: bool | None = None,
+) -> Iterator[tuple[tuple[slice, ...], np.ndarray]]:
+    """Map a large array to uint8 RGBA colors tile by tile.
+
+    Only one tile of the input is loaded at a time, so `values` can be a `np.memmap`, a dask array, or an xarray
+    `DataArray` larger than the available memory.
+    The memory used is bounded by the tile size, independent of the size of the input.
+    If `vmin` or `vmax` are not provided, they are computed in an additional pass over all tiles.
+
+    Parameters
+    ----------
+    values
+        The values to map. See `map_values` for details.
+    cmap, vmin, vmax, version, categorical
+        See `map_values`.
+    tile_shape
+        The maximal shape of the tiles along the first dimensions of `values`.
+        All remaining dimensions are not split.
+
+    Yields
+    ------
+    index
+        The slices of the tile in `values`.
+    rgba
+        The uint8 RGBA colors of the tile with shape `(*tile.shape, 4)`.
+        The array is reused for the next tile, so copy it if you need to keep it.
+
+    """
+    values = _unwrap(values)
+    tile_shape = tuple(tile_shape)
+    categorical = _is_categorical(values.dtype, categorical)
+    if not categorical and (vmin is None or vmax is None):
+        data_min, data_max = _value_range(values, tile_shape)
+        vmin = data_min if vmin is None else vmin
+        vmax = data_max if vmax is None else vmax
+
+    buffer = np.empty(
+        (
+            *(min(n, size) for n, size in zip(values.shape, tile_shape)),
+            *values.shape[len(tile_shape) :],
+            4,
+        ),
+        dtype=np.uint8,
+    )
+    for index in _tile_slices(values.shape, tile_shape):
+        tile = _tile_to_numpy(values[index])
+        n = int(np.prod(tile.shape, dtype=np.int64)) * 4
+        out = buffer.reshape(-1)[:n].reshape(*tile.shape, 4)
+        yield index, map_values(tile, cmap, vmin, vmax, version=version, out=out, categorical=categorical)
+
+
+def map_to_memmap(
+    values: Any,
+    out: str | Path | np.ndarray,
+    cmap: str = "fau-med",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    *,
+    tile_shape: tuple[int, ...] = (1024, 1024),
+    version: str | int = DEFAULT_VERSION,
+    categorical: bool | None = None,
+) -> np.ndarray:
+    """Map a large array to uint8 RGBA colors and write them tile by tile into a (memory-mapped) array.
+
+    Parameters
+    ----------
+    values
+        The values to map (e.g. a `np.memmap`, dask array, or xarray `DataArray`). See `iter_tiles` for details.
+    out
+        Either the path of a `.npy` file, which is created as memory-mapped array, or an existing uint8 array (e.g. a
+        `np.memmap`) with shape `(*values.shape, 4)`.
+    cmap, vmin, vmax, tile_shape, version, categorical
+        See `iter_tiles`.
+
+    Returns
+    -------
+    rgba
+        The output array.
+
+    """
+    values = _unwrap(values)
+    shape = (*values.shape, 4)
+    if isinstance(out, (str, Path)):
+        out = np.lib.format.open_memmap(out, mode="w+", dtype=np.uint8, shape=shape)
+    elif out.shape != shape or out.dtype != np.uint8:
+        raise ValueError(f"`out` must have shape {shape} and dtype uint8, got {out.shape} and {out.dtype}.")
+    tiles = iter_tiles(values, cmap, vmin, vmax, tile_shape=tile_shape, version=version, categorical=categorical)
+    for index, rgba in tiles:
+        out[index] = rgba
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def map_to_tiles(
+    values: Any,
+    folder_path: str | Path,
+    cmap: str = "fau-med",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    *,
+    tile_shape: tuple[int, int] = (1024, 1024),
+    version: str | int = DEFAULT_VERSION,
+    categorical: bool | None = None,
+) -> list[Path]:
+    """Map a large 2D array to colors and save each tile as PNG file (e.g. for tile based image viewers).
+
+    The tiles are named `{row}_{column}.png` by their tile index.
+
+    Parameters
+    ----------
+    values
+        The 2D values to map (e.g. a `np.memmap`, dask array, or xarray `DataArray`). See `iter_tiles` for details.
+    folder_path
+        The output folder (created if it does not exist).
+    cmap, vmin, vmax, tile_shape, version, categorical
+        See `iter_tiles`.
+
+    Returns
+    -------
+    paths
+        The written files.
+
+    """
+    from PIL import Image
+
+    values = _unwrap(values)
+    if values.ndim != 2:
+        raise ValueError(f"`values` must be 2D to be saved as image tiles, got {values.ndim} dimensions.")
+    folder_path = Path(folder_path)
+    folder_path.mkdir(parents=True, exist_ok=True)
+    paths = []
+    tiles = iter_tiles(values, cmap, vmin, vmax, tile_shape=tile_shape, version=version, categorical=categorical)
+    for (rows, columns), rgba in tiles:
+        path = folder_path / f"{rows.start // tile_shape[0]}_{columns.start // tile_shape[1]}.png"
+        Image.fromarray(rgba, mode="RGBA").save(path)
+        paths.append(path)
+    return paths
+
+
+def map_values_lazy(
+    values: Any,
+    cmap: str = "fau-med",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    *,
+    version: str | int = DEFAULT_VERSION,
+    dtype: DTypeLike = np.uint8,
+    categorical: bool | None = None,
+) -> Any:
+    """Map a dask array or an xarray `DataArray` to RGBA colors lazily (block by block, when computed).
+
+    The result has the same chunks as the input, plus a (single chunk) RGBA dimension at the end.
+    For a `DataArray`, the result is a `DataArray` with an additional "rgba" dimension.
+    If `vmin` or `vmax` are not provided, they are computed from the data right away.
+
+    Parameters
+    ----------
+    values
+        The dask array or `DataArray` to map.
+    cmap, vmin, vmax, version, dtype, categorical
+        See `map_values`.
+
+    Returns
+    -------
+    rgba
+        The lazily mapped colors.
+
+    """
+    data = _unwrap(values)
+    if not hasattr(data, "map_blocks"):
+        if data is values:
+            raise TypeError(
+                "`values` must be a dask array or an xarray `DataArray`. Use `map_values` for other arrays."
+            )
+        # A `DataArray` backed by an in-memory array
+        rgba = map_values(data, cmap, vmin, vmax, version=version, dtype=dtype, categorical=categorical)
+        return values.expand_dims(rgba=["r", "g", "b", "a"], axis=-1).copy(data=rgba)
+
+    categorical = _is_categorical(data.dtype, categorical)
+    if not categorical and (vmin is None or vmax is None):
+        # `np.nanmin` dispatches to dask
+        vmin = float(np.nanmin(data).compute()) if vmin is None else vmin
+        vmax = float(np.nanmax(data).compute()) if vmax is None else vmax
+
+    # `dtype` is consumed by `map_blocks` itself, so all options are bound beforehand
+    func = partial(map_values, cmap=cmap, vmin=vmin, vmax=vmax, version=version, dtype=dtype, categorical=categorical)
+    rgba = data.map_blocks(
+        func,
+        dtype=np.dtype(dtype),
+        new_axis=data.ndim,
+        chunks=(*data.chunks, (4,)),
+        meta=np.empty((0,) * (data.ndim + 1), dtype=dtype),
+    )
+    if data is values:
+        return rgba
+    return values.expand_dims(rgba=["r", "g", "b", "a"], axis=-1).copy(data=rgba)
@@ -0,0 +1,325 @@
+"""Replace the colors of one version by their closest equivalents of another version in SVG, TeX, and mplstyle files.
+
+The module can be used as library (`translation_table`, `migrate`) or from the command line:
+
+.. code-block:: bash
+
+    python -m fau_colors.migrate figures/ slides/ --source 2021 --target 2024 --dry-run
+
+Each color of the source version is mapped to the target color with the same name (e.g. "med_dark" or "med_dark_250")
+or, if no such color exists, to the perceptually closest target color (OKLab).
+Files are rewritten line by line with a single regex pass per file.
+With a state file, files that did not change since the last run are skipped based on their content hash.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections import namedtuple
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fau_colors._parallel import imap_bounded, iter_files
+from fau_colors._versions import normalize_version
+from fau_colors.data import VERSIONS
+from fau_colors.quantization import _nearest_colors, _palette_in_space
+from fau_colors.registry import get_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+__all__ = ["MigrationResult", "main", "migrate", "translation_table"]
+
+SUFFIXES = (".svg", ".tex", ".mplstyle")
+
+MigrationResult = namedtuple("MigrationResult", ["path", "n_replacements", "changed", "skipped", "diff", "error"])
+
+_STATE_VERSION = 1
+_HASH_CHUNK_SIZE = 2**20
+
+_HEX = r"(?P<hash>#[0-9a-fA-F]{6})(?![0-9a-fA-F])"
+_PATTERNS = {
+    ".svg": re.compile(_HEX + r"|(?P<rgb8>rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\))"),
+    ".tex": re.compile(
+        r"(?P<html>\{HTML\}\s*\{[0-9a-fA-F]{6}\})|(?P<rgb>\{rgb\}\s*\{[^}]*\})|(?P<rgb8>\{RGB\}\s*\{[^}]*\})|" + _HEX
+    ),
+    # Matplotlib style files also allow hex colors without "#", either as value of a color key (e.g.
+    # "axes.facecolor: 04316A") or quoted (e.g. in "cycler('color', ['04316A'])"), so that six digit numbers of other
+    # keys (e.g. "agg.path.chunksize: 100000") are not mistaken for colors
+    ".mplstyle": re.compile(
+        _HEX + r"|(?P<bare>^[ \t]*[\w.]*color[ \t]*:[ \t]*[0-9a-fA-F]{6}(?=[ \t]*(?:#|\r?$))"
+        r"|(?<=['\"])[0-9a-fA-F]{6}(?=['\"]))"
+    ),
+}
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+@cache
+def _translation_table(source: str, target: str) -> Mapping[str, str]:
+    registry = get_registry()
+    source_records = registry.select(source)
+    target_records = registry.select(target)
+    target_coords = _palette_in_space(tuple(r.rgb for r in target_records), "oklab")
+    nearest, _ = _nearest_colors(np.array([r.rgb for r in source_records]), target_coords, "oklab")
+
+    table = {}
+    for record, nearest_index in zip(source_records, nearest):
+        if (target, record.name) in registry:
+            target_hex = registry.get(record.name, target).hex
+        else:
+            target_hex = target_records[nearest_index].hex
+        table.setdefault(record.hex, target_hex)
+    return MappingProxyType(table)
+
+
+def translation_table(source: str | int = "2021", target: str | int = "2024") -> Mapping[str, str]:
+    """Get the mapping from all colors of the source version to their equivalents in the target version.
+
+    Colors are matched by name first (e.g. "med_dark_250" to "med_dark_250") and by the smallest OKLab distance
+    second (e.g. the 2021 "light" ramps).
+
+    Returns
+    -------
+    table
+        Read-only mapping from upper case source hex values (e.g. "#00A3E0") to target hex values. Cached per pair
+        of versions.
+
+    """
+    return _translation_table(normalize_version(source), normalize_version(target))
+
+
+def _match_case(new_hex: str, old_hex: str) -> str:
+    return new_hex.lower() if old_hex.islower() else new_hex
+
+
+class _Rewriter:
+    """Replacement function for `re.sub` that counts the replaced colors."""
+
+    __slots__ = ("n_replacements", "table")
+
+    def __init__(self, table: Mapping[str, str]) -> None:
+        self.table = table
+        self.n_replacements = 0
+
+    def _lookup(self, rgb8: Sequence[int]) -> str | None:
+        return self.table.get("#{:02X}{:02X}{:02X}".format(*rgb8))
+
+    def __call__(self, match: re.Match) -> str:
+        text = match.group()
+        kind = match.lastgroup
+        if kind in ("hash", "bare", "html"):
+            old_hex = text[-7:-1] if kind == "html" else text[-6:]
+            new_hex = self.table.get(f"#{old_hex.upper()}")
+            if new_hex is None or new_hex == f"#{old_hex.upper()}":
+                return text
+            replacement = text[: len(text) - 6 - (kind == "html")] + _match_case(new_hex[1:], old_hex)
+            replacement += "}" if kind == "html" else ""
+        else:
+            prefix_end = text.index("(") + 1 if kind == "rgb8" and text.startswith("rgb") else text.rindex("{") + 1
+            values = [float(v) for v in _NUMBER.findall(text[prefix_end:])]
+            if len(values) != 3:
+                return text
+            rgb8 = [round(v * 255) if kind == "rgb" else round(v) for v in values]
+            new_hex = self._lookup(rgb8)
+            if new_hex is None or new_hex == "#{:02X}{:02X}{:02X}".format(*rgb8):
+                return text
+            new_rgb8 = [int(new_hex[i : i + 2], 16) for i in (1, 3, 5)]
+            new_values = [v / 255 for v in new_rgb8] if kind == "rgb" else new_rgb8
+            replacement = text[:prefix_end] + ", ".join(str(v) for v in new_values) + text[-1]
+        # Colors that are mapped to themselves (e.g. when migrating to the same version) are not counted
+        if replacement != text:
+            self.n_replacements += 1
+        return replacement
+
+
+def file_hash(path: Path) -> str:
+    """Get the blake2b hash of the content of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _rewrite(path: Path, pattern: re.Pattern, rewriter: _Rewriter, dry_run: bool) -> tuple[bool, str, str]:
+    """Stream the file through the regex. Returns if it changed, the new hash, and (for dry runs) the diff."""
+    digest = hashlib.blake2b(digest_size=16)
+    old_lines, new_lines = [], []
+    changed = False
+    out = None
+    if not dry_run:
+        out = tempfile.NamedTemporaryFile(  # noqa: SIM115
+            "w", encoding="utf-8", newline="", dir=path.parent, prefix=f".{path.name}.", delete=False
+        )
+    try:
+        with path.open("r", encoding="utf-8", newline="") as f:
+            for line in f:
+                new_line = pattern.sub(rewriter, line)
+                digest.update(new_line.encode("utf-8"))
+                changed |= new_line != line
+                if out is None:
+                    old_lines.append(line)
+                    new_lines.append(new_line)
+                else:
+                    out.write(new_line)
+    except BaseException:
+        if out is not None:
+            out.close()
+            Path(out.name).unlink()
+        raise
+
+    if out is not None:
+        out.close()
+        if changed:
+            shutil.copymode(path, out.name)
+            Path(out.name).replace(path)
+        else:
+            Path(out.name).unlink()
+    diff = "".join(difflib.unified_diff(old_lines, new_lines, str(path), str(path))) if changed else ""
+    return changed, digest.hexdigest(), diff
+
+
+def _migrate_file(
+    item: tuple[str, str | None], table: Mapping[str, str], dry_run: bool
+) -> tuple[MigrationResult, str | None]:
+    path, known_hash = item
+    file_path = Path(path)
+    try:
+        if known_hash is not None and file_hash(file_path) == known_hash:
+            return MigrationResult(path, 0, False, True, "", None), known_hash
+        pattern = _PATTERNS.get(file_path.suffix.lower(), _PATTERNS[".svg"])
+        rewriter = _Rewriter(table)
+        changed, new_hash, diff = _rewrite(file_path, pattern, rewriter, dry_run)
+    except (OSError, UnicodeDecodeError) as e:
+        return MigrationResult(path, 0, False, False, "", f"{type(e).__name__}: {e}"), None
+    return MigrationResult(path, rewriter.n_replacements, changed, False, diff, None), new_hash
+
+
+def _load_state(state_file: Path | None, key: str) -> dict[str, str]:
+    if state_file is None:
+        return {}
+    try:
+        state = json.loads(state_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+        return {}
+    return dict(state.get("files", {}).get(key, {}))
+
+
+def _store_state(state_file: Path, key: str, hashes: dict[str, str]) -> None:
+    try:
+        state = json.loads(state_file.read_text())
+    except (OSError, ValueError):
+        state = {}
+    if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+        state = {"version": _STATE_VERSION, "files": {}}
+    state["files"][key] = hashes
+    tmp_file = state_file.with_name(f".{state_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(state, indent=1, sort_keys=True))
+    tmp_file.replace(state_file)
+
+
+def migrate(
+    paths: Iterable[str | Path],
+    source: str | int = "2021",
+    target: str | int = "2024",
+    *,
+    dry_run: bool = False,
+    state_file: str | Path | None = None,
+    max_workers: int | None = None,
+) -> Iterator[MigrationResult]:
+    """Replace all colors of the source version in SVG, TeX, and mplstyle files by their target equivalents.
+
+    Supported are hex colors (`#RRGGBB`) in all files, `rgb(r, g, b)` in SVG files, `{HTML}{RRGGBB}`, `{rgb}{r, g, b}`,
+    and `{RGB}{r, g, b}` color definitions in TeX files, and hex colors without `#` in mplstyle files (as value of a
+    color key or quoted).
+    The files are processed by a bounded process pool and rewritten atomically.
+
+    Parameters
+    ----------
+    paths
+        Files or directories (searched recursively for `.svg`, `.tex`, and `.mplstyle` files).
+    source, target
+        The versions to migrate from and to.
+    dry_run
+        If True, no files are changed and the results contain a unified diff of the changes instead.
+    state_file
+        Optional JSON file with the content hashes of the processed files.
+        Files whose content did not change since the last (non dry) run with the same versions are skipped.
+    max_workers
+        The number of worker processes. Defaults to the number of CPUs. Use 0 to process all files in this process.
+
+    Returns
+    -------
+    results
+        One `MigrationResult` per file (in completion order) with the number of replaced colors, whether the file
+        changed, whether it was skipped, the diff (dry runs only), and an error message if the file could not be
+        processed.
+
+    """
+    source, target = normalize_version(source), normalize_version(target)
+    table = dict(translation_table(source, target))
+    state_file = Path(state_file) if state_file is not None else None
+    key = f"{source}->{target}"
+    hashes = _load_state(state_file, key)
+
+    items = ((path, hashes.get(path)) for path in (str(p.resolve()) for p in iter_files(paths, SUFFIXES)))
+    try:
+        for result, new_hash in imap_bounded(_migrate_file, items, (table, dry_run), max_workers):
+            if new_hash is not None and not dry_run:
+                hashes[result.path] = new_hash
+            yield result
+    finally:
+        if state_file is not None and not dry_run:
+            _store_state(state_file, key, hashes)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="fau-colors-migrate", description="Replace the colors of one FAU color version by another one."
+    )
+    parser.add_argument("paths", nargs="+", help="Files or directories (searched recursively).")
+    parser.add_argument("--source", default="2021", choices=VERSIONS, help="The version to migrate from.")
+    parser.add_argument("--target", default="2024", choices=VERSIONS, help="The version to migrate to.")
+    parser.add_argument("--dry-run", action="store_true", help="Print a diff instead of changing the files.")
+    parser.add_argument("--state-file", type=Path, default=None, help="JSON file to skip unchanged files on reruns.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    args = parser.parse_args(argv)
+
+    failed = False
+    n_changed = n_skipped = 0
+    for result in migrate(
+        args.paths,
+        args.source,
+        args.target,
+        dry_run=args.dry_run,
+        state_file=args.state_file,
+        max_workers=args.workers,
+    ):
+        if result.error is not None:
+            failed = True
+            print(f"{result.path}: {result.error}", file=sys.stderr)
+        n_changed += result.changed
+        n_skipped += result.skipped
+        if args.dry_run:
+            sys.stdout.write(result.diff)
+    action = "Would change" if args.dry_run else "Changed"
+    print(f"{action} {n_changed} file(s), skipped {n_skipped} unchanged file(s).", file=sys.stderr)
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
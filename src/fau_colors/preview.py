@@ -0,0 +1,240 @@
+"""Render colormap strips and color swatches directly into RGBA arrays.
+
+Nothing in this module uses pyplot or the global colormap registry: colors are taken from `fau_colors.data`, text
+is rasterized with FreeType (via `matplotlib.ft2font`), and PNGs are encoded with Pillow.
+This makes rendering a preview cheap enough to do per request (e.g. in a web app) and safe to run in parallel.
+
+>>> from fau_colors.preview import render_strips, to_png
+>>> image = render_strips("2024")
+>>> image.shape
+(500, 1000, 4)
+>>> png = to_png(image)
+
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib import font_manager
+from matplotlib.ft2font import FT2Font
+from PIL import Image
+
+from fau_colors._colorspace import relative_luminance
+from fau_colors._parallel import imap_bounded
+from fau_colors._versions import DEFAULT_VERSION, normalize_version, palette_color_names, resolve_palette_name
+from fau_colors.data import COLORS, COLORS_ALL, PALETTES_RGB_UINT8
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+__all__ = ["render_overviews", "render_strips", "render_swatches", "save_png", "to_png"]
+
+_BACKGROUND = (255, 255, 255, 255)
+_TEXT_COLOR = (0, 0, 0)
+# FT2Font objects are not thread safe
+_FONT_LOCK = threading.Lock()
+
+
+@cache
+def _font(family: str) -> FT2Font:
+    return FT2Font(font_manager.findfont(family))
+
+
+@lru_cache(maxsize=1024)
+def _text_mask(text: str, size: float, angle: float = 0.0, font: str = "DejaVu Sans") -> np.ndarray:
+    """Rasterize a text into an (antialiased) coverage mask with values in [0, 1]."""
+    with _FONT_LOCK:
+        ft2font = _font(font)
+        # With 72 dpi the size is in pixels
+        ft2font.set_size(size, 72)
+        ft2font.set_text(text, angle)
+        ft2font.draw_glyphs_to_bitmap(antialiased=True)
+        mask = np.asarray(ft2font.get_image(), dtype=np.float32) / 255
+    mask.setflags(write=False)
+    return mask
+
+
+def _blit_text(image: np.ndarray, mask: np.ndarray, x: int, y: int, color: Sequence[int]) -> None:
+    """Blend a text mask with its top left corner at (x, y) into the image (clipped at the borders)."""
+    height, width = image.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + mask.shape[1], width), min(y + mask.shape[0], height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    alpha = mask[y0 - y : y1 - y, x0 - x : x1 - x, None]
+    region = image[y0:y1, x0:x1, :3]
+    region[:] = np.round(region * (1 - alpha) + np.asarray(color, dtype=np.float32) * alpha).astype(np.uint8)
+
+
+def _text_color(rgb_uint8: Sequence[int]) -> tuple[int, int, int]:
+    """Get black or white, whichever has the higher contrast to the background."""
+    luminance = float(relative_luminance(np.asarray(rgb_uint8, dtype=np.float64) / 255))
+    # Black and white have the same contrast ratio at a luminance of ~0.179
+    return (0, 0, 0) if (luminance + 0.05) / 0.05 > 1.05 / (luminance + 0.05) else (255, 255, 255)
+
+
+def render_strips(
+    version: str | int = DEFAULT_VERSION,
+    names: Sequence[str] | None = None,
+    *,
+    size: tuple[int, int] = (1000, 500),
+    font_size: float = 14,
+    font: str = "DejaVu Sans",
+) -> np.ndarray:
+    """Render each palette as vertical strip with its (rotated) name on top.
+
+    The first color of each palette is at the bottom of its strip.
+
+    Parameters
+    ----------
+    version
+        The color version.
+    names
+        The palettes (as in `cmaps`). By default, all palettes of the version are rendered.
+    size
+        The (width, height) of the image in pixels.
+    font_size
+        The font size of the names in pixels.
+    font
+        The font family used for the names.
+
+    Returns
+    -------
+    image
+        An RGBA image of shape (height, width, 4) with dtype uint8.
+
+    """
+    version = normalize_version(version)
+    palettes = PALETTES_RGB_UINT8[version]
+    names = list(palettes) if names is None else [resolve_palette_name(name, version) for name in names]
+    width, height = size
+    image = np.empty((height, width, 4), dtype=np.uint8)
+    image[:] = _BACKGROUND
+
+    margin = 10
+    masks = [_text_mask(name, font_size, 90, font) for name in names]
+    top = margin + max(mask.shape[0] for mask in masks) + margin // 2
+    strip_height = height - top - margin
+    if strip_height <= 0:
+        raise ValueError(f"The image height ({height}) is too small for the palette names.")
+
+    edges = np.linspace(margin, width - margin, len(names) + 1).round().astype(int)
+    gap = max(1, (edges[1] - edges[0]) // 5)
+    # Index of the palette color for each row (from the bottom)
+    rows = np.arange(strip_height)[::-1]
+    for name, mask, x0, x1 in zip(names, masks, edges[:-1], edges[1:]):
+        rgb = np.asarray(palettes[name], dtype=np.uint8)
+        image[top : top + strip_height, x0 : x1 - gap, :3] = rgb[rows * len(rgb) // strip_height][:, None]
+        center = (x0 + x1 - gap) // 2
+        _blit_text(image, mask, center - mask.shape[1] // 2, top - margin // 2 - mask.shape[0], _TEXT_COLOR)
+    return image
+
+
+def render_swatches(
+    version: str | int = DEFAULT_VERSION,
+    palette: str | None = None,
+    *,
+    columns: int = 6,
+    swatch_size: tuple[int, int] = (160, 90),
+    font_size: float = 13,
+    font: str = "DejaVu Sans",
+) -> np.ndarray:
+    """Render the colors of a palette as grid of swatches annotated with name and hex value.
+
+    Parameters
+    ----------
+    version
+        The color version.
+    palette
+        The palette (as in `cmaps`). By default, all base colors (`colors_all`, or `colors` for 2019) are rendered.
+    columns
+        The number of swatches per row.
+    swatch_size
+        The (width, height) of each swatch in pixels.
+    font_size
+        The font size of the annotations in pixels.
+    font
+        The font family used for the annotations.
+
+    Returns
+    -------
+    image
+        An RGBA image of shape (height, width, 4) with dtype uint8.
+
+    """
+    version = normalize_version(version)
+    if palette is None:
+        colors = COLORS_ALL.get(version, COLORS[version])
+        names = list(colors)
+        hex_colors = [hex_color.upper() for hex_color in colors.values()]
+        rgb = np.array([[int(h[i : i + 2], 16) for i in (1, 3, 5)] for h in hex_colors], dtype=np.uint8)
+    else:
+        palette = resolve_palette_name(palette, version)
+        names = list(palette_color_names(palette, version))
+        rgb = np.asarray(PALETTES_RGB_UINT8[version][palette], dtype=np.uint8)
+        hex_colors = ["#{:02X}{:02X}{:02X}".format(*color) for color in rgb.tolist()]
+
+    swatch_width, swatch_height = swatch_size
+    gap = 4
+    n_rows = -(-len(names) // columns)
+    n_columns = min(columns, len(names))
+    image = np.empty((n_rows * (swatch_height + gap) + gap, n_columns * (swatch_width + gap) + gap, 4), dtype=np.uint8)
+    image[:] = _BACKGROUND
+
+    padding = 6
+    for i, (name, hex_color, color) in enumerate(zip(names, hex_colors, rgb)):
+        x = gap + (i % columns) * (swatch_width + gap)
+        y = gap + (i // columns) * (swatch_height + gap)
+        image[y : y + swatch_height, x : x + swatch_width, :3] = color
+        text_color = _text_color(color)
+        label = _text_mask(name, font_size, 0, font)
+        _blit_text(image, label, x + padding, y + padding, text_color)
+        value = _text_mask(hex_color, font_size, 0, font)
+        _blit_text(image, value, x + padding, y + swatch_height - padding - value.shape[0], text_color)
+    return image
+
+
+def to_png(image: np.ndarray) -> bytes:
+    """Encode an RGBA image as PNG."""
+    buffer = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(image), mode="RGBA").save(buffer, format="png")
+    return buffer.getvalue()
+
+
+def save_png(image: np.ndarray, path: str | Path) -> Path:
+    """Save an RGBA image as PNG file."""
+    path = Path(path)
+    path.write_bytes(to_png(image))
+    return path
+
+
+def _render_overview(item: tuple[str, Path]) -> Path:
+    version, path = item
+    return save_png(render_strips(version), path)
+
+
+def render_overviews(paths: Mapping[str | int, str | Path], *, max_workers: int | None = None) -> list[Path]:
+    """Render the strips of all palettes of multiple versions in parallel and save them as PNG files.
+
+    Parameters
+    ----------
+    paths
+        The output file for each version (e.g. `{"2024": "cms_24.png"}`).
+    max_workers
+        The number of worker processes (defaults to the number of CPUs).
+        Use 0 to render all versions in the calling process.
+
+    Returns
+    -------
+    paths
+        The written files (in completion order).
+
+    """
+    items = [(normalize_version(version), Path(path)) for version, path in paths.items()]
+    return list(imap_bounded(_render_overview, items, max_workers=max_workers))
@@ -0,0 +1,188 @@
+"""Snap images to the nearest colors of an FAU palette."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from fau_colors._colorspace import linear_to_oklab, srgb_to_linear, to_rgb_array
+from fau_colors._versions import DEFAULT_VERSION, normalize_version, resolve_palette_name
+from fau_colors.data import PALETTES_RGB
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import ArrayLike
+
+    from fau_colors._colorspace import Color
+
+__all__ = ["QUANTIZE_SPACES", "quantize"]
+
+QUANTIZE_SPACES = ("srgb", "linear", "oklab")
+QuantizeSpace = Literal["srgb", "linear", "oklab"]
+
+# Upper bound for the number of pixel/palette distances computed at once (memory of the distance matrix)
+_MAX_DISTANCES_PER_CHUNK = 2**22
+
+
+@cache
+def _srgb8_to_linear() -> np.ndarray:
+    return srgb_to_linear(np.arange(256) / 255).astype(np.float32)
+
+
+def _pixels_to_space(pixels: np.ndarray, space: str) -> np.ndarray:
+    """Convert (n, 3) uint8 or float sRGB pixels to float32 coordinates in the given space."""
+    if pixels.dtype == np.uint8:
+        if space == "srgb":
+            return pixels.astype(np.float32) / 255
+        linear = _srgb8_to_linear()[pixels]
+    else:
+        if space == "srgb":
+            return pixels.astype(np.float32)
+        linear = srgb_to_linear(pixels).astype(np.float32)
+    if space == "linear":
+        return linear
+    return linear_to_oklab(linear).astype(np.float32)
+
+
+@cache
+def _palette_in_space(palette: tuple[tuple[float, float, float], ...], space: str) -> np.ndarray:
+    return _pixels_to_space(np.array(palette, dtype=np.float64), space)
+
+
+def _nearest_colors(pixels: np.ndarray, palette_coords: np.ndarray, space: str) -> tuple[np.ndarray, np.ndarray]:
+    """Find the index of and the distance to the nearest palette color for (n, 3) pixels."""
+    coords = _pixels_to_space(pixels, space)
+    # |x - p|^2 = |x|^2 - 2 x.p + |p|^2, which avoids an (n, k, 3) intermediate array
+    dist = coords @ (-2 * palette_coords.T)
+    dist += np.einsum("ij,ij->i", palette_coords, palette_coords)[None, :]
+    indices = np.argmin(dist, axis=1)
+    min_dist = np.take_along_axis(dist, indices[:, None], axis=1)[:, 0]
+    min_dist += np.einsum("ij,ij->i", coords, coords)
+    return indices, np.sqrt(np.maximum(min_dist, 0, out=min_dist), out=min_dist)
+
+
+@cache
+def _lookup_cube(palette: tuple[tuple[float, float, float], ...], space: str, bits: int) -> np.ndarray:
+    """Nearest palette index for the center of each cell of a uint8 RGB cube with `2**bits` cells per channel."""
+    size = 2**bits
+    centers = np.round((np.arange(size) + 0.5) * (256 / size) - 0.5).astype(np.uint8)
+    grid = np.stack(np.meshgrid(centers, centers, centers, indexing="ij"), axis=-1).reshape(-1, 3)
+    indices, _ = _nearest_colors(grid, _palette_in_space(palette, space), space)
+    cube = indices.astype(np.uint8 if len(palette) <= 256 else np.uint16).reshape(size, size, size)
+    cube.setflags(write=False)
+    return cube
+
+
+def _resolve_palette(palette: str | Sequence[Color], version: str | int) -> tuple[tuple[float, float, float], ...]:
+    if isinstance(palette, str):
+        version = normalize_version(version)
+        return PALETTES_RGB[version][resolve_palette_name(palette, version)]
+    return tuple(map(tuple, to_rgb_array(palette).tolist()))
+
+
+def _check_input(image: np.ndarray, space: str, lut_bits: int | None) -> None:
+    if space not in QUANTIZE_SPACES:
+        raise ValueError(f"Unknown color space '{space}'. Available spaces are: {', '.join(QUANTIZE_SPACES)}.")
+    if image.ndim < 1 or image.shape[-1] not in (3, 4):
+        raise ValueError(f"`image` needs 3 or 4 color channels in the last dimension, got shape {image.shape}.")
+    if image.dtype != np.uint8 and image.dtype.kind != "f":
+        raise ValueError(f"`image` must be a uint8 or float array, got {image.dtype}.")
+    if lut_bits is not None and (image.dtype != np.uint8 or not 1 <= lut_bits <= 8):
+        raise ValueError("`lut_bits` requires a uint8 image and must be between 1 and 8.")
+
+
+def _run_chunked(process: Callable[[slice], None], n_pixels: int, chunk_size: int, n_jobs: int | None) -> None:
+    chunks = [slice(start, min(start + chunk_size, n_pixels)) for start in range(0, n_pixels, chunk_size)]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(chunks))
+    if n_jobs <= 1:
+        for chunk in chunks:
+            process(chunk)
+        return
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        list(executor.map(process, chunks))
+
+
+def quantize(
+    image: ArrayLike,
+    palette: str | Sequence[Color] = "faculties_all",
+    space: QuantizeSpace = "oklab",
+    *,
+    version: str | int = DEFAULT_VERSION,
+    lut_bits: int | None = None,
+    n_jobs: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Replace every pixel of an image by the nearest color of a palette.
+
+    The image is processed in chunks by multiple threads.
+    As the distance computations run in numpy, the GIL is released for most of the work.
+
+    Parameters
+    ----------
+    image
+        An RGB(A) image with shape (..., 3) or (..., 4), either as uint8 (0-255) or float (0-1) array.
+        An alpha channel is copied to the output unchanged.
+    palette
+        The name of a palette in `cmaps` of the given version (e.g. "faculties_all" or "fau-med") or a sequence of
+        colors (hex strings or RGB tuples).
+    space
+        The color space in which the distance between pixels and palette colors is measured.
+    version
+        The color version used to look up named palettes.
+    lut_bits
+        If provided (uint8 images only), the nearest colors are taken from a precomputed lookup cube with
+        `2**lut_bits` cells per channel instead of computing the distances for every pixel.
+        This is faster for large images, but pixels close to the border between two palette colors might be assigned
+        to the second nearest color. The cube is cached per palette, space, and resolution.
+    n_jobs
+        The number of threads. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    quantized
+        The image with each pixel replaced by its nearest palette color (same shape and dtype as the input).
+    indices
+        The index of the palette color of each pixel (shape of the image without the channel axis).
+
+    """
+    image = np.asarray(image)
+    _check_input(image, space, lut_bits)
+
+    palette_rgb = _resolve_palette(palette, version)
+    palette_out = np.asarray(palette_rgb, dtype=np.float64)
+    palette_out = np.round(palette_out * 255).astype(np.uint8) if image.dtype == np.uint8 else palette_out
+    palette_out = palette_out.astype(image.dtype, copy=False)
+
+    pixels = image.reshape(-1, image.shape[-1])
+    quantized = np.empty_like(pixels)
+    indices = np.empty(len(pixels), dtype=np.uint8 if len(palette_rgb) <= 256 else np.uint16)
+
+    if lut_bits is not None:
+        cube = _lookup_cube(palette_rgb, space, lut_bits)
+        shift = 8 - lut_bits
+
+        def _process(chunk: slice) -> None:
+            rgb = pixels[chunk, :3] >> shift
+            indices[chunk] = cube[rgb[:, 0], rgb[:, 1], rgb[:, 2]]
+            np.take(palette_out, indices[chunk], axis=0, out=quantized[chunk, :3])
+
+        chunk_size = 2**18
+    else:
+        palette_coords = _palette_in_space(palette_rgb, space)
+
+        def _process(chunk: slice) -> None:
+            nearest, _ = _nearest_colors(pixels[chunk, :3], palette_coords, space)
+            indices[chunk] = nearest
+            np.take(palette_out, nearest, axis=0, out=quantized[chunk, :3])
+
+        chunk_size = max(_MAX_DISTANCES_PER_CHUNK // len(palette_rgb), 1)
+
+    _run_chunked(_process, len(pixels), chunk_size, n_jobs)
+
+    if image.shape[-1] == 4:
+        quantized[:, 3] = pixels[:, 3]
+    return quantized.reshape(image.shape), indices.reshape(image.shape[:-1])
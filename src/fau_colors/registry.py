@@ -0,0 +1,188 @@
+"""Index of all colors of all versions by name, hex value, faculty, variant, and lightness level.
+
+The registry is built once (on the first call of `get_registry`) from `fau_colors.data` and all lookups are single
+dictionary lookups returning compact `ColorRecord` tuples.
+
+>>> from fau_colors import get_registry
+>>> registry = get_registry()
+>>> registry.get("fau-wiso-dark-250")
+ColorRecord(name='wiso_dark_250', version='2024', faculty='wiso', variant='dark', level=0.25, hex='#E6C6CB', ...)
+>>> [(r.version, r.name) for r in registry.by_hex("#971B2F")]
+[('2021', 'wiso_dark'), ('2024', 'wiso_dark')]
+
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict, namedtuple
+from functools import cache
+from itertools import product
+from typing import TYPE_CHECKING
+
+from fau_colors._versions import DEFAULT_VERSION, LEVELS, level_color_name, normalize_color_name
+from fau_colors.data import (
+    COLORS,
+    COLORS_ALL,
+    PALETTE_NAMES,
+    PALETTES_HEX,
+    PALETTES_RGB,
+    PALETTES_RGB_UINT8,
+    RGB,
+    RGB_UINT8,
+    VERSIONS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["ColorRecord", "ColorRegistry", "get_registry"]
+
+ColorRecord = namedtuple("ColorRecord", ["name", "version", "faculty", "variant", "level", "hex", "rgb", "rgb_uint8"])
+ColorRecord.__doc__ = """A single color of one version.
+
+`faculty` is None for black, `variant` is one of "base", "dark", and "light", and `level` is the share of the base
+color in the lightness ramps (1.0 for the color itself, 0.625, 0.375, 0.25, or 0.125).
+"""
+
+VARIANTS = ("base", "dark", "light")
+
+# Wildcard for `ColorRegistry.select`
+_ANY = object()
+
+
+def _version_aliases(version: str) -> tuple[str | int, ...]:
+    return version, f"v{version}", int(version)
+
+
+def _name_aliases(name: str) -> set[str]:
+    dashed = name.replace("_", "-")
+    return {name, dashed, f"fau-{dashed}"}
+
+
+def _parse_palette_name(palette: str) -> tuple[str | None, str]:
+    """Split the name of a single color ramp (e.g. "med_dark") into faculty and variant."""
+    faculty, _, variant = palette.partition("_")
+    if faculty == "black":
+        return None, variant or "base"
+    return faculty, variant or "base"
+
+
+def _build_records() -> list[ColorRecord]:
+    records = []
+    for version in VERSIONS:
+        # The base colors come from `colors_all` (or `colors` for 2019) and the lighter levels from the ramps.
+        # The first color of a ramp is usually, but not always (e.g. "phil_dark" in 2024), identical to the base color.
+        for name, hex_color in COLORS_ALL.get(version, COLORS[version]).items():
+            faculty, variant = _parse_palette_name(name)
+            rgb, rgb_uint8 = RGB[hex_color.upper()], RGB_UINT8[hex_color.upper()]
+            records.append(ColorRecord(name, version, faculty, variant, 1.0, hex_color.upper(), rgb, rgb_uint8))
+        for palette, hex_colors in PALETTES_HEX[version].items():
+            faculty, variant = _parse_palette_name(palette)
+            if (faculty not in COLORS[version] and faculty is not None) or variant not in VARIANTS:
+                # Multi color palettes like "faculties_all"
+                continue
+            for level, hex_color, rgb, rgb_uint8 in zip(
+                LEVELS[1:],
+                hex_colors[1:],
+                PALETTES_RGB[version][palette][1:],
+                PALETTES_RGB_UINT8[version][palette][1:],
+            ):
+                name = level_color_name(palette, level)
+                records.append(ColorRecord(name, version, faculty, variant, level, hex_color, rgb, rgb_uint8))
+    return records
+
+
+class ColorRegistry:
+    """Lookup tables for all colors of all versions. Use `get_registry` to get the (shared) instance."""
+
+    __slots__ = ("_by_hex", "_by_name", "_by_selection", "_versions", "records")
+
+    def __init__(self, records: list[ColorRecord]) -> None:
+        self.records = tuple(records)
+        self._versions = {alias: version for version in VERSIONS for alias in _version_aliases(version)}
+        self._versions[None] = None
+
+        by_name = {}
+        by_hex = defaultdict(list)
+        by_selection = defaultdict(list)
+        for record in self.records:
+            for version, name in product(_version_aliases(record.version), _name_aliases(record.name)):
+                by_name[version, name] = record
+            by_hex[record.hex].append(record)
+            for key in product(*((value, _ANY) for value in record[1:5])):
+                by_selection[key].append(record)
+        self._add_palette_aliases(by_name)
+
+        self._by_name = by_name
+        self._by_hex = {hex_color: tuple(records) for hex_color, records in by_hex.items()}
+        self._by_selection = {key: tuple(records) for key, records in by_selection.items()}
+
+    @staticmethod
+    def _add_palette_aliases(by_name: dict) -> None:
+        # Names used in `cmaps_with_names` that are not derived from a ramp (e.g. "fau-med-light" for the 62.5%
+        # level in 2024) point to the record with the same hex value
+        by_hex = {}
+        for record in by_name.values():
+            by_hex.setdefault((record.version, record.hex), record)
+        for version, palettes in PALETTE_NAMES.items():
+            for palette, names in palettes.items():
+                hex_colors = PALETTES_HEX[version][palette]
+                # The names of the 2024 lightness level palettes (e.g. "faculties_625") are incomplete
+                if len(names) != len(hex_colors):
+                    continue
+                for name, hex_color in zip(names, hex_colors):
+                    record = by_hex.get((version, hex_color))
+                    if record is None:
+                        continue
+                    for key in product(_version_aliases(version), _name_aliases(normalize_color_name(name))):
+                        by_name.setdefault(key, record)
+
+    def __len__(self) -> int:
+        """Get the number of colors (of all versions)."""
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ColorRecord]:
+        """Iterate over all colors (of all versions)."""
+        return iter(self.records)
+
+    def __contains__(self, key: tuple[str | int, str]) -> bool:
+        """Check if a (version, name) pair exists."""
+        return key in self._by_name
+
+    def get(self, name: str, version: str | int = DEFAULT_VERSION) -> ColorRecord:
+        """Get a color by name (e.g. "wiso_dark_250", "wiso-dark-250", or "fau-wiso-dark-250").
+
+        Raises
+        ------
+        ValueError
+            If the color does not exist in the version.
+
+        """
+        try:
+            return self._by_name[version, name]
+        except KeyError:
+            raise ValueError(f"Unknown color '{name}' for version {version}.") from None
+
+    def by_hex(self, hex_color: str) -> tuple[ColorRecord, ...]:
+        """Get all colors (of all versions) with the given hex value."""
+        return self._by_hex.get(hex_color.upper(), ())
+
+    def select(
+        self,
+        version: str | int | None = None,
+        faculty: str | None = _ANY,
+        variant: str = _ANY,
+        level: float = _ANY,
+    ) -> tuple[ColorRecord, ...]:
+        """Get all colors matching the given criteria.
+
+        All criteria that are not provided match every color. Use `faculty=None` to select black.
+        """
+        version = self._versions.get(version, version)
+        return self._by_selection.get((_ANY if version is None else version, faculty, variant, level), ())
+
+
+@cache
+def get_registry() -> ColorRegistry:
+    """Get the color registry (built on the first call)."""
+    return ColorRegistry(_build_records())
@@ -1,13 +1,8 @@
 from collections import namedtuple
-from typing import Literal
+from collections.abc import Callable
+from typing import Any, Literal
 
-import seaborn as sns
-
-from fau_colors._utils import (
-    custom_blend_colormap,
-    get_register_func,
-    get_unregister_func,
-)
+from fau_colors import diagnostics
 
 __all__ = ["cmaps", "colors", "register_cmaps", "unregister_cmaps"]
 
@@ -29,17 +24,55 @@ colors = _FacultyColors(
 )
 
 
-cmaps = _CmapsAll(
-    faculties=sns.color_palette(list(colors)),
-    **{
-        k: sns.color_palette(
-            custom_blend_colormap(["#FFFFFF", v], list(reversed(_LIGHTNESS_LEVELS))),
-            as_cmap=True,
-        )
-        for k, v in colors._asdict().items()
-    },
-)
+# The definition of the cmaps. Their colors are precomputed in `fau_colors.data` (see `poe update_data`), from which
+# `cmaps` is created on first access (see `__getattr__`) without blending the colors again.
+def _define_cmaps() -> _CmapsAll:
+    from matplotlib.colors import to_rgb
+
+    from fau_colors._utils import custom_blend_colormap
+
+    return _CmapsAll(
+        faculties=[to_rgb(c) for c in colors],
+        **{
+            k: custom_blend_colormap(["#FFFFFF", v], list(reversed(_LIGHTNESS_LEVELS)))
+            for k, v in colors._asdict().items()
+        },
+    )
+
+
+@diagnostics.timed("v2019.cmaps")
+def _build_cmaps() -> tuple:
+    from fau_colors._palette import get_palettes
+
+    return get_palettes("2019")
+
+
+def _build_register_func() -> Callable[[], None]:
+    from fau_colors._utils import get_register_func
+
+    return get_register_func(_build_cmaps())
+
+
+def _build_unregister_func() -> Callable[[], None]:
+    from fau_colors._utils import get_unregister_func
+
+    return get_unregister_func(_build_cmaps())
+
+
+_LAZY_ATTRIBUTES = {
+    "cmaps": _build_cmaps,
+    "register_cmaps": _build_register_func,
+    "unregister_cmaps": _build_unregister_func,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
 
 
-register_cmaps = get_register_func(cmaps)
-unregister_cmaps = get_unregister_func(cmaps)
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
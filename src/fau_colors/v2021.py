@@ -1,10 +1,10 @@
 from collections import namedtuple
+from collections.abc import Callable
+from functools import cache
 from itertools import product
-from typing import Literal
+from typing import Any, Literal
 
-import seaborn as sns
-
-from fau_colors._utils import custom_blend_colormap, get_register_func, get_unregister_func
+from fau_colors import diagnostics
 
 __all__ = [
     "cmaps",
@@ -72,36 +72,94 @@ colors_all: _FacultyColorsAll = _FacultyColorsAll(
 )
 
 
-lightened_colors = {}
 reversed_light_levels = _LIGHTNESS_LEVELS[::-1]
 lightness_name_postfix = [f"-{int(i * 1000)}" if i != 1 else "" for i in reversed_light_levels]
-for name, color in colors_all._asdict().items():
-    lightened_colors[name] = (
-        [f"fau-{name.replace('_', '-')}{p}" for p in lightness_name_postfix],
-        custom_blend_colormap(["#FFFFFF", color], reversed_light_levels),
+
+
+# Blending the lightness levels needs numpy, so it is deferred until one of the attributes in `_LAZY_ATTRIBUTES` is
+# accessed. The cmaps themselves are created from the precomputed colors in `fau_colors.data` (see `poe update_data`),
+# which are generated from `_define_cmaps_with_names`.
+@cache
+def _build_lightened_colors() -> dict[str, tuple[list[str], list[tuple[float, float, float]]]]:
+    from fau_colors._blend import lightness_ramps
+
+    # All ramps are blended in one batch. `lut_size=256` keeps the values identical to the previously used
+    # matplotlib colormaps.
+    ramps = lightness_ramps(list(colors_all), reversed_light_levels, lut_size=256)
+    return {
+        name: ([f"fau-{name.replace('_', '-')}{p}" for p in lightness_name_postfix], list(map(tuple, ramp)))
+        for name, ramp in zip(colors_all._fields, ramps)
+    }
+
+
+def _define_cmaps_with_names() -> _CmapsAll:
+    return _CmapsAll(
+        faculties=(
+            [f"fau-{f}" for f in colors._fields],
+            list(colors),
+        ),
+        faculties_dark=(
+            [f"fau-{f}-dark" for f in colors_dark._fields],
+            list(colors_dark),
+        ),
+        faculties_light=(
+            [f"fau-{f}-light" for f in colors_light._fields],
+            list(colors_light),
+        ),
+        faculties_all=(
+            [f"fau-{f.replace('_', '-')}" for f in colors_all._fields],
+            list(colors_all),
+        ),
+        **_build_lightened_colors(),
     )
 
-cmaps_with_names = _CmapsAll(
-    faculties=(
-        [f"fau-{f}" for f in colors._fields],
-        sns.color_palette(list(colors), as_cmap=True),
-    ),
-    faculties_dark=(
-        [f"fau-{f}-dark" for f in colors_dark._fields],
-        sns.color_palette(list(colors_dark), as_cmap=True),
-    ),
-    faculties_light=(
-        [f"fau-{f}-light" for f in colors_light._fields],
-        sns.color_palette(list(colors_light), as_cmap=True),
-    ),
-    faculties_all=(
-        [f"fau-{f.replace('_', '-')}" for f in colors_all._fields],
-        sns.color_palette(list(colors_all), as_cmap=True),
-    ),
-    **lightened_colors,
-)
 
-cmaps = _CmapsAll(**{name: cmap[1] for name, cmap in cmaps_with_names._asdict().items()})
+def _define_cmaps() -> _CmapsAll:
+    return _CmapsAll(**{name: cmap[1] for name, cmap in _define_cmaps_with_names()._asdict().items()})
+
+
+@diagnostics.timed("v2021.cmaps_with_names")
+def _build_cmaps_with_names() -> tuple:
+    from fau_colors._palette import _get_palettes_with_names
+
+    return _get_palettes_with_names("2021")
+
+
+@diagnostics.timed("v2021.cmaps")
+def _build_cmaps() -> tuple:
+    from fau_colors._palette import get_palettes
+
+    return get_palettes("2021")
+
+
+def _build_register_func() -> Callable[[], None]:
+    from fau_colors._utils import get_register_func
+
+    return get_register_func(_build_cmaps())
+
+
+def _build_unregister_func() -> Callable[[], None]:
+    from fau_colors._utils import get_unregister_func
+
+    return get_unregister_func(_build_cmaps())
+
+
+_LAZY_ATTRIBUTES = {
+    "lightened_colors": _build_lightened_colors,
+    "cmaps_with_names": _build_cmaps_with_names,
+    "cmaps": _build_cmaps,
+    "register_cmaps": _build_register_func,
+    "unregister_cmaps": _build_unregister_func,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
+
 
-register_cmaps = get_register_func(cmaps)
-unregister_cmaps = get_unregister_func(cmaps)
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
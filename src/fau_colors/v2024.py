@@ -1,13 +1,14 @@
 from collections import namedtuple
+from collections.abc import Callable
+from functools import cache
 from itertools import product
-from typing import Literal
+from typing import Any, Literal
 
-import seaborn as sns
-
-from fau_colors._utils import get_register_func, get_unregister_func
+from fau_colors import diagnostics
 
 __all__ = [
     "cmaps",
+    "cmaps_continuous",
     "cmaps_with_names",
     "colors",
     "colors_all",
@@ -54,6 +55,10 @@ _CmapsAll = namedtuple(
         *[f"faculties_dark{postfix.replace('-', '_')}" for postfix in lightness_name_postfix[1:]],
     ],
 )
+# Continuous (256 entries) versions of all `colors_with_light_levels` ramps, e.g. "med_dark_cont"
+_CmapsContinuous = namedtuple(
+    "CmapsContinuous", [f"{name.replace('-', '_')}_cont" for name in colors_with_light_levels]
+)
 
 colors = _FacultyColors(
     fau="#04316A",
@@ -80,62 +85,124 @@ colors_all: _FacultyColorsAll = _FacultyColorsAll(
 )
 
 
-# flip the colors_with_light_levels dict to that the keys are the lightness levels and the values are lists of colors
-_colors_by_light_levels = {
-    f"faculties{key}": [
-        color_list[i + 1] for color_list in {key: colors_with_light_levels[key] for key in NAMED_COLORS}.values()
-    ]
-    for i, key in enumerate(lightness_name_postfix[1:])
-}
-# to the same for the "dark" colors, add to the dict
-_colors_by_light_levels.update(
-    **{
-        f"faculties-dark{key}": [
-            color_list[i + 1]
-            for color_list in {key: colors_with_light_levels[f"{key}-dark"] for key in NAMED_COLORS}.values()
+# The cmaps are created from the precomputed colors in `fau_colors.data` (see `poe update_data`), which are generated
+# from `_define_cmaps_with_names`. They are only created on first access of the respective module attribute (see
+# `__getattr__` below), so that importing the raw colors stays cheap.
+@cache
+def _build_colors_by_light_levels() -> dict[str, list[str]]:
+    # flip the colors_with_light_levels dict to that the keys are the lightness levels and the values are lists of
+    # colors
+    colors_by_light_levels = {
+        f"faculties{key}": [
+            color_list[i + 1] for color_list in {key: colors_with_light_levels[key] for key in NAMED_COLORS}.values()
         ]
         for i, key in enumerate(lightness_name_postfix[1:])
     }
-)
+    # to the same for the "dark" colors, add to the dict
+    colors_by_light_levels.update(
+        **{
+            f"faculties-dark{key}": [
+                color_list[i + 1]
+                for color_list in {key: colors_with_light_levels[f"{key}-dark"] for key in NAMED_COLORS}.values()
+            ]
+            for i, key in enumerate(lightness_name_postfix[1:])
+        }
+    )
+    return colors_by_light_levels
 
 
-cmaps_with_names = _CmapsAll(
-    faculties=(
-        [f"fau-{f}" for f in colors._fields],
-        sns.color_palette(list(colors), as_cmap=True),
-    ),
-    faculties_dark=(
-        [f"fau-{f}-dark" for f in colors_dark._fields],
-        sns.color_palette(list(colors_dark), as_cmap=True),
-    ),
-    faculties_all=(
-        [f"fau-{f}" for f in colors_all._fields],
-        sns.color_palette(list(colors_all), as_cmap=True),
-    ),
-    **{
-        name.replace("-", "_"): (
-            [f"fau-{name}{postfix}" for postfix in lightness_name_postfix],
-            sns.color_palette(color_list, as_cmap=True),
-        )
-        for name, color_list in colors_with_light_levels.items()
-    },
-    **{
-        name.replace("-", "_"): (
-            [f"fau-{name}{postfix}" for postfix in lightness_name_postfix],
-            sns.color_palette(color_list, as_cmap=True),
-        )
-        for name, color_list in _colors_by_light_levels.items()
-    },
-    faculties_light=(
-        [f"fau-{f}-light" for f in colors._fields],
-        sns.color_palette(
+def _define_cmaps_with_names() -> _CmapsAll:
+    return _CmapsAll(
+        faculties=(
+            [f"fau-{f}" for f in colors._fields],
+            list(colors),
+        ),
+        faculties_dark=(
+            [f"fau-{f}-dark" for f in colors_dark._fields],
+            list(colors_dark),
+        ),
+        faculties_all=(
+            [f"fau-{f}" for f in colors_all._fields],
+            list(colors_all),
+        ),
+        **{
+            name.replace("-", "_"): (
+                [f"fau-{name}{postfix}" for postfix in lightness_name_postfix],
+                color_list,
+            )
+            for name, color_list in colors_with_light_levels.items()
+        },
+        **{
+            name.replace("-", "_"): (
+                [f"fau-{name}{postfix}" for postfix in lightness_name_postfix],
+                color_list,
+            )
+            for name, color_list in _build_colors_by_light_levels().items()
+        },
+        faculties_light=(
+            [f"fau-{f}-light" for f in colors._fields],
             [v[1] for k, v in colors_with_light_levels.items() if not any(word in k for word in ["dark", "black"])],
-            as_cmap=True,
         ),
-    ),
-)
+    )
+
+
+def _define_cmaps() -> _CmapsAll:
+    return _CmapsAll(**{name: cmap[1] for name, cmap in _define_cmaps_with_names()._asdict().items()})
+
+
+@diagnostics.timed("v2024.cmaps_with_names")
+def _build_cmaps_with_names() -> tuple:
+    from fau_colors._palette import _get_palettes_with_names
+
+    return _get_palettes_with_names("2024")
+
+
+@diagnostics.timed("v2024.cmaps")
+def _build_cmaps() -> tuple:
+    from fau_colors._palette import get_palettes
+
+    return get_palettes("2024")
+
+
+@cache
+@diagnostics.timed("v2024.cmaps_continuous")
+def _build_cmaps_continuous() -> _CmapsContinuous:
+    # The 256 entry versions of the `colors_with_light_levels` ramps are read-only views into a precomputed, memory
+    # mapped file, so they are not interpolated again (and not copied) in every process
+    from fau_colors._continuous import load_continuous_luts
+
+    return _CmapsContinuous(*load_continuous_luts()["rgb"])
+
+
+def _build_register_func() -> Callable[[], None]:
+    from fau_colors._utils import get_register_func
+
+    return get_register_func(_build_cmaps(), _build_cmaps_continuous())
+
+
+def _build_unregister_func() -> Callable[[], None]:
+    from fau_colors._utils import get_unregister_func
+
+    return get_unregister_func(_build_cmaps(), _build_cmaps_continuous())
+
+
+_LAZY_ATTRIBUTES = {
+    "_colors_by_light_levels": _build_colors_by_light_levels,
+    "cmaps_with_names": _build_cmaps_with_names,
+    "cmaps": _build_cmaps,
+    "cmaps_continuous": _build_cmaps_continuous,
+    "register_cmaps": _build_register_func,
+    "unregister_cmaps": _build_unregister_func,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
 
-cmaps = _CmapsAll(**{name: cmap[1] for name, cmap in cmaps_with_names._asdict().items()})
 
-register_cmaps = get_register_func(cmaps)
-unregister_cmaps = get_unregister_func(cmaps)
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -0,0 +1,113 @@
+"""Helpers for using the FAU colors in process pools (`concurrent.futures`, `multiprocessing`, joblib).
+
+Colormap objects are expensive to pickle and rebuild in every task.
+Instead, pass a small `PaletteHandle` to the tasks and resolve it inside the worker, where the colormap is cached after
+the first use.
+Use `worker_init` as pool initializer to do the one-time setup (registering cmaps and fonts) once per process.
+
+>>> from concurrent.futures import ProcessPoolExecutor
+>>> from functools import partial
+>>> import fau_colors
+>>> with ProcessPoolExecutor(initializer=partial(fau_colors.worker_init, version="2024")) as pool:
+...     pool.map(plot_figure, data, [fau_colors.palette_handle("med")] * len(data))
+
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections import namedtuple
+from typing import TYPE_CHECKING
+
+from fau_colors._palette import get_palettes
+from fau_colors._versions import DEFAULT_VERSION, get_version_module, normalize_version, resolve_palette_name
+from fau_colors.data import PALETTES_HEX, PALETTES_RGB
+
+if TYPE_CHECKING:
+    from matplotlib.colors import ListedColormap
+
+__all__ = ["PaletteHandle", "palette_handle", "worker_init"]
+
+
+def _resolve_cmap(version: str, name: str) -> ListedColormap:
+    # The colormap is cached by the palette and also used to register the cmaps (see `worker_init`)
+    return getattr(get_palettes(version), name).as_cmap()
+
+
+class PaletteHandle(namedtuple("PaletteHandle", ["version", "name"])):
+    """Picklable reference to a palette of one of the color versions.
+
+    Only the version and the palette name are pickled.
+    The actual colors and colormaps are looked up (and cached) in the process that uses the handle.
+    Create instances with `palette_handle`.
+    """
+
+    __slots__ = ()
+
+    @property
+    def colors(self) -> tuple[tuple[float, float, float], ...]:
+        """The float RGB colors of the palette."""
+        return PALETTES_RGB[self.version][self.name]
+
+    @property
+    def hex_colors(self) -> tuple[str, ...]:
+        """The hex colors of the palette."""
+        return PALETTES_HEX[self.version][self.name]
+
+    def as_cmap(self) -> ListedColormap:
+        """Get the palette as matplotlib colormap (cached per process).
+
+        The returned colormap is shared within the process and should not be modified.
+        """
+        return _resolve_cmap(self.version, self.name)
+
+
+def palette_handle(name: str, version: str | int = DEFAULT_VERSION) -> PaletteHandle:
+    """Create a picklable handle for one of the palettes in `cmaps` of the given version.
+
+    Parameters
+    ----------
+    name
+        The name of the palette (e.g. "med_dark" or "fau-med-dark").
+    version
+        The color version.
+
+    """
+    version = normalize_version(version)
+    return PaletteHandle(version, resolve_palette_name(name, version))
+
+
+def worker_init(version: str | int = DEFAULT_VERSION, register: bool = True, font: bool = True) -> None:
+    """Do the one-time setup of a worker process.
+
+    This builds the colormaps of the given version, warms up the cache used by `PaletteHandle.as_cmap`, and optionally
+    registers the cmaps and the FAU Sans font.
+    The registered colormaps are the ones created for `PaletteHandle.as_cmap` (from the precomputed colors), so
+    neither seaborn nor a second set of colormaps is created in the worker.
+    The function is meant to be used as `initializer` of a process pool.
+    Calling it multiple times in the same process is cheap.
+
+    Parameters
+    ----------
+    version
+        The color version.
+    register
+        If True, the cmaps of the version are registered as global matplotlib colormaps.
+    font
+        If True, the FAU Sans font is registered.
+        If the font can not be found, a warning is raised instead of an error, as errors in pool initializers break
+        the entire pool.
+
+    """
+    version = normalize_version(version)
+    for name in PALETTES_RGB[version]:
+        _resolve_cmap(version, name)
+    if register:
+        get_version_module(version).register_cmaps()
+    if font:
+        from fau_colors.fonts import register_fausans_font
+
+        try:
+            register_fausans_font()
+        except FileNotFoundError as e:
+            warnings.warn(str(e), stacklevel=2)
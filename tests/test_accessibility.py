@@ -0,0 +1,91 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from fau_colors import accessibility, data, v2024
+from fau_colors._versions import palette_color_names
+
+
+@pytest.mark.parametrize(
+    ("lab1", "lab2", "expected"),
+    [
+        # Reference values from Sharma, Wu, and Dalal (2005)
+        ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+        ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+        ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+        ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+    ],
+)
+def test_ciede2000_reference_values(lab1: tuple, lab2: tuple, expected: float) -> None:
+    assert accessibility.ciede2000(lab1, lab2) == pytest.approx(expected, abs=1e-4)
+    assert accessibility.ciede2000(lab2, lab1) == pytest.approx(expected, abs=1e-4)
+
+
+def test_contrast_ratio() -> None:
+    assert accessibility.contrast_ratio((0, 0, 0), (1, 1, 1)) == pytest.approx(21)
+    assert accessibility.contrast_ratio((1, 1, 1), (1, 1, 1)) == pytest.approx(1)
+
+
+@pytest.mark.parametrize("cvd", [None, *accessibility.CVD_TYPES])
+def test_matrices(cvd: str) -> None:
+    matrices = accessibility.accessibility_matrices("2024", cvd=cvd)
+    n = len(matrices.names)
+
+    assert set(v2024.colors_all._fields) <= set(matrices.names)
+    assert "med_dark_625" in matrices.names
+    for matrix in (matrices.contrast, matrices.ciede2000, matrices.oklab):
+        assert matrix.shape == (n, n)
+        assert not matrix.flags.writeable
+        np.testing.assert_allclose(matrix, matrix.T)
+    np.testing.assert_allclose(np.diag(matrices.ciede2000), 0, atol=1e-12)
+    i, j = matrices.names.index("black"), matrices.names.index("fau")
+    assert matrices.contrast[i, j] == pytest.approx(accessibility.contrast_ratio(matrices.rgb[i], matrices.rgb[j]))
+    assert accessibility.accessibility_matrices(2024, cvd=cvd) is matrices
+
+
+def test_simulate_cvd_keeps_grays() -> None:
+    grays = np.linspace(0, 1, 5)[:, None].repeat(3, axis=1)
+    for cvd in accessibility.CVD_TYPES:
+        np.testing.assert_allclose(accessibility.simulate_cvd(grays, cvd), grays, atol=2e-3)
+
+
+def test_best_text_color() -> None:
+    assert accessibility.best_text_color("fau") == "#FFFFFF"
+    assert accessibility.best_text_color("fau-phil") == "#000000"
+    assert accessibility.best_text_color("#FFFFFF", ["med", "fau_dark"]) == v2024.colors_all.fau_dark
+    assert accessibility.best_text_color((0.0, 0.0, 0.0), cvd="tritanopia") == "#FFFFFF"
+    with pytest.raises(ValueError, match="Unknown color"):
+        accessibility.best_text_color("not_a_color")
+
+
+@pytest.mark.parametrize("cvd", [None, "deuteranopia"])
+def test_most_distinguishable_is_optimal(cvd: str) -> None:
+    matrices = accessibility.accessibility_matrices(cvd=cvd)
+    index = {name: i for i, name in enumerate(matrices.names)}
+
+    def _min_distance(names: tuple) -> float:
+        return min(matrices.ciede2000[index[a], index[b]] for a, b in combinations(names, 2))
+
+    selected = accessibility.most_distinguishable(4, cvd)
+
+    assert len(set(selected)) == 4
+    best = max(_min_distance(names) for names in combinations(v2024.colors_all._fields, 4))
+    assert _min_distance(selected) == pytest.approx(best)
+
+
+@pytest.mark.parametrize("version", data.VERSIONS)
+def test_most_distinguishable_all_palettes(version: str) -> None:
+    for palette in data.PALETTES_HEX[version]:
+        selected = accessibility.most_distinguishable(3, version=version, palette=palette)
+        assert len(set(selected)) == 3
+        assert set(selected) <= set(palette_color_names(palette, version)), palette
+    assert accessibility.most_distinguishable(5, version="2024", palette="phil_dark")[0] == "phil_dark"
+
+
+def test_most_distinguishable_validates_input() -> None:
+    assert len(accessibility.most_distinguishable(3, version="2019")) == 3
+    with pytest.raises(ValueError, match="`k`"):
+        accessibility.most_distinguishable(20)
+    with pytest.raises(ValueError, match="color vision deficiency"):
+        accessibility.most_distinguishable(2, cvd="achromatopsia")
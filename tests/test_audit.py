@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from fau_colors import audit, data
+
+
+@pytest.fixture
+def figure_dir(tmp_path: Path) -> Path:
+    palette = np.array(data.PALETTES_RGB_UINT8["2024"]["faculties_all"], dtype=np.uint8)
+    image = np.full((300, 10, 4), 255, dtype=np.uint8)
+    image[:100, :, :3] = palette[0]
+    image[100:150, :, :3] = (0, 255, 0)
+    image[150:200, :, 3] = 0  # Transparent pixels are ignored
+    Image.fromarray(image, mode="RGBA").save(tmp_path / "figure.png")
+
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    (sub_dir / "figure.svg").write_text(
+        '<svg><rect fill="#04316A" stroke="none"/><rect style="fill:#ff0000;stroke:black"/>'
+        '<rect fill="rgb(255, 255, 255)"/><text>ignored</text></svg>'
+    )
+    (sub_dir / "notes.txt").write_text("not an image")
+    return tmp_path
+
+
+def test_audit_raster(figure_dir: Path) -> None:
+    result = audit.audit_file(figure_dir / "figure.png")
+
+    assert result.kind == "raster"
+    assert result.error is None
+    assert result.n_total == 2500
+    assert result.n_outside == 500
+    assert result.fraction_outside == pytest.approx(0.2)
+    assert result.outside_colors == {"#00FF00": 500}
+
+
+def test_audit_svg(figure_dir: Path) -> None:
+    result = audit.audit_file(figure_dir / "sub" / "figure.svg")
+
+    assert result.kind == "svg"
+    assert (result.n_total, result.n_outside) == (4, 1)
+    assert result.outside_colors == {"#FF0000": 1}
+
+
+def test_audit_tolerance_and_extra_colors(figure_dir: Path) -> None:
+    assert audit.audit_file(figure_dir / "figure.png", tolerance=1.0).n_outside == 0
+    assert audit.audit_file(figure_dir / "figure.png", extra_colors=()).n_outside == 1500
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_audit_walks_directories(figure_dir: Path, max_workers: int) -> None:
+    (figure_dir / "broken.png").write_bytes(b"no png")
+
+    results = {r.path: r for r in audit.audit([figure_dir], max_workers=max_workers)}
+
+    assert sorted(results) == sorted(str(figure_dir / p) for p in ["broken.png", "figure.png", "sub/figure.svg"])
+    assert results[str(figure_dir / "broken.png")].error is not None
+
+
+def test_audit_cli(figure_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    output = tmp_path / "report.json"
+
+    assert audit.main([str(figure_dir), "--workers", "0", "--output", str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert report["n_files"] == 2
+    assert report["n_files_with_outside_colors"] == 2
+
+    assert audit.main([str(figure_dir / "figure.png"), "--workers", "0", "--jsonl", "--fail-above", "0.1"]) == 1
+    assert json.loads(capsys.readouterr().out)["n_outside"] == 500
@@ -0,0 +1,61 @@
+import matplotlib
+import numpy as np
+import pytest
+
+from fau_colors import _blend, _colorspace, v2021
+from fau_colors._utils import custom_blend_colormap
+
+
+def _matplotlib_blend(colors: list[str], steps: list[float]) -> np.ndarray:
+    cmap = matplotlib.colors.LinearSegmentedColormap.from_list("blend", colors)
+    return cmap(steps)[:, :3]
+
+
+@pytest.mark.parametrize("colors", [["#FFFFFF", "#04316A"], ["#FFFFFF", "#C50F3C"], ["#000000", "#18B4F1", "#FFFFFF"]])
+def test_custom_blend_colormap_matches_matplotlib(colors: list[str]) -> None:
+    steps = [1, 0.625, 0.375, 0.25, 0.125, 0.0, 0.5, 0.999]
+
+    blended = np.array(custom_blend_colormap(colors, steps))
+    expected = _matplotlib_blend(colors, steps)
+    if len(colors) == 2:
+        np.testing.assert_array_equal(blended, expected)
+    else:
+        np.testing.assert_allclose(blended, expected, rtol=0, atol=1e-15)
+
+
+def test_v2021_lightened_colors_match_matplotlib() -> None:
+    for name, color in v2021.colors_all._asdict().items():
+        expected = _matplotlib_blend(["#FFFFFF", color], v2021.reversed_light_levels)
+        np.testing.assert_array_equal(np.array(v2021.lightened_colors[name][1]), expected)
+
+
+@pytest.mark.parametrize("space", _blend.BLEND_SPACES)
+def test_lightness_ramps_endpoints_and_shape(space: str) -> None:
+    ramps = _blend.lightness_ramps(["#04316A", "#7BB725", "#000000"], 7, space=space)
+
+    assert ramps.shape == (3, 7, 3)
+    np.testing.assert_allclose(ramps[:, 0], 1.0, atol=1e-9)
+    np.testing.assert_allclose(ramps[:, -1], _colorspace.to_rgb_array(["#04316A", "#7BB725", "#000000"]), atol=1e-9)
+    assert not ramps.flags.writeable
+
+
+def test_blend_results_are_memoized() -> None:
+    first = _blend.lightness_ramps(["#04316A"], [0.5, 1], space="oklab")
+    second = _blend.lightness_ramps(["#04316A"], [0.5, 1], space="oklab")
+
+    assert first is second
+
+
+def test_oklab_round_trip() -> None:
+    rgb = np.random.default_rng(0).random((100, 3))
+    lab = _colorspace.linear_to_oklab(_colorspace.srgb_to_linear(rgb))
+
+    np.testing.assert_allclose(_colorspace.linear_to_srgb(_colorspace.oklab_to_linear(lab)), rgb, atol=1e-9)
+    np.testing.assert_allclose(_colorspace.linear_to_oklab([1.0, 1.0, 1.0]), [1.0, 0.0, 0.0], atol=1e-4)
+
+
+def test_blend_colors_rejects_invalid_input() -> None:
+    with pytest.raises(ValueError, match="color space"):
+        _blend.blend_colors([["#FFFFFF", "#000000"]], 3, space="hsv")
+    with pytest.raises(ValueError, match="same number"):
+        _blend.blend_colors([["#FFFFFF", "#000000"], ["#FFFFFF"]], 3)
@@ -0,0 +1,76 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from fau_colors import categorical, v2019, v2024
+from fau_colors._colorspace import hex_to_rgb, linear_to_oklab, srgb_to_linear
+from fau_colors.data import PALETTES_HEX
+
+
+def _min_distance(colors: tuple[str, ...]) -> float:
+    lab = linear_to_oklab(srgb_to_linear([hex_to_rgb(c) for c in colors]))
+    return min(np.linalg.norm(a - b) for a, b in combinations(lab, 2))
+
+
+def test_small_n_is_subset_of_base() -> None:
+    colors = categorical(4)
+
+    assert len(colors) == 4
+    assert set(colors) <= set(v2024.colors_all)
+    assert list(colors) == [c for c in v2024.colors_all if c in colors]
+    assert categorical(1, base="faculties") == (v2024.colors.fau,)
+
+
+def test_large_n_extends_base_with_lighter_levels() -> None:
+    colors = categorical(20)
+
+    assert len(set(colors)) == 20
+    assert colors[:13] == tuple(v2024.colors_all)
+    light_levels = {c for levels in v2024.colors_with_light_levels.values() for c in levels[1:]}
+    assert set(colors[13:]) <= light_levels
+    assert categorical(20) is colors
+    # Greedy selection is better than just cycling through the lighter levels
+    assert _min_distance(colors) > _min_distance(
+        colors[:13] + tuple(levels[1] for levels in list(v2024.colors_with_light_levels.values())[:7])
+    )
+
+
+def test_other_versions_and_bases() -> None:
+    colors = categorical(10, version=2019, base="faculties")
+
+    assert colors[:6] == tuple(c.upper() for c in v2019.colors)
+    assert len(set(colors)) == 10
+
+
+def test_any_n() -> None:
+    colors = categorical(200)
+
+    assert len(set(colors)) == 200
+    # All base colors and lighter levels (65 in 2024) come first, the mixed colors follow
+    assert colors[:65] == categorical(65)
+    assert len(categorical(30, version=2021, base="med")) == 30
+
+
+@pytest.mark.parametrize(
+    ("version", "base"), [("2024", "med"), ("2024", "faculties_625"), ("2024", "black"), ("2019", "med")]
+)
+def test_any_n_without_lighter_levels(version: str, base: str) -> None:
+    # Ramps, lightness levels and single colors have no further lighter levels, so the mixed colors follow directly
+    colors = categorical(40, version=version, base=base)
+    base_colors = tuple(dict.fromkeys(c.upper() for c in PALETTES_HEX[version][base]))
+
+    assert colors[: len(base_colors)] == base_colors
+    assert len(set(colors)) == 40
+
+
+def test_colors_are_unique_up_to_the_mixing_limit() -> None:
+    assert len(set(categorical(2000, base="faculties"))) == 2000
+    black = categorical(1000, base="black")
+    assert len(set(black)) < 1000
+    assert len(set(categorical(len(set(black)), base="black"))) == len(set(black))
+
+
+def test_invalid_n() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        categorical(0)
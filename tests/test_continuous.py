@@ -0,0 +1,56 @@
+import matplotlib
+import numpy as np
+import pytest
+
+from fau_colors import _continuous, continuous_lut, map_values, v2024
+
+
+def test_lut_file_is_up_to_date() -> None:
+    expected = _continuous.build_continuous_luts()
+    luts = _continuous.load_continuous_luts()
+
+    assert isinstance(luts, np.memmap)
+    np.testing.assert_array_equal(luts, expected)
+
+
+def test_luts_match_linear_segmented_colormap() -> None:
+    for name, ramp in v2024.colors_with_light_levels.items():
+        expected = matplotlib.colors.LinearSegmentedColormap.from_list(name, ramp, N=256)(np.arange(256))[:, :3]
+        lut = continuous_lut(f"fau-{name}-cont")
+
+        np.testing.assert_allclose(lut, expected, atol=1e-7)
+        np.testing.assert_array_equal(continuous_lut(f"{name}-cont", dtype=np.uint8), np.round(lut * 255))
+
+
+def test_continuous_cmaps_are_views_of_the_shared_file() -> None:
+    med = v2024.cmaps_continuous.med_dark_cont
+
+    assert med.shape == (256, 3)
+    assert not med.flags.writeable
+    assert np.shares_memory(med, _continuous.load_continuous_luts())
+
+
+def test_register_continuous_cmaps() -> None:
+    v2024.register_cmaps()
+    try:
+        cmap = matplotlib.colormaps["med_cont"]
+        np.testing.assert_allclose(cmap(np.linspace(0, 1, 256))[:, :3], continuous_lut("med_cont"))
+    finally:
+        v2024.unregister_cmaps()
+    assert "med_cont" not in set(matplotlib.colormaps)
+
+
+def test_map_values_with_continuous_cmap() -> None:
+    values = np.linspace(0, 1, 1000)
+    cmap = matplotlib.colors.ListedColormap(continuous_lut("wiso_cont"))
+
+    np.testing.assert_array_equal(map_values(values, "fau-wiso-cont"), cmap(values, bytes=True))
+    with pytest.raises(ValueError, match="Unknown palette"):
+        map_values(values, "wiso_cont", version="2021")
+
+
+def test_continuous_lut_validates_input() -> None:
+    with pytest.raises(ValueError, match="Unknown continuous colormap"):
+        continuous_lut("faculties_cont")
+    with pytest.raises(ValueError, match="dtype"):
+        continuous_lut("med_cont", dtype=np.float64)
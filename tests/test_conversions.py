@@ -0,0 +1,90 @@
+import colorsys
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgb
+
+from fau_colors import conversions, data
+
+
+@pytest.mark.parametrize("space", conversions.SPACES)
+def test_round_trip(space: str) -> None:
+    rgb = np.random.default_rng(0).random((4, 5, 3))
+
+    converted = conversions.convert(rgb, space)
+    back = conversions.convert(converted, "rgb", source=space)
+
+    assert converted.shape[:2] == (4, 5)
+    # hex and uint8 are quantized to 8 bit
+    np.testing.assert_allclose(back, rgb, atol=0.5 / 255 if space in ("hex", "rgb_uint8") else 1e-10)
+
+
+def test_hex_matches_matplotlib() -> None:
+    hex_colors = ["#04316A", "#fdb735", "abc", "#FFF"]
+
+    np.testing.assert_array_equal(
+        conversions.convert(hex_colors, "rgb"), [to_rgb(f"#{c.lstrip('#')}") for c in hex_colors]
+    )
+    np.testing.assert_array_equal(conversions.convert(hex_colors, "hex"), ["#04316A", "#FDB735", "#AABBCC", "#FFFFFF"])
+
+
+def test_single_hex_string() -> None:
+    np.testing.assert_array_equal(conversions.convert("#04316A", "rgb"), to_rgb("#04316A"))
+    assert conversions.convert("#04316a", "hex") == "#04316A"
+    assert conversions.convert("#FFFFFF", "rgb_uint8").shape == (3,)
+
+
+def test_integers_are_uint8_values() -> None:
+    assert conversions.convert([[4, 49, 106]], "hex").tolist() == ["#04316A"]
+    np.testing.assert_array_equal(conversions.convert(np.array([253, 183, 53], dtype=np.int64), "hex"), "#FDB735")
+    with pytest.raises(ValueError, match=r"range \[0, 255\]"):
+        conversions.convert([[4, 49, 256]], "hex")
+
+
+@pytest.mark.parametrize("color", ["#12345", "#12345G", "#1234567", "#ÄÄÄÄÄÄ"])
+def test_invalid_hex(color: str) -> None:
+    with pytest.raises(ValueError, match="Invalid hex color"):
+        conversions.convert(["#000000", color], "rgb")
+
+
+def test_hsl_matches_colorsys() -> None:
+    rgb = np.random.default_rng(1).random((100, 3))
+    rgb[0] = 0.5
+
+    hsl = conversions.convert(rgb, "hsl")
+
+    expected = np.array([colorsys.rgb_to_hls(*color) for color in rgb])
+    np.testing.assert_allclose(hsl, expected[:, [0, 2, 1]] * [360, 1, 1], atol=1e-12)
+
+
+def test_cmyk() -> None:
+    cmyk = conversions.convert(np.array([[0, 0, 0], [255, 255, 255], [255, 0, 0]], dtype=np.uint8), "cmyk")
+
+    np.testing.assert_allclose(cmyk, [[0, 0, 0, 1], [0, 0, 0, 0], [0, 1, 1, 0]])
+
+
+def test_wrong_number_of_channels() -> None:
+    with pytest.raises(ValueError, match="4 channels"):
+        conversions.convert(np.zeros((2, 3)), "rgb", source="cmyk")
+    with pytest.raises(ValueError, match="Unknown color space"):
+        conversions.convert(np.zeros((2, 3)), "xyz")
+
+
+@pytest.mark.parametrize("version", data.VERSIONS)
+def test_convert_palettes(version: str) -> None:
+    palettes = conversions.convert_palettes("hex", version)
+
+    assert palettes.keys() == data.PALETTES_HEX[version].keys()
+    for name, colors in palettes.items():
+        assert list(colors) == [color.upper() for color in data.PALETTES_HEX[version][name]]
+    assert conversions.convert_palettes("hex", int(version)) is palettes
+
+
+def test_convert_palette_is_cached_and_read_only() -> None:
+    oklab = conversions.convert_palette("faculties", "oklab", version="2021")
+
+    np.testing.assert_allclose(oklab, conversions.convert(data.PALETTES_RGB["2021"]["faculties"], "oklab"))
+    assert conversions.convert_palette("faculties", "oklab", version=2021) is oklab
+    assert not oklab.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        oklab[0] = 0
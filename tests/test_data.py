@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import pytest
+from matplotlib.colors import to_rgb
+
+from fau_colors import data, v2019, v2021, v2024
+
+MODULES = {"2019": v2019, "2021": v2021, "2024": v2024}
+
+
+def test_data_does_not_import_numpy_or_plotting_stack() -> None:
+    script = "import sys; import fau_colors.data; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    modules = set(result.stdout.split())
+
+    assert {"numpy", "matplotlib", "seaborn"}.isdisjoint(modules)
+
+
+@pytest.mark.parametrize("version", data.VERSIONS)
+def test_colors_match_version_modules(version: str) -> None:
+    module = MODULES[version]
+
+    assert data.COLORS[version] == module.colors._asdict()
+    for attr, table in [
+        ("colors_dark", data.COLORS_DARK),
+        ("colors_light", data.COLORS_LIGHT),
+        ("colors_all", data.COLORS_ALL),
+    ]:
+        if hasattr(module, attr):
+            assert table[version] == getattr(module, attr)._asdict()
+        else:
+            assert version not in table
+
+
+@pytest.mark.parametrize("version", data.VERSIONS)
+def test_palettes_match_version_modules(version: str) -> None:
+    cmaps = MODULES[version]._define_cmaps()
+
+    assert tuple(data.PALETTES_RGB[version]) == cmaps._fields
+    for name, cmap in cmaps._asdict().items():
+        assert (name in data.HEX_PALETTES[version]) == all(isinstance(c, str) for c in cmap)
+        expected = [to_rgb(c) for c in cmap]
+        assert list(data.PALETTES_RGB[version][name]) == expected
+        expected_flat = [c for rgb in expected for c in rgb]
+        from_hex = [c for color in data.PALETTES_HEX[version][name] for c in to_rgb(color)]
+        from_uint8 = [c / 255 for rgb in data.PALETTES_RGB_UINT8[version][name] for c in rgb]
+        assert from_hex == pytest.approx(expected_flat, abs=0.5 / 255)
+        assert from_uint8 == pytest.approx(expected_flat, abs=0.5 / 255)
+
+
+@pytest.mark.parametrize("version", ["2021", "2024"])
+def test_palette_names_match_version_modules(version: str) -> None:
+    cmaps_with_names = MODULES[version]._define_cmaps_with_names()
+
+    assert {name: list(names) for name, names in data.PALETTE_NAMES[version].items()} == {
+        name: cmap[0] for name, cmap in cmaps_with_names._asdict().items()
+    }
+
+
+def test_light_levels_and_rgb_tables() -> None:
+    assert data.COLORS_WITH_LIGHT_LEVELS["2024"] == {k: tuple(v) for k, v in v2024.colors_with_light_levels.items()}
+    for hex_color, rgb in data.RGB.items():
+        assert rgb == to_rgb(hex_color)
+        assert data.RGB_UINT8[hex_color] == tuple(int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
@@ -0,0 +1,74 @@
+import logging
+from collections import namedtuple
+from collections.abc import Iterator
+
+import pytest
+
+from fau_colors import diagnostics, v2024
+from fau_colors._utils import get_register_func, get_unregister_func
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    diagnostics.reset()
+    diagnostics.enable(trace_memory=True)
+    try:
+        yield
+    finally:
+        diagnostics.disable()
+        diagnostics.reset()
+
+
+@pytest.mark.usefixtures("enabled")
+def test_phases_are_recorded(caplog: pytest.LogCaptureFixture) -> None:
+    records = []
+    diagnostics.add_callback(records.append)
+    try:
+        with (
+            caplog.at_level(logging.DEBUG, logger="fau_colors.diagnostics"),
+            diagnostics.phase("outer", size=3),
+            diagnostics.phase("inner"),
+        ):
+            data = [list(range(100)) for _ in range(100)]
+    finally:
+        diagnostics.remove_callback(records.append)
+
+    assert [r.name for r in records] == ["inner", "outer"]
+    report = diagnostics.report()
+    outer, inner = report.phases
+    assert outer.name == "outer"
+    assert outer.attributes == {"size": 3}
+    assert inner.parent == "outer"
+    assert outer.duration >= inner.duration > 0
+    assert inner.allocated_blocks > 0
+    assert outer.peak_bytes >= inner.peak_bytes > 0
+    assert "inner took" in caplog.text
+    assert "outer" in report.format()
+    del data
+
+
+@pytest.mark.usefixtures("enabled")
+def test_registration_cache_is_counted() -> None:
+    cmaps = namedtuple("Cmaps", ["diagnostics_test"])(list(v2024.colors))
+    register = get_register_func(cmaps)
+    try:
+        register()
+        register()
+        register()
+    finally:
+        get_unregister_func(cmaps)()
+
+    report = diagnostics.report()
+    assert report.cache["register_cmaps"] == diagnostics.CacheStats(hits=2, misses=1)
+    assert [p.name for p in report.phases].count("register_cmaps") == 1
+
+
+def test_disabled_records_nothing() -> None:
+    diagnostics.reset()
+    assert not diagnostics.is_enabled()
+
+    with diagnostics.phase("ignored"):
+        diagnostics.count_cache("ignored", hit=True)
+        diagnostics.record_font_dirs(["/fonts"])
+
+    assert diagnostics.report() == diagnostics.DiagnosticsReport((), {}, ())
@@ -0,0 +1,58 @@
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgb
+
+from fau_colors import colors_all, diverging, v2021
+
+
+def test_diverging_colors() -> None:
+    cmap = diverging("med-dark", "wiso_dark", n=257)
+
+    assert cmap.N == 257
+    assert cmap.name == "med_dark_white_wiso_dark_div"
+    np.testing.assert_allclose(cmap.colors[0], to_rgb(colors_all.med_dark))
+    np.testing.assert_allclose(cmap.colors[128], [1, 1, 1])
+    np.testing.assert_allclose(cmap.colors[-1], to_rgb(colors_all.wiso_dark))
+
+
+def test_diverging_is_cached() -> None:
+    assert diverging("med", "phil") is diverging("med", "phil")
+    assert diverging("med", "phil") is not diverging("med", "phil", n=11)
+    assert diverging("med", "phil", center=(0, 0, 0)) is diverging("med", "phil", center=[0, 0, 0])
+
+
+def test_diverging_version_and_other_colors() -> None:
+    cmap = diverging("med", "#FF0000", center="black", version=2021)
+
+    np.testing.assert_allclose(cmap.colors[0], to_rgb(v2021.colors_all.med))
+    np.testing.assert_allclose(cmap.colors[-1], [1, 0, 0], atol=1e-6)
+    assert cmap.name == "med_black_ff0000_div"
+
+
+def test_diverging_oklab_is_symmetric_in_lightness() -> None:
+    # With the same color on both sides, both halves are mirror images of each other
+    cmap = diverging("fau", "fau", n=101)
+
+    np.testing.assert_allclose(cmap.colors, cmap.colors[::-1], atol=1e-12)
+
+
+def test_diverging_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="Invalid RGBA argument"):
+        diverging("med", "no_such_color")
+    with pytest.raises(ValueError, match="Unknown color space"):
+        diverging("med", "phil", space="hsv")
+    with pytest.raises(ValueError, match="at least 2"):
+        diverging("med", "phil", n=1)
+
+
+def test_diverging_register() -> None:
+    try:
+        cmap = diverging("med-dark", "wiso-dark", register=True, name="test_div")
+        assert matplotlib.colormaps["test_div"].colors.tolist() == cmap.colors.tolist()
+        # Registering the same colormap again is a no-op, a different one with the same name fails
+        diverging("med-dark", "wiso-dark", register=True, name="test_div")
+        with pytest.raises(ValueError, match="already"):
+            diverging("med-dark", "phil", register=True, name="test_div")
+    finally:
+        matplotlib.colormaps.unregister("test_div")
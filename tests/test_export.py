@@ -0,0 +1,70 @@
+import json
+import struct
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pytest
+
+from fau_colors import export, export_as_gpl, export_as_tex, v2021, v2024
+
+HERE = Path(__file__).parent
+PALETTE_FOLDER = HERE.parent / "color_palettes"
+
+
+@pytest.mark.parametrize("version", ["2019", "2021", "2024"])
+def test_shipped_files_are_up_to_date(version: str) -> None:
+    for path in PALETTE_FOLDER.glob(f"fau_colors_{version}*.*"):
+        stem, file_format = path.stem, path.suffix[1:]
+        palette = (
+            export._STYLE_VARIANTS[stem.removeprefix(f"fau_colors_{version}")] if file_format == "mplstyle" else None
+        )
+        assert path.read_bytes() == export._render(version, file_format, stem, palette), path.name
+
+
+@pytest.mark.parametrize(("module", "version"), [(v2021, "2021"), (v2024, "2024")])
+def test_legacy_exports_are_identical(tmp_path: Path, module: object, version: str) -> None:
+    export_as_gpl(module.cmaps, file_name=f"fau_colors_{version}.gpl", folder_path=tmp_path)
+    export_as_tex(module.cmaps_with_names, file_name=f"fau_colors_{version}.tex", folder_path=tmp_path)
+
+    assert (tmp_path / f"fau_colors_{version}.gpl").read_bytes() == export.render(version, "gpl")
+    assert (tmp_path / f"fau_colors_{version}.tex").read_bytes() == export.render(version, "tex")
+
+
+def test_export_skips_unchanged_files(tmp_path: Path) -> None:
+    results = export.export_palettes(tmp_path, versions=[2024], formats=["css", "mplstyle"])
+
+    assert [r.path.name for r in results] == [
+        "fau_colors_2024.css",
+        "fau_colors_2024.mplstyle",
+        "fau_colors_2024_dark.mplstyle",
+        "fau_colors_2024_light.mplstyle",
+        "fau_colors_2024_all.mplstyle",
+    ]
+    assert all(r.written for r in results)
+
+    (tmp_path / "fau_colors_2024.css").write_text("outdated")
+    results = export.export_palettes(tmp_path, versions=[2024], formats=["css", "mplstyle"])
+    assert [r.written for r in results] == [True, False, False, False, False]
+
+    with pytest.raises(ValueError, match="Unknown formats"):
+        export.export_palettes(tmp_path, formats=["pdf"])
+
+
+def test_formats_contain_colors(tmp_path: Path) -> None:
+    table = export.export_table("2024")
+    n_named = len(table.named)
+
+    content = json.loads(export.render("2024", "json"))
+    assert content["colors"]["fau-med"]["hex"] == v2024.colors.med
+    assert content["palettes"]["faculties"] == list(v2024.cmaps.faculties)
+    assert f"--fau-med: {v2024.colors.med};" in export.render("2024", "css").decode()
+    assert f"$fau-wiso-dark: {v2024.colors_dark.wiso};" in export.render("2024", "scss").decode()
+
+    ase = export.render("2024", "ase")
+    assert ase[:4] == b"ASEF"
+    assert struct.unpack(">HHI", ase[4:12]) == (1, 0, n_named)
+
+    style = tmp_path / "dark.mplstyle"
+    style.write_bytes(export.render("2024", "mplstyle", palette="faculties_dark"))
+    with plt.style.context(style):
+        assert plt.rcParams["axes.prop_cycle"].by_key()["color"] == list(v2024.colors_dark)
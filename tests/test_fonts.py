@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import matplotlib
+import pytest
+from matplotlib import font_manager
+
+from fau_colors import fonts
+
+
+@pytest.fixture
+def font_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    font_dir = tmp_path / "fonts"
+    (font_dir / "truetype" / "fau").mkdir(parents=True)
+    (font_dir / "truetype" / "fau" / "FAUSansOffice-Regular.ttf").write_bytes(b"")
+    (font_dir / "truetype" / "other.ttf").write_bytes(b"")
+    monkeypatch.setattr(fonts, "_system_font_dirs", lambda: [font_dir, tmp_path / "does_not_exist"])
+    monkeypatch.setattr(fonts, "_cache_file", lambda: tmp_path / "cache" / "fonts.json")
+    monkeypatch.setattr(fonts, "_REGISTERED_FONT_PATHS", set())
+    monkeypatch.delenv(fonts.FONT_PATHS_ENV_VAR, raising=False)
+    return font_dir
+
+
+@pytest.fixture
+def fake_font_manager(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    added: list[Path] = []
+    monkeypatch.setattr(font_manager.fontManager, "addfont", added.append)
+    monkeypatch.setattr(
+        font_manager.fontManager, "get_font_names", lambda: {"DejaVu Sans", *(["FAUSans Office"] if added else [])}
+    )
+    return added
+
+
+def test_discovered_fonts_are_cached_on_disk(font_tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = [font_tree / "truetype" / "fau" / "FAUSansOffice-Regular.ttf"]
+    assert fonts._discover_font_paths() == expected
+
+    def _fail(*_: object) -> None:
+        raise AssertionError("font directories should not be scanned again")
+
+    monkeypatch.setattr(fonts, "_scan_font_dirs", _fail)
+    assert fonts._discover_font_paths() == expected
+
+
+def test_font_cache_is_invalidated_by_directory_changes(font_tree: Path) -> None:
+    assert len(fonts._discover_font_paths()) == 1
+
+    (font_tree / "truetype" / "FAUSansOffice-Bold.ttf").write_bytes(b"")
+
+    assert len(fonts._discover_font_paths()) == 2
+
+
+def test_font_cache_is_invalidated_by_nested_directory_changes(font_tree: Path) -> None:
+    assert len(fonts._discover_font_paths()) == 1
+
+    # Two levels below the font directory, whose own mtime does not change
+    (font_tree / "truetype" / "fau" / "FAUSansOffice-Bold.ttf").write_bytes(b"")
+
+    assert len(fonts._discover_font_paths()) == 2
+
+
+@pytest.mark.usefixtures("font_tree")
+def test_register_is_memoized_in_process(fake_font_manager: list[Path], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(matplotlib, "rcParams", matplotlib.RcParams(matplotlib.rcParams))
+    fonts.register_fausans_font()
+    assert len(fake_font_manager) == 1
+    assert matplotlib.rcParams["font.sans-serif"] == ["FAUSans Office"]
+
+    monkeypatch.setattr(fonts, "_discover_font_paths", lambda **_: pytest.fail("should not scan again"))
+    fonts.register_fausans_font()
+    assert len(fake_font_manager) == 1
+
+
+def test_explicit_font_paths_skip_the_scan(
+    font_tree: Path, fake_font_manager: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(matplotlib, "rcParams", matplotlib.RcParams(matplotlib.rcParams))
+    monkeypatch.setattr(fonts, "_discover_font_paths", lambda **_: pytest.fail("should not scan"))
+    monkeypatch.setenv(fonts.FONT_PATHS_ENV_VAR, str(font_tree / "truetype" / "fau"))
+
+    fonts.register_fausans_font()
+
+    assert fake_font_manager == [font_tree / "truetype" / "fau" / "FAUSansOffice-Regular.ttf"]
+
+
+@pytest.mark.usefixtures("font_tree", "fake_font_manager")
+def test_missing_font_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        fonts.register_fausans_font(font_paths=[])
@@ -0,0 +1,54 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules_after(code: str) -> set[str]:
+    script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import fau_colors; fau_colors.colors.fau",
+        "from fau_colors import colors_all, colors_dark",
+        "from fau_colors.v2021 import colors_all",
+        "from fau_colors.v2019 import colors",
+        "from fau_colors import conversions; conversions.convert_palette('faculties', 'cmyk')",
+    ],
+)
+def test_raw_colors_do_not_import_plotting_stack(code: str) -> None:
+    modules = _imported_modules_after(code)
+
+    assert "seaborn" not in modules
+    assert "matplotlib" not in modules
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import fau_colors; fau_colors.cmaps.med",
+        "from fau_colors.v2021 import cmaps_with_names",
+        "from fau_colors.v2019 import cmaps",
+    ],
+)
+def test_cmaps_do_not_import_seaborn(code: str) -> None:
+    # The cmaps are created from the precomputed colors, seaborn is only needed for `Palette.as_seaborn`
+    modules = _imported_modules_after(code)
+
+    assert "seaborn" not in modules
+    assert "matplotlib" not in modules
+
+
+@pytest.mark.parametrize("module_name", ["fau_colors", "fau_colors.v2019", "fau_colors.v2021", "fau_colors.v2024"])
+def test_lazy_attributes_are_listed_and_cached(module_name: str) -> None:
+    module = importlib.import_module(module_name)
+
+    assert "cmaps" in dir(module)
+    assert module.cmaps is module.cmaps
+    with pytest.raises(AttributeError):
+        module.does_not_exist  # noqa: B018
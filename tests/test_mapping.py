@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+from PIL import Image
+
+from fau_colors import map_values, mapping, v2019, v2021, v2024
+
+
+@pytest.mark.parametrize(
+    ("module", "cmap", "name"),
+    [
+        (v2024, "fau-med", "med"),
+        (v2024, "med_dark", "med_dark"),
+        (v2021, "fau-nat-light", "nat_light"),
+        (v2019, "fau", "fau"),
+    ],
+)
+def test_continuous_mapping_matches_matplotlib(module: object, cmap: str, name: str) -> None:
+    rng = np.random.default_rng(42)
+    values = rng.normal(size=(100, 37))
+    values[0, :5] = np.nan
+    values[1, 0] = 3.0
+    values[1, 1] = -1.0
+    version = module.__name__[-4:]
+
+    expected = matplotlib.colors.ListedColormap(getattr(module.cmaps, name))(
+        matplotlib.colors.Normalize(-1.0, 3.0)(values), bytes=True
+    )
+    expected[np.isnan(values)] = 0
+
+    np.testing.assert_array_equal(map_values(values, cmap, vmin=-1.0, vmax=3.0, version=version), expected)
+
+
+def test_float_output_and_out_buffer() -> None:
+    values = np.linspace(0, 1, 11)
+    out = np.empty((11, 4), dtype=np.float32)
+
+    result = map_values(values, "med", out=out, dtype=np.float32)
+
+    assert result is out
+    expected = matplotlib.colors.ListedColormap(v2024.cmaps.med)(values)
+    np.testing.assert_allclose(out, expected, atol=1e-7)
+
+
+def test_out_buffer_is_validated() -> None:
+    with pytest.raises(ValueError, match="must have shape"):
+        map_values(np.zeros(3), out=np.empty((3, 3), dtype=np.uint8))
+
+
+def test_categorical_mapping_by_code_and_name() -> None:
+    faculties = matplotlib.colors.to_rgba_array(v2024.cmaps.faculties_all)
+    codes = np.array([[0, 1], [12, 3]])
+
+    np.testing.assert_allclose(map_values(codes, "faculties_all", dtype=float, categorical=True), faculties[codes])
+    np.testing.assert_allclose(
+        map_values(np.array(["med", "fau-wiso-dark", "black"]), "faculties_all", dtype=float),
+        matplotlib.colors.to_rgba_array([v2024.colors.med, v2024.colors_dark.wiso, "#000000"]),
+    )
+    np.testing.assert_allclose(
+        map_values(["fau-med-dark"], "faculties_all", version="2021", dtype=float),
+        matplotlib.colors.to_rgba_array([v2021.colors_dark.med]),
+    )
+
+
+def test_integer_rasters_are_continuous(tmp_path: Path) -> None:
+    raster = np.array([[0, 250], [500, 1000]], dtype=np.uint16)
+
+    rgba = map_values(raster, "med_cont")
+
+    np.testing.assert_array_equal(rgba, map_values(raster / 1000, "med_cont", vmin=0, vmax=1))
+    tiled = mapping.map_to_memmap(raster, tmp_path / "raster.npy", "med_cont", tile_shape=(1, 1))
+    np.testing.assert_array_equal(tiled, rgba)
+
+
+def test_categorical_mapping_rejects_unknown_categories() -> None:
+    with pytest.raises(ValueError, match="range"):
+        map_values(np.array([6]), "faculties", categorical=True)
+    with pytest.raises(ValueError, match="Unknown category"):
+        map_values(np.array(["not_a_faculty"]), "faculties")
+    with pytest.raises(ValueError, match="Unknown palette"):
+        map_values(np.zeros(3), "not_a_palette")
+
+
+def test_tiled_mapping_matches_map_values(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    values = np.lib.format.open_memmap(tmp_path / "values.npy", mode="w+", dtype=np.float32, shape=(300, 250))
+    values[:] = rng.normal(size=values.shape)
+    values[5, 7] = np.nan
+    expected = map_values(np.asarray(values), "med_dark")
+
+    tiles = list(mapping.iter_tiles(values, "med_dark", tile_shape=(128, 100)))
+    assert len(tiles) == 9
+    assert max(rgba.nbytes for _, rgba in tiles) <= 128 * 100 * 4
+
+    out = mapping.map_to_memmap(values, tmp_path / "rgba.npy", "med_dark", tile_shape=(128, 100))
+    np.testing.assert_array_equal(out, expected)
+    np.testing.assert_array_equal(np.load(tmp_path / "rgba.npy"), expected)
+
+    paths = mapping.map_to_tiles(values, tmp_path / "tiles", "med_dark", tile_shape=(128, 100))
+    assert len(paths) == 9
+    with Image.open(tmp_path / "tiles" / "2_1.png") as tile:
+        np.testing.assert_array_equal(np.asarray(tile), expected[256:, 100:200])
+
+
+def test_tiled_mapping_validates_input(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="must be 2D"):
+        mapping.map_to_tiles(np.zeros(10), tmp_path)
+    with pytest.raises(ValueError, match="`out` must have shape"):
+        mapping.map_to_memmap(np.zeros((2, 2)), np.zeros((2, 2, 4)))
+    with pytest.raises(ValueError, match="`tile_shape`"):
+        list(mapping.iter_tiles(np.zeros(10), tile_shape=(2, 2)))
+    with pytest.raises(TypeError, match="dask array"):
+        mapping.map_values_lazy(np.zeros(10))
+
+
+def test_lazy_mapping_with_dask() -> None:
+    da = pytest.importorskip("dask.array")
+    values = np.random.default_rng(0).normal(size=(100, 80))
+
+    rgba = mapping.map_values_lazy(da.from_array(values, chunks=(30, 30)), "fau-med", dtype=np.float32)
+
+    assert rgba.chunks[:2] == ((30, 30, 30, 10), (30, 30, 20))
+    np.testing.assert_array_equal(rgba.compute(), map_values(values, "fau-med", dtype=np.float32))
+
+
+def test_lazy_mapping_of_integer_raster() -> None:
+    da = pytest.importorskip("dask.array")
+    raster = np.arange(2000, dtype=np.uint16).reshape(40, 50)
+
+    rgba = mapping.map_values_lazy(da.from_array(raster, chunks=(20, 20)), "med_cont")
+
+    np.testing.assert_array_equal(rgba.compute(), map_values(raster, "med_cont"))
+
+
+def test_lazy_mapping_with_xarray() -> None:
+    xr = pytest.importorskip("xarray")
+    values = xr.DataArray(np.arange(6).reshape(2, 3), dims=("y", "x"))
+
+    rgba = mapping.map_values_lazy(values, "faculties")
+
+    assert rgba.dims == ("y", "x", "rgba")
+    np.testing.assert_array_equal(rgba.values, map_values(values.values, "faculties"))
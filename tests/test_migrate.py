@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from fau_colors import data, migrate, v2021, v2024
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> Path:
+    (tmp_path / "figure.svg").write_text(
+        f'<svg><rect fill="{v2021.colors.med.lower()}" stroke="rgb(200, 16, 46)"/><rect fill="#123456"/></svg>\n'
+    )
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "colors.tex").write_text(
+        "\\definecolor{a}{HTML}{00A3E0}\n\\definecolor{b}{rgb}{0.0, 0.1843137254901961, 0.4235294117647059}\n"
+    )
+    (tmp_path / "style.mplstyle").write_text(
+        "axes.prop_cycle: cycler('color', ['002F6C', '779FB5'])\nagg.path.chunksize: 100000\n"
+    )
+    (tmp_path / "unchanged.svg").write_text("<svg/>\n")
+    return tmp_path
+
+
+def test_translation_table() -> None:
+    table = migrate.translation_table("2021", "2024")
+
+    # By name
+    assert table[v2021.colors.med] == v2024.colors.med
+    assert table[v2021.colors_dark.wiso] == v2024.colors_dark.wiso
+    # By distance (the light ramps do not exist in 2024)
+    assert table[data.PALETTES_HEX["2021"]["med_light"][2]] in data.PALETTES_HEX["2024"]["med"]
+    assert len(table) == len({r.hex for r in migrate.get_registry().select("2021")})
+
+
+def test_dry_run(files: Path) -> None:
+    before = {p: p.read_text() for p in files.rglob("*.*")}
+
+    results = {Path(r.path).name: r for r in migrate.migrate([files], dry_run=True, max_workers=0)}
+
+    assert {p: p.read_text() for p in files.rglob("*.*")} == before
+    assert results["figure.svg"].n_replacements == 2
+    assert f'+<svg><rect fill="{v2024.colors.med.lower()}" stroke="rgb(197, 15, 60)"/>' in results["figure.svg"].diff
+    assert not results["unchanged.svg"].changed
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_migrate_files(files: Path, max_workers: int) -> None:
+    results = list(migrate.migrate([files], max_workers=max_workers))
+
+    assert sum(r.changed for r in results) == 3
+    assert "#123456" in (files / "figure.svg").read_text()
+    assert (files / "sub" / "colors.tex").read_text() == (
+        "\\definecolor{a}{HTML}{18B4F1}\n"
+        "\\definecolor{b}{rgb}{0.01568627450980392, 0.19215686274509805, 0.41568627450980394}\n"
+    )
+    assert (files / "style.mplstyle").read_text() == (
+        "axes.prop_cycle: cycler('color', ['04316A', '8C9FB1'])\nagg.path.chunksize: 100000\n"
+    )
+
+
+def test_identity_mappings_are_not_counted(files: Path) -> None:
+    results = list(migrate.migrate([files], source="2021", target="2021", dry_run=True, max_workers=0))
+
+    assert not any(r.changed for r in results)
+    assert sum(r.n_replacements for r in results) == 0
+
+
+def test_mplstyle_bare_hex_only_in_color_values() -> None:
+    style = f"axes.facecolor: {v2021.colors.fau[1:]}  # comment\nagg.path.chunksize: 100000\n"
+    rewriter = migrate._Rewriter({"#100000": v2024.colors.fau, v2021.colors.fau: v2024.colors.fau})
+
+    new_text = migrate._PATTERNS[".mplstyle"].sub(rewriter, style)
+
+    assert new_text == f"axes.facecolor: {v2024.colors.fau[1:]}  # comment\nagg.path.chunksize: 100000\n"
+    assert rewriter.n_replacements == 1
+
+
+def test_state_file_skips_unchanged_files(files: Path) -> None:
+    state_file = files / "state.json"
+    list(migrate.migrate([files], state_file=state_file, max_workers=0))
+
+    (files / "unchanged.svg").write_text(f'<svg fill="{v2021.colors.fau}"/>\n')
+    results = {Path(r.path).name: r for r in migrate.migrate([files], state_file=state_file, max_workers=0)}
+
+    assert [name for name, r in results.items() if not r.skipped] == ["unchanged.svg"]
+    assert results["unchanged.svg"].changed
+
+
+def test_cli(files: Path, capsys: pytest.CaptureFixture) -> None:
+    assert migrate.main([str(files), "--dry-run", "--workers", "0"]) == 0
+    captured = capsys.readouterr()
+    assert "+axes.prop_cycle" in captured.out
+    assert "Would change 3 file(s)" in captured.err
@@ -0,0 +1,101 @@
+import pickle
+
+import numpy as np
+import pytest
+import seaborn as sns
+from matplotlib.colors import ListedColormap, to_rgba_array
+
+from fau_colors import Palette, cmaps, get_palettes, v2019, v2021, v2024
+
+
+@pytest.mark.parametrize("module", [v2019, v2021, v2024])
+def test_cmaps_match_definitions(module: object) -> None:
+    definitions = module._define_cmaps()
+
+    assert module.cmaps._fields == definitions._fields
+    for palette, colors in zip(module.cmaps, definitions):
+        assert isinstance(palette, Palette)
+        # The same items as the lists `cmaps` contained before (hex strings or float tuples)
+        assert list(palette) == colors
+        assert palette == colors
+        np.testing.assert_array_equal(np.asarray(palette), to_rgba_array(colors)[:, :3])
+        np.testing.assert_array_equal(palette.rgb_uint8, np.round(to_rgba_array(colors)[:, :3] * 255))
+        assert len(palette.names) == len(palette)
+
+
+@pytest.mark.parametrize("module", [v2021, v2024])
+def test_cmaps_with_names_share_cmaps(module: object) -> None:
+    for (names, palette), (name, cmap) in zip(module.cmaps_with_names, module.cmaps._asdict().items()):
+        assert palette is cmap
+        assert names == module._define_cmaps_with_names()._asdict()[name][0]
+
+
+def test_cmaps_share_memory() -> None:
+    assert cmaps is v2024.cmaps
+    assert get_palettes(2024) is cmaps
+    assert cmaps.faculties.rgb.dtype == np.float64
+    assert not cmaps.faculties.rgb.flags.writeable
+    # "faculties" and "faculties_dark" are strided views of "faculties_all"
+    assert np.shares_memory(cmaps.faculties.rgb, cmaps.faculties_all.rgb)
+    assert np.shares_memory(cmaps.faculties_dark.rgb_uint8, cmaps.faculties_all.rgb_uint8)
+    assert cmaps.faculties.names == tuple(v2024.colors._fields)
+    assert cmaps.faculties_625.names[3] == "med_625"
+    assert cmaps.med.names[0] is cmaps.faculties.names[3]
+
+
+def test_palette_access() -> None:
+    med = cmaps.med_dark
+
+    assert med[0] == med["med_dark"] == v2024.colors_dark.med
+    assert list(med)[1] == med[1] == med.hex[1]
+    assert v2021.cmaps.med[0] == tuple(v2021.cmaps.med.rgb[0].tolist())
+    view = med[1:4]
+    assert isinstance(view, Palette)
+    assert view.hex == med.hex[1:4]
+    assert view == list(med)[1:4]
+    assert np.shares_memory(view.rgb, med.rgb)
+    assert med.index(med[2]) == 2
+    with pytest.raises(KeyError):
+        med["med"]
+
+
+def test_palette_conversions() -> None:
+    cmap = cmaps.faculties.as_cmap()
+
+    assert isinstance(cmap, ListedColormap)
+    assert cmap is cmaps.faculties.as_cmap()
+    assert cmap.colors == list(v2024.cmaps.faculties)
+    assert cmaps.faculties.as_seaborn().as_hex() == [c.lower() for c in v2024.colors]
+    assert v2019.cmaps.faculties.as_hex() == list(v2019.colors)
+    assert sns.color_palette(cmaps.med) == sns.color_palette(list(cmaps.med))
+    assert np.asarray(cmaps.faculties, dtype=np.float32).dtype == np.float32
+
+
+def test_palette_as_seaborn_context() -> None:
+    with cmaps.med_dark as palette:
+        assert palette.as_hex() == cmaps.med_dark.as_hex()
+        assert sns.color_palette().as_hex() == cmaps.med_dark.as_hex()
+
+
+def test_palette_array_copy() -> None:
+    faculties = cmaps.faculties
+
+    assert np.asarray(faculties) is faculties.rgb
+    copied = faculties.__array__(copy=True)
+    assert not np.shares_memory(copied, faculties.rgb)
+    assert copied.flags.writeable
+    assert faculties.__array__(np.float64, copy=False) is faculties.rgb
+    assert faculties.__array__(np.float32).dtype == np.float32
+    with pytest.raises(ValueError, match="requires a copy"):
+        faculties.__array__(np.float32, copy=False)
+
+
+def test_palette_pickle() -> None:
+    view = v2021.cmaps.faculties_all[::-2]
+    data = pickle.dumps(view)
+
+    assert len(data) < 200
+    restored = pickle.loads(data)
+    assert restored.hex == view.hex
+    assert restored == view
+    assert pickle.loads(pickle.dumps(v2021.cmaps.med)) is v2021.cmaps.med
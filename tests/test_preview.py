@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from fau_colors import preview, v2024
+from fau_colors.data import PALETTES_RGB_UINT8
+
+
+def test_render_strips() -> None:
+    image = preview.render_strips("2024", ["faculties", "fau-dark"], size=(200, 300))
+
+    assert image.shape == (300, 200, 4)
+    assert image.dtype == np.uint8
+    assert (image[..., 3] == 255).all()
+    # The first color is at the bottom, the last one at the top of the strip
+    faculties = PALETTES_RGB_UINT8["2024"]["faculties"]
+    assert tuple(image[-11, 12, :3]) == faculties[0]
+    colors = {tuple(c) for c in image[:, 12, :3]}
+    assert set(faculties) <= colors
+    assert set(PALETTES_RGB_UINT8["2024"]["fau_dark"]) <= {tuple(c) for c in image[:, 150, :3]}
+
+    with pytest.raises(ValueError, match="too small"):
+        preview.render_strips("2024", size=(200, 50))
+
+
+def test_render_swatches() -> None:
+    image = preview.render_swatches("2024", columns=4, swatch_size=(100, 50))
+
+    assert image.shape == (4 + 4 * 54, 4 + 4 * 104, 4)
+    # Top right corner of the first swatch is not covered by text
+    assert tuple(image[5, 100, :3]) == tuple(int(v2024.colors.fau[i : i + 2], 16) for i in (1, 3, 5))
+    # The labels on dark colors are white
+    assert (image[4:54, 4:104, :3] == 255).all(axis=-1).any()
+    assert preview.render_swatches("2024", "faculties_625").shape[0] > 0
+
+
+def test_png(tmp_path: Path) -> None:
+    image = preview.render_swatches("2019", "med")
+    path = preview.save_png(image, tmp_path / "med.png")
+
+    with Image.open(path) as png:
+        np.testing.assert_array_equal(np.asarray(png), image)
+    assert preview.to_png(image) == path.read_bytes()
+
+
+def test_render_overviews(tmp_path: Path) -> None:
+    paths = {"2019": tmp_path / "cms_19.png", 2021: tmp_path / "cms_21.png"}
+
+    written = preview.render_overviews(paths, max_workers=0)
+
+    assert sorted(written) == sorted(paths.values())
+    with Image.open(paths["2019"]) as png:
+        assert png.size == (1000, 500)
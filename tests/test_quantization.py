@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from fau_colors import _colorspace, data, quantize
+
+
+def _brute_force_nearest(image: np.ndarray, palette: np.ndarray, space: str) -> np.ndarray:
+    def _convert(rgb: np.ndarray) -> np.ndarray:
+        if space == "srgb":
+            return rgb
+        linear = _colorspace.srgb_to_linear(rgb)
+        return linear if space == "linear" else _colorspace.linear_to_oklab(linear)
+
+    pixels = _convert(image.reshape(-1, 3) / 255)
+    dist = np.linalg.norm(pixels[:, None, :] - _convert(palette)[None, :, :], axis=-1)
+    return dist.argmin(axis=1).reshape(image.shape[:-1])
+
+
+@pytest.mark.parametrize("space", ["srgb", "linear", "oklab"])
+def test_quantize_matches_brute_force(space: str) -> None:
+    image = np.random.default_rng(1).integers(0, 256, size=(64, 48, 3), dtype=np.uint8)
+    palette = np.array(data.PALETTES_RGB["2024"]["faculties_all"])
+
+    quantized, indices = quantize(image, "faculties_all", space=space, n_jobs=2)
+
+    expected = _brute_force_nearest(image, palette, space)
+    # Only allow differences for (numerically) equidistant colors
+    assert np.mean(indices == expected) > 0.999
+    assert indices.dtype == np.uint8
+    np.testing.assert_array_equal(quantized, np.array(data.PALETTES_RGB_UINT8["2024"]["faculties_all"])[indices])
+
+
+def test_quantize_keeps_palette_colors_and_alpha() -> None:
+    palette = np.array(data.PALETTES_RGB["2021"]["faculties"])
+    image = np.concatenate([palette, np.full((len(palette), 1), 0.5)], axis=1)[None]
+
+    quantized, indices = quantize(image, "faculties", version="2021")
+
+    np.testing.assert_array_equal(indices[0], np.arange(len(palette)))
+    np.testing.assert_allclose(quantized, image)
+
+
+def test_quantize_with_lookup_cube_and_custom_palette() -> None:
+    image = np.random.default_rng(2).integers(0, 256, size=(100, 100, 3), dtype=np.uint8)
+    palette = ["#04316A", "#FFFFFF", "#C50F3C"]
+
+    _, exact = quantize(image, palette)
+    _, approx = quantize(image, palette, lut_bits=6)
+
+    assert np.mean(exact == approx) > 0.97
+
+
+def test_quantize_validates_input() -> None:
+    with pytest.raises(ValueError, match="color channels"):
+        quantize(np.zeros((2, 2)))
+    with pytest.raises(ValueError, match="lut_bits"):
+        quantize(np.zeros((2, 2, 3)), lut_bits=6)
+    with pytest.raises(ValueError, match="color space"):
+        quantize(np.zeros((2, 2, 3)), space="hsv")
@@ -1,9 +1,10 @@
+import threading
 from collections import namedtuple
 from contextlib import suppress
 
 import pytest
 
-from fau_colors import _utils, v2021
+from fau_colors import _utils, register_all, registered_cmaps, unregister_all, v2021
 from fau_colors import register_cmaps as register_2024
 from fau_colors import unregister_cmaps as unregister_2024
 
@@ -59,3 +60,155 @@ def test_register_falls_back_to_legacy_matplotlib_cm_api(monkeypatch: pytest.Mon
 
     assert called["name"] == "demo"
     assert called["cmap_type"] == "ListedColormap"
+
+
+def test_repeated_register_uses_fingerprint_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    _cleanup_2024()
+    register_2024()
+
+    def _fail(*_: object, **__: object) -> None:
+        raise AssertionError("colormaps should not be compared or registered again")
+
+    try:
+        monkeypatch.setattr(_utils, "_is_same_colormap", _fail)
+        monkeypatch.setattr(_utils, "_register_colormap", _fail)
+        register_2024()
+    finally:
+        monkeypatch.undo()
+        _cleanup_2024()
+
+
+def test_fast_path_only_looks_up_own_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    _cleanup_2024()
+    register_2024()
+
+    def _fail(*_: object) -> None:
+        raise AssertionError("the names of all registered colormaps should not be collected")
+
+    try:
+        monkeypatch.setattr(type(_utils.matplotlib.colormaps), "__iter__", _fail)
+        register_2024()
+        # Colormaps unregistered directly with matplotlib are still noticed
+        _utils.matplotlib.colormaps.unregister("med_dark")
+        register_2024()
+        assert "med_dark" in _utils.matplotlib.colormaps
+    finally:
+        monkeypatch.undo()
+        _cleanup_2024()
+
+
+def test_register_after_unregister_registers_again() -> None:
+    _cleanup_2024()
+    register_2024()
+    unregister_2024()
+
+    try:
+        register_2024()
+        assert "med_dark" in _utils.matplotlib.colormaps
+    finally:
+        _cleanup_2024()
+
+
+def test_is_same_colormap_compares_all_channels() -> None:
+    LegacyCmaps = namedtuple("LegacyCmaps", ["fau_test_cmap"])
+    register = _utils.get_register_func(LegacyCmaps(fau_test_cmap=["#000000", "#04316A"]))
+    unregister = _utils.get_unregister_func(LegacyCmaps(fau_test_cmap=[]))
+    register()
+
+    try:
+        assert _utils._is_same_colormap("fau_test_cmap", ["#000000", "#04316A"])
+        assert not _utils._is_same_colormap("fau_test_cmap", ["#000000", "#04316B"])
+        assert not _utils._is_same_colormap("fau_test_cmap", ["#000000"])
+    finally:
+        unregister()
+
+
+def test_registered_cmaps_is_reference_counted() -> None:
+    _cleanup_2024()
+
+    with registered_cmaps("2024"):
+        assert "med" in _utils.matplotlib.colormaps
+        with registered_cmaps(2024):
+            assert "med" in _utils.matplotlib.colormaps
+        assert "med" in _utils.matplotlib.colormaps
+    assert "med" not in _utils.matplotlib.colormaps
+
+
+def test_registered_cmaps_keeps_existing_registration() -> None:
+    _cleanup_2024()
+    register_2024()
+
+    try:
+        with registered_cmaps():
+            pass
+        assert "med" in _utils.matplotlib.colormaps
+    finally:
+        _cleanup_2024()
+
+
+def test_registered_cmaps_conflicting_version_is_not_counted() -> None:
+    _cleanup_2021()
+    _cleanup_2024()
+
+    with registered_cmaps("2024"):
+        with pytest.raises(ValueError, match="already registered"), registered_cmaps("2021"):
+            pass
+        assert _utils._CONTEXT_COUNTS.get("2021", 0) == 0
+    _cleanup_2021()
+
+
+def test_registered_cmaps_concurrent_threads() -> None:
+    _cleanup_2024()
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    errors: list[BaseException] = []
+
+    def _worker() -> None:
+        try:
+            for i in range(20):
+                with registered_cmaps():
+                    if i == 0:
+                        barrier.wait(timeout=10)
+                    assert _utils.matplotlib.colormaps["med_dark"].N == 5
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=_worker) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert "med_dark" not in _utils.matplotlib.colormaps
+
+
+def test_register_all() -> None:
+    _cleanup_2021()
+    _cleanup_2024()
+    try:
+        register_all(default="2024")
+        colormaps = _utils.matplotlib.colormaps
+        for version in ("2019", "2021", "2024"):
+            assert f"fau{version}.faculties" in colormaps
+        assert "fau2024.fau_cont" in colormaps
+        assert colormaps["fau2021.med_dark"].colors == v2021.cmaps.med_dark
+        assert colormaps["med_dark"].colors == colormaps["fau2024.med_dark"].colors
+
+        # Everything is already registered
+        register_all(default="2024")
+    finally:
+        unregister_all(default="2024")
+    assert not any(name.startswith(("fau2019.", "fau2021.", "fau2024.")) for name in _utils.matplotlib.colormaps)
+    assert "med_dark" not in _utils.matplotlib.colormaps
+
+
+def test_register_all_without_default() -> None:
+    _cleanup_2024()
+    try:
+        register_all(default=None)
+        assert _utils.namespaced_cmap_name("med", 2021) in _utils.matplotlib.colormaps
+        assert "med" not in _utils.matplotlib.colormaps
+    finally:
+        # The unprefixed names are not registered, which must not fail
+        unregister_all()
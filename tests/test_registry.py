@@ -0,0 +1,56 @@
+import pytest
+
+from fau_colors import data, get_registry, v2021, v2024
+from fau_colors._versions import palette_color_names
+
+
+def test_lookup_by_name() -> None:
+    registry = get_registry()
+
+    record = registry.get("fau-wiso-dark-250")
+    assert record == registry.get("wiso_dark_250", version="v2024")
+    assert record == registry.get("wiso-dark-250", version=2024)
+    assert (record.version, record.faculty, record.variant, record.level) == ("2024", "wiso", "dark", 0.25)
+    assert record.hex == v2024.colors_with_light_levels["wiso-dark"][3]
+    assert record.rgb_uint8 == data.PALETTES_RGB_UINT8["2024"]["wiso_dark"][3]
+
+    assert registry.get("fau-fau-dark").hex == v2024.colors_dark.fau
+    assert registry.get("med_light", version="2021").hex == v2021.colors_light.med
+    # In 2024, the "light" colors of `cmaps_with_names` are the 62.5% levels
+    assert registry.get("fau-med-light").name == "med_625"
+    with pytest.raises(ValueError, match="Unknown color"):
+        registry.get("med_light", version="2019")
+
+
+def test_lookup_by_hex() -> None:
+    records = get_registry().by_hex("#971b2f")
+
+    assert [(r.version, r.name) for r in records] == [("2021", "wiso_dark"), ("2024", "wiso_dark")]
+    assert get_registry().by_hex("#123456") == ()
+
+
+def test_select() -> None:
+    registry = get_registry()
+
+    assert {r.name for r in registry.select("2024", level=1.0)} == set(v2024.colors_all._fields)
+    assert [r.name for r in registry.select(2024, faculty=None)] == [
+        "black",
+        *(f"black_{i}" for i in (625, 375, 250, 125)),
+    ]
+    assert {r.version for r in registry.select(faculty="med", variant="light")} == {"2021"}
+    assert len(registry.select()) == len(registry)
+    assert registry.select("2019", variant="dark") == ()
+
+
+@pytest.mark.parametrize("version", data.VERSIONS)
+def test_palette_color_names_match_registry(version: str) -> None:
+    registry = get_registry()
+
+    for palette, hex_colors in data.PALETTES_HEX[version].items():
+        names = palette_color_names(palette, version)
+        assert len(names) == len(hex_colors)
+        for name, hex_color in zip(names, hex_colors):
+            # The first color of the 2024 "phil_dark" ramp differs slightly from the base color
+            if (version, palette, name) != ("2024", "phil_dark", "phil_dark"):
+                assert registry.get(name, version).hex == hex_color.upper()
+    assert palette_color_names("fau", version)[:2] == ("fau", "fau_625")
@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+import pytest
+
+from fau_colors import _style, fonts, style, style_params, v2019, v2024, write_style
+from fau_colors.data import PALETTES_HEX
+
+
+@pytest.fixture
+def no_font(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(fonts, "_add_font_files", lambda: False)
+    _style._font_available.cache_clear()
+    _style._style_params.cache_clear()
+    yield
+    _style._font_available.cache_clear()
+    _style._style_params.cache_clear()
+
+
+@pytest.mark.usefixtures("no_font")
+def test_style_is_applied_and_restored() -> None:
+    before = dict(matplotlib.rcParams)
+
+    with pytest.warns(UserWarning, match="FAUSans Office"):
+        context = style("2024", "dark")
+    with context:
+        assert plt.rcParams["axes.prop_cycle"].by_key()["color"] == list(v2024.colors_dark)
+        assert plt.rcParams["image.cmap"] == "fau2024.fau_dark_cont"
+        fig, ax = plt.subplots()
+        assert ax.imshow([[0, 1]]).get_cmap().name == "fau2024.fau_dark_cont"
+        assert ax.plot([0, 1])[0].get_color() == v2024.colors_dark.fau
+        plt.close(fig)
+
+    assert dict(matplotlib.rcParams) == before
+
+
+@pytest.mark.usefixtures("no_font")
+@pytest.mark.filterwarnings("ignore:Could not find 'FAUSans Office'")
+def test_style_switching_versions() -> None:
+    # Old and new figures in the same session
+    for version in ("2024", "2021", "2019", "2024"):
+        with style(version):
+            fig, ax = plt.subplots()
+            assert ax.plot([0, 1])[0].get_color().upper() == PALETTES_HEX[version]["faculties"][0].upper()
+            assert f"fau{version}.faculties" in matplotlib.colormaps
+            plt.close(fig)
+
+
+@pytest.mark.usefixtures("no_font")
+def test_style_params_are_cached() -> None:
+    with pytest.warns(UserWarning, match="FAUSans Office"):
+        params = style_params(2024, "light")
+
+    assert style_params("2024", "light") is params
+    assert "font.family" not in params
+    with pytest.raises(TypeError):
+        params["image.cmap"] = "viridis"
+    assert "image.cmap" not in style_params(2019, font=False)
+    with pytest.raises(ValueError, match="not available"):
+        style_params(2019, "dark")
+    with pytest.raises(ValueError, match="Unknown variant"):
+        style_params(2024, "pastel")
+
+
+def test_style_with_font(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fonts, "_add_font_files", lambda: True)
+    _style._font_available.cache_clear()
+    _style._style_params.cache_clear()
+    try:
+        params = style_params(2021)
+    finally:
+        _style._font_available.cache_clear()
+        _style._style_params.cache_clear()
+
+    assert params["font.sans-serif"] == ["FAUSans Office"]
+
+
+def test_write_style(tmp_path: Path) -> None:
+    path = write_style(tmp_path / "fau.mplstyle", 2019, font=False)
+
+    with plt.style.context(path):
+        assert plt.rcParams["axes.prop_cycle"].by_key()["color"] == [c.upper() for c in v2019.colors]
+    assert "image.cmap" not in path.read_text()
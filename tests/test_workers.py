@@ -0,0 +1,68 @@
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import partial
+
+import matplotlib
+import pytest
+
+from fau_colors import PaletteHandle, palette_handle, v2021, v2024, worker_init
+
+
+def _cmap_info(handle: PaletteHandle) -> tuple[int, bool]:
+    return handle.as_cmap().N, handle.name in matplotlib.colormaps
+
+
+def _imported_modules() -> set[str]:
+    return set(sys.modules)
+
+
+def test_palette_handle_is_small_and_picklable() -> None:
+    handle = palette_handle("fau-med-dark")
+    restored = pickle.loads(pickle.dumps(handle))
+
+    assert restored == PaletteHandle("2024", "med_dark")
+    assert len(pickle.dumps(handle)) < 100
+    assert restored.hex_colors[0] == v2024.colors_dark.med
+
+
+def test_palette_handle_resolves_cached_cmap() -> None:
+    handle = palette_handle("faculties_light", version=2021)
+    cmap = handle.as_cmap()
+
+    assert cmap is handle.as_cmap()
+    # The colormap of the palette, which `register_cmaps` registers as well
+    assert cmap is v2021.cmaps.faculties_light.as_cmap()
+    assert cmap.colors == list(v2021.cmaps.faculties_light)
+
+
+def test_palette_handle_rejects_unknown_palettes() -> None:
+    with pytest.raises(ValueError, match="Unknown palette"):
+        palette_handle("faculties_light", version=2019)
+
+
+def test_worker_init_in_spawned_process_pool() -> None:
+    context = multiprocessing.get_context("spawn")
+    initializer = partial(worker_init, version="2024", register=True, font=False)
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=initializer) as pool:
+        result = pool.submit(_cmap_info, palette_handle("med")).result(timeout=120)
+        modules = pool.submit(_imported_modules).result(timeout=120)
+
+    assert result == (5, True)
+    # The cmaps are registered from the precomputed colors, without seaborn
+    assert "seaborn" not in modules
+
+
+def test_worker_init_warns_if_font_is_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _missing_font() -> None:
+        raise FileNotFoundError("no font")
+
+    monkeypatch.setattr("fau_colors.fonts.register_fausans_font", _missing_font)
+    try:
+        with pytest.warns(UserWarning, match="no font"):
+            worker_init(version="2024", register=True, font=True)
+    finally:
+        with suppress(ValueError):
+            v2024.unregister_cmaps()